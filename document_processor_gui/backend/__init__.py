@@ -11,6 +11,7 @@ from .conversion_backend import (
     ConversionBackendType,
     HybridConversionBackend,
     BackendCapabilities,
+    BackendStatus,
     WordBackend,
     LibreOfficeBackend,
 )
@@ -26,6 +27,7 @@ __all__ = [
     "ConversionBackendType",
     "HybridConversionBackend",
     "BackendCapabilities",
+    "BackendStatus",
     "WordBackend",
     "LibreOfficeBackend",
 ]
@@ -22,6 +22,16 @@ class BackendCapabilities:
     name: str
 
 
+@dataclass
+class BackendStatus:
+    """Availability snapshot of the conversion backends."""
+    active_backend: str  # Name of the active backend, or "None"
+    word_available: bool
+    libreoffice_available: bool
+    word_capabilities: BackendCapabilities
+    libreoffice_capabilities: BackendCapabilities
+
+
 class ConversionBackend(ABC):
     """Abstract base class for conversion backends."""
 
@@ -40,6 +50,10 @@ class ConversionBackend(ABC):
         """Get backend capabilities."""
         pass
 
+    def supports_concurrent_conversion(self) -> bool:
+        """Check if several conversions may run at once from different threads."""
+        return False
+
 
 class WordBackend(ConversionBackend):
     """Microsoft Word backend using docx2pdf."""
@@ -122,6 +136,10 @@ class LibreOfficeBackend(ConversionBackend):
         self._ensure_wrapper()
         return self._wrapper.convert_to_pdf(input_path, output_path)
 
+    def supports_concurrent_conversion(self) -> bool:
+        # Each worker thread runs soffice with its own user profile
+        return True
+
     def get_capabilities(self) -> BackendCapabilities:
         return BackendCapabilities(
             platform_support=("Windows", "Darwin", "Linux"),
@@ -189,6 +207,15 @@ class HybridConversionBackend:
             return self._active_backend.get_capabilities().name
         return "None"
 
+    def supports_concurrent_conversion(self) -> bool:
+        """Check if the active and fallback backends can convert concurrently.
+
+        Word is driven through a single application instance (COM or
+        AppleScript), so batches using it must convert one file at a time.
+        """
+        backends = [b for b in (self._active_backend, self._fallback_backend) if b]
+        return bool(backends) and all(b.supports_concurrent_conversion() for b in backends)
+
     def convert(self, input_path: str, output_path: str) -> bool:
         """
         Convert document to PDF using active backend with fallback.
@@ -216,16 +243,12 @@ class HybridConversionBackend:
                 return self._fallback_backend.convert(input_path, output_path)
             raise
 
-    def get_backend_status(self) -> dict:
+    def get_backend_status(self) -> BackendStatus:
         """Get status of all backends."""
-        return {
-            "word": {
-                "available": self._word_backend.is_available(),
-                "capabilities": self._word_backend.get_capabilities().__dict__
-            },
-            "libreoffice": {
-                "available": self._libreoffice_backend.is_available(),
-                "capabilities": self._libreoffice_backend.get_capabilities().__dict__
-            },
-            "active_backend": self.get_active_backend_name(),
-        }
+        return BackendStatus(
+            active_backend=self.get_active_backend_name(),
+            word_available=self._word_backend.is_available(),
+            libreoffice_available=self._libreoffice_backend.is_available(),
+            word_capabilities=self._word_backend.get_capabilities(),
+            libreoffice_capabilities=self._libreoffice_backend.get_capabilities(),
+        )
@@ -3,9 +3,12 @@
 import subprocess
 import logging
 import tempfile
+import threading
 import shutil
+import weakref
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional
 from ..core.exceptions import ProcessingError, DependencyError, FileSystemError
 
 
@@ -17,6 +20,34 @@ class LibreOfficeWrapper:
         self.soffice_path = soffice_path
         if not self.soffice_path:
             self.soffice_path = self._find_libreoffice()
+        # soffice refuses to run twice on one user profile, so concurrent
+        # conversions each borrow a private profile from this pool; profiles
+        # are reused across batches and removed with the wrapper
+        self._profile_lock = threading.Lock()
+        self._idle_profiles: List[str] = []
+        self._profile_dirs: List[str] = []
+        weakref.finalize(self, self._remove_profiles, self._profile_dirs)
+
+    @contextmanager
+    def _user_profile(self) -> Iterator[str]:
+        """Borrow a LibreOffice user profile, yielding its URI."""
+        with self._profile_lock:
+            if self._idle_profiles:
+                profile_dir = self._idle_profiles.pop()
+            else:
+                profile_dir = tempfile.mkdtemp(prefix="lo_profile_")
+                self._profile_dirs.append(profile_dir)
+        try:
+            yield Path(profile_dir).as_uri()
+        finally:
+            with self._profile_lock:
+                self._idle_profiles.append(profile_dir)
+
+    @staticmethod
+    def _remove_profiles(profile_dirs):
+        """Delete the per-thread profile directories."""
+        for profile_dir in profile_dirs:
+            shutil.rmtree(profile_dir, ignore_errors=True)
 
     def _find_libreoffice(self) -> Optional[str]:
         """Find LibreOffice executable."""
@@ -80,10 +111,12 @@ class LibreOfficeWrapper:
         expected_pdf_name = input_path.stem + ".pdf"
 
         # Use temporary directory as output to avoid issues with LibreOffice output naming
-        with tempfile.TemporaryDirectory(prefix="lo_convert_") as temp_dir:
+        with tempfile.TemporaryDirectory(prefix="lo_convert_") as temp_dir, \
+                self._user_profile() as profile_uri:
             try:
                 cmd = [
                     self.soffice_path,
+                    f"-env:UserInstallation={profile_uri}",
                     "--headless",
                     "--convert-to", "pdf",
                     "--outdir", temp_dir,
@@ -1,7 +1,7 @@
-import fitz  # PyMuPDF
 import logging
+import threading
 from pathlib import Path
-from typing import Tuple, Optional, Union
+from typing import Any, Dict, Tuple, Optional, Union
 from ..core.exceptions import ProcessingError, ValidationError
 
 class PDFLabeler:
@@ -10,6 +10,60 @@ class PDFLabeler:
     def __init__(self, font_path: Optional[str] = None):
         self.logger = logging.getLogger(__name__)
         self.font_path = font_path
+        # Parsed custom fonts by path; only fonts that loaded are kept, so a
+        # font file added later is picked up
+        self._font_cache: Dict[str, Any] = {}
+        # PyMuPDF objects are not thread-safe, and labeling threads share
+        # the cached fonts, so all access goes through this lock
+        self._font_lock = threading.Lock()
+
+    def preload_font(self, font_path: Optional[str] = None) -> bool:
+        """
+        Load a custom font once so later labels can reuse it.
+        
+        Args:
+            font_path: Path to font file (defaults to the instance font)
+            
+        Returns:
+            bool: True if the font file is usable
+        """
+        fontfile = font_path or self.font_path
+        if not fontfile:
+            return False
+        with self._font_lock:
+            return self._load_font(fontfile) is not None
+
+    def _load_font(self, fontfile: str) -> Optional[Any]:
+        """Get a cached fitz.Font, loading it on first use. Caller holds _font_lock."""
+        font = self._font_cache.get(fontfile)
+        if font is not None or not Path(fontfile).exists():
+            return font
+
+        import fitz  # PyMuPDF
+
+        try:
+            font = fitz.Font(fontfile=fontfile)
+        except Exception as e:
+            self.logger.warning(f"Failed to load font {fontfile}: {e}")
+            return None
+        self._font_cache[fontfile] = font
+        return font
+
+    def _custom_text_length(self, fontfile: str, text: str, font_size: int) -> Optional[float]:
+        """Measure text in a custom font.
+
+        Returns:
+            Text width in points, or None if the font is not usable
+        """
+        with self._font_lock:
+            font = self._load_font(fontfile)
+            if font is None:
+                return None
+            try:
+                return font.text_length(text, fontsize=font_size)
+            except Exception:
+                # Fallback if measurement fails
+                return len(text) * font_size * 0.5
 
     def add_label(self, input_path: str, output_path: str, 
                  text: str,
@@ -44,43 +98,44 @@ class PDFLabeler:
         if not input_path.exists():
             raise ValidationError("Input file not found", file_path=str(input_path))
             
+        import fitz  # PyMuPDF, imported on first use to keep startup fast
+
         try:
             doc = fitz.open(input_path)
             
-            rgb_color = self._hex_to_rgb(color)
-            fontfile = font_path or self.font_path
+            # Font, colour and text width are the same on every page
+            insert_args = {
+                "fontsize": font_size,
+                "color": self._hex_to_rgb(color),
+                "fill_opacity": opacity
+            }
             
-            for page in doc:
-                rect = page.rect
-                
-                # Determine font settings
-                insert_args = {
-                    "fontsize": font_size,
-                    "color": rgb_color,
-                    "fill_opacity": opacity
-                }
-                
-                # Font selection logic
-                if fontfile and Path(fontfile).exists():
-                    insert_args["fontfile"] = fontfile
-                    insert_args["fontname"] = "custom"
-                else:
-                    if not text.isascii():
-                        insert_args["fontname"] = "china-s" 
-                    else:
-                        insert_args["fontname"] = "helv"
+            # Font selection logic
+            fontfile = font_path or self.font_path
+            custom_text_len = self._custom_text_length(fontfile, text, font_size) if fontfile else None
+            if custom_text_len is not None:
+                insert_args["fontfile"] = fontfile
+                insert_args["fontname"] = "custom"
+            elif not text.isascii():
+                insert_args["fontname"] = "china-s"
+            else:
+                insert_args["fontname"] = "helv"
 
-                # Calculate position
-                x, y, align = self._calculate_coordinates(rect, position, font_size)
-                
-                # Adjust X for alignment
-                # We need text length to align properly
+            # We need text length to align properly
+            if custom_text_len is not None:
+                text_len = custom_text_len
+            else:
                 try:
-                    text_len = fitz.get_text_length(text, fontname=insert_args.get("fontname", "helv"), fontsize=font_size)
-                except:
+                    text_len = fitz.get_text_length(text, fontname=insert_args["fontname"], fontsize=font_size)
+                except Exception:
                     # Fallback if measurement fails
                     text_len = len(text) * font_size * 0.5
+            
+            for page in doc:
+                # Calculate position
+                x, y, align = self._calculate_coordinates(page.rect, position, font_size)
                 
+                # Adjust X for alignment
                 if align == 1: # Center
                     x -= text_len / 2
                 elif align == 2: # Right
@@ -114,6 +169,8 @@ class PDFLabeler:
         if not input_path.exists():
             raise ValidationError("Input file not found", file_path=str(input_path))
 
+        import fitz  # PyMuPDF
+
         try:
             doc = fitz.open(input_path)
             if page_num >= len(doc):
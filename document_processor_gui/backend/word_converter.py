@@ -6,8 +6,7 @@ import zipfile
 import logging
 from pathlib import Path
 from typing import Optional, List
-from PIL import Image
-from .conversion_backend import HybridConversionBackend, ConversionBackendType
+from .conversion_backend import HybridConversionBackend, ConversionBackendType, BackendStatus
 from ..core.exceptions import ProcessingError, ValidationError
 
 
@@ -22,6 +21,7 @@ class WordConverter:
     """
 
     SUPPORTED_FORMATS = ['.docx', '.doc']
+    _SUPPORTED_SUFFIXES = frozenset(SUPPORTED_FORMATS)
 
     def __init__(self,
                  preferred_backend: Optional[ConversionBackendType] = None,
@@ -40,7 +40,11 @@ class WordConverter:
 
     def is_supported_format(self, file_path: str) -> bool:
         """Check if file format is supported."""
-        return Path(file_path).suffix.lower() in self.SUPPORTED_FORMATS
+        # Every supported suffix contains ".doc"; reject most paths with a
+        # substring scan before paying for Path parsing.
+        if '.doc' not in file_path.lower():
+            return False
+        return Path(file_path).suffix.lower() in self._SUPPORTED_SUFFIXES
 
     def get_supported_formats(self) -> List[str]:
         """Get list of supported file extensions."""
@@ -54,10 +58,14 @@ class WordConverter:
         """Get name of active conversion backend."""
         return self._backend.get_active_backend_name()
 
-    def get_backend_status(self) -> dict:
+    def get_backend_status(self) -> BackendStatus:
         """Get detailed status of all backends."""
         return self._backend.get_backend_status()
 
+    def supports_concurrent_conversion(self) -> bool:
+        """Check if files may be converted in parallel threads."""
+        return self._backend.supports_concurrent_conversion()
+
     def convert_to_pdf(self, input_path: str, output_path: str,
                        image_compression_enabled: bool = False,
                        image_quality: int = 75,
@@ -162,6 +170,8 @@ class WordConverter:
 
     def _compress_single_image(self, image_path: Path, quality: int, optimize_png: bool):
         """Compress a single image file."""
+        from PIL import Image  # Imported on first use to keep startup fast
+
         try:
             with Image.open(image_path) as img:
                 original_format = img.format
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 import logging
 
+from ..core.json_io import read_json, write_json
 from .exceptions import ConfigLoadError, ConfigSaveError, ConfigValidationError
 
 
@@ -162,8 +163,7 @@ class ConfigurationManager:
             # Try to load existing config
             if self.config_file.exists():
                 self.logger.info(f"Loading config from {self.config_file}")
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config_data = json.load(f)
+                config_data = read_json(self.config_file)
                 
                 # Create config object from loaded data
                 config = self._dict_to_config(config_data)
@@ -215,8 +215,7 @@ class ConfigurationManager:
             
             # Save to file
             self.logger.info(f"Saving config to {self.config_file}")
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_dict, f, indent=2, ensure_ascii=False)
+            write_json(config_dict, self.config_file)
             
             # Update cached config
             self._config = config
@@ -235,8 +234,7 @@ class ConfigurationManager:
         try:
             # Try to load from default config file
             if self.default_config_file.exists():
-                with open(self.default_config_file, 'r', encoding='utf-8') as f:
-                    default_data = json.load(f)
+                default_data = read_json(self.default_config_file)
                 return self._dict_to_config(default_data)
             else:
                 # Return hardcoded defaults
@@ -2,7 +2,7 @@
 
 import logging
 import threading
-from typing import Optional, Callable, Dict, Any, List, TYPE_CHECKING
+from typing import Optional, Callable, Dict, Any, List, Tuple, TYPE_CHECKING
 from dataclasses import asdict
 
 from ..processing.models import ProcessingResults
@@ -12,7 +12,7 @@ from ..processing.labeling_engine import LabelingEngine
 from ..backend.word_converter import WordConverter
 from ..backend.ghostscript_wrapper import GhostscriptWrapper
 from ..backend.pdf_labeler import PDFLabeler
-from ..backend.conversion_backend import ConversionBackendType
+from ..backend.conversion_backend import ConversionBackendType, BackendStatus
 
 if TYPE_CHECKING:
     from ..config import ConfigurationManager
@@ -43,7 +43,9 @@ class ApplicationController:
         self._cancel_requested = False
         self._is_processing = False
 
-        # Initialize backend services
+        # Initialize backend services; the lock guards lazy initialization and
+        # refreshes, which may run on the UI thread and on probe threads
+        self._backends_lock = threading.RLock()
         self._word_converter: Optional[WordConverter] = None
         self._gs_wrapper: Optional[GhostscriptWrapper] = None
         self._pdf_labeler: Optional[PDFLabeler] = None
@@ -60,37 +62,39 @@ class ApplicationController:
 
     def _ensure_backends_initialized(self) -> None:
         """Lazily initialize backend services."""
-        if self._word_converter is None:
-            config = self.config_manager.get_config()
-            # Determine preferred backend from config
-            preferred_backend = None
-            if config.preferred_conversion_backend == "word":
-                preferred_backend = ConversionBackendType.WORD
-            elif config.preferred_conversion_backend == "libreoffice":
-                preferred_backend = ConversionBackendType.LIBREOFFICE
-            # auto: leave as None for automatic selection
-
-            libreoffice_path = config.libreoffice_path if config.libreoffice_path else None
-            self._word_converter = WordConverter(
-                preferred_backend=preferred_backend,
-                libreoffice_path=libreoffice_path
-            )
-        if self._gs_wrapper is None:
-            config = self.config_manager.get_config()
-            gs_path = config.ghostscript_path if config.ghostscript_path else None
-            self._gs_wrapper = GhostscriptWrapper(gs_path=gs_path)
-        if self._pdf_labeler is None:
-            self._pdf_labeler = PDFLabeler()
+        with self._backends_lock:
+            if self._word_converter is None:
+                config = self.config_manager.get_config()
+                # Determine preferred backend from config
+                preferred_backend = None
+                if config.preferred_conversion_backend == "word":
+                    preferred_backend = ConversionBackendType.WORD
+                elif config.preferred_conversion_backend == "libreoffice":
+                    preferred_backend = ConversionBackendType.LIBREOFFICE
+                # auto: leave as None for automatic selection
+
+                libreoffice_path = config.libreoffice_path if config.libreoffice_path else None
+                self._word_converter = WordConverter(
+                    preferred_backend=preferred_backend,
+                    libreoffice_path=libreoffice_path
+                )
+            if self._gs_wrapper is None:
+                config = self.config_manager.get_config()
+                gs_path = config.ghostscript_path if config.ghostscript_path else None
+                self._gs_wrapper = GhostscriptWrapper(gs_path=gs_path)
+            if self._pdf_labeler is None:
+                self._pdf_labeler = PDFLabeler()
 
     def _ensure_engines_initialized(self) -> None:
         """Lazily initialize processing engines."""
-        self._ensure_backends_initialized()
-        if self._conversion_engine is None:
-            self._conversion_engine = ConversionEngine(self._word_converter)
-        if self._compression_engine is None:
-            self._compression_engine = CompressionEngine(self._gs_wrapper)
-        if self._labeling_engine is None:
-            self._labeling_engine = LabelingEngine(self._pdf_labeler)
+        with self._backends_lock:
+            self._ensure_backends_initialized()
+            if self._conversion_engine is None:
+                self._conversion_engine = ConversionEngine(self._word_converter)
+            if self._compression_engine is None:
+                self._compression_engine = CompressionEngine(self._gs_wrapper)
+            if self._labeling_engine is None:
+                self._labeling_engine = LabelingEngine(self._pdf_labeler)
 
     @property
     def is_processing(self) -> bool:
@@ -418,10 +422,10 @@ class ApplicationController:
 
         # Check Ghostscript
         try:
-            self._ensure_backends_initialized()
-            if self._gs_wrapper.gs_path:
+            gs_wrapper = self._get_gs_wrapper()
+            if gs_wrapper.gs_path:
                 status['ghostscript']['available'] = True
-                status['ghostscript']['path'] = self._gs_wrapper.gs_path
+                status['ghostscript']['path'] = gs_wrapper.gs_path
         except Exception as e:
             status['ghostscript']['error'] = str(e)
 
@@ -458,8 +462,30 @@ class ApplicationController:
         Returns:
             bool: True if Ghostscript is available
         """
-        self._ensure_backends_initialized()
-        return self._gs_wrapper.is_available()
+        return self._get_gs_wrapper().is_available()
+
+    def get_ghostscript_status(self) -> Tuple[bool, Optional[str]]:
+        """Check Ghostscript availability and path.
+
+        Safe to call from a background thread.
+
+        Returns:
+            Tuple of (available, path); path is None when unavailable
+        """
+        gs_wrapper = self._get_gs_wrapper()
+        if gs_wrapper.is_available():
+            return True, gs_wrapper.gs_path
+        return False, None
+
+    def _get_gs_wrapper(self) -> GhostscriptWrapper:
+        """Get the Ghostscript wrapper, initializing backends if needed.
+
+        The wrapper is read under the lock so a concurrent refresh cannot
+        clear it between initialization and use.
+        """
+        with self._backends_lock:
+            self._ensure_backends_initialized()
+            return self._gs_wrapper
 
     def refresh_ghostscript(self, gs_path: Optional[str] = None) -> None:
         """Re-initialize Ghostscript wrapper after install or path change.
@@ -470,16 +496,19 @@ class ApplicationController:
         if gs_path:
             self.update_settings(ghostscript_path=gs_path)
         # Force re-initialization on next use
-        self._gs_wrapper = None
+        with self._backends_lock:
+            self._gs_wrapper = None
 
-    def get_conversion_backend_status(self) -> Dict[str, Any]:
+    def get_conversion_backend_status(self) -> BackendStatus:
         """Get detailed status of Word to PDF conversion backends.
 
         Returns:
-            Dict with backend status information
+            BackendStatus with availability of each backend
         """
-        self._ensure_backends_initialized()
-        return self._word_converter.get_backend_status()
+        with self._backends_lock:
+            self._ensure_backends_initialized()
+            word_converter = self._word_converter
+        return word_converter.get_backend_status()
 
     def refresh_libreoffice(self, lo_path: Optional[str] = None) -> None:
         """Re-initialize WordConverter after LibreOffice install or path change.
@@ -490,8 +519,9 @@ class ApplicationController:
         if lo_path:
             self.update_settings(libreoffice_path=lo_path)
         # Force re-initialization on next use
-        self._word_converter = None
-        self._conversion_engine = None
+        with self._backends_lock:
+            self._word_converter = None
+            self._conversion_engine = None
 
     def get_text(self, key: str, **kwargs) -> str:
         """Get localized text.
@@ -43,7 +43,9 @@ class ErrorHandler:
         
         # File handler
         log_file = self.log_dir / f"app_{datetime.now().strftime('%Y%m%d')}.log"
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        # Escape characters UTF-8 cannot encode (e.g. lone surrogates from
+        # undecodable file names) instead of dropping the whole record
+        file_handler = logging.FileHandler(log_file, encoding='utf-8', errors='backslashreplace')
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
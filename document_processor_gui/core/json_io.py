@@ -0,0 +1,35 @@
+"""JSON file helpers, using orjson when it is installed."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Union
+
+# Try to import orjson for faster JSON (de)serialization (optional)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def write_json(data: Dict[str, Any], file_path: Union[str, Path]) -> None:
+    """Write data to a file as indented UTF-8 JSON."""
+    if HAS_ORJSON:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def read_json(file_path: Union[str, Path]) -> Any:
+    """Read a UTF-8 JSON file.
+
+    orjson's decode error subclasses json.JSONDecodeError, so callers can
+    catch the latter either way.
+    """
+    if HAS_ORJSON:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
@@ -284,6 +284,8 @@ class FileListWidget(ttk.Frame):
         # Internal file list
         self._files: List[str] = []
         self._file_status: Dict[str, str] = {}
+        # First file in the list for each basename, for progress lookups
+        self._files_by_name: Dict[str, str] = {}
 
         self._setup_ui()
         self._setup_drag_drop()
@@ -393,12 +395,18 @@ class FileListWidget(ttk.Frame):
         Args:
             files: List of file paths to add
         """
+        # Set membership keeps adding a large folder linear; Tk already
+        # defers the tree redraw until the batch returns to the event loop
+        known = set(self._files)
+        pending = self._get_text('messages.status_messages.pending') if self.show_status else None
         for file_path in files:
-            if file_path not in self._files:
+            if file_path not in known:
+                known.add(file_path)
                 self._files.append(file_path)
-                self._add_file_to_tree(file_path)
+                self._files_by_name.setdefault(Path(file_path).name, file_path)
+                self._add_file_to_tree(file_path, pending)
 
-    def _add_file_to_tree(self, file_path: str) -> None:
+    def _add_file_to_tree(self, file_path: str, pending: Optional[str] = None) -> None:
         """Add a single file to the tree."""
         path = Path(file_path)
         values = [path.name]
@@ -411,7 +419,9 @@ class FileListWidget(ttk.Frame):
                 values.append("N/A")
 
         if self.show_status:
-            status = self._file_status.get(file_path, self._get_text('messages.status_messages.pending'))
+            status = self._file_status.get(file_path)
+            if status is None:
+                status = pending or self._get_text('messages.status_messages.pending')
             values.append(status)
 
         self.tree.insert('', 'end', iid=file_path, values=values)
@@ -426,11 +436,24 @@ class FileListWidget(ttk.Frame):
             if file_path in self._files:
                 self._files.remove(file_path)
                 self._file_status.pop(file_path, None)
+                self._unindex_file(file_path)
                 try:
                     self.tree.delete(file_path)
                 except tk.TclError:
                     pass
 
+    def _unindex_file(self, file_path: str) -> None:
+        """Drop a removed file from the basename index."""
+        name = Path(file_path).name
+        if self._files_by_name.get(name) != file_path:
+            return
+        del self._files_by_name[name]
+        # Fall back to the next remaining file with the same basename
+        for other in self._files:
+            if Path(other).name == name:
+                self._files_by_name[name] = other
+                break
+
     def remove_selected(self) -> None:
         """Remove selected files from the list."""
         selected = self.get_selected_files()
@@ -440,6 +463,7 @@ class FileListWidget(ttk.Frame):
         """Clear all files from the list."""
         self._files.clear()
         self._file_status.clear()
+        self._files_by_name.clear()
         for item in self.tree.get_children():
             self.tree.delete(item)
 
@@ -451,6 +475,17 @@ class FileListWidget(ttk.Frame):
         """
         return self._files.copy()
 
+    def get_file_by_name(self, filename: str) -> Optional[str]:
+        """Get the full path of a listed file by its basename.
+
+        Args:
+            filename: File name without directory
+
+        Returns:
+            First matching file path or None if not found
+        """
+        return self._files_by_name.get(filename)
+
     def get_selected_files(self) -> List[str]:
         """Get currently selected files.
 
@@ -477,15 +512,22 @@ class FileListWidget(ttk.Frame):
             file_path: File path
             status: Status text
         """
-        self._file_status[file_path] = status
-        if self.show_status and self.tree.exists(file_path):
-            # Update the status column
-            current_values = list(self.tree.item(file_path, 'values'))
-            if len(current_values) >= 3:
-                current_values[2] = status
-            else:
-                current_values.append(status)
-            self.tree.item(file_path, values=current_values)
+        self.set_file_statuses({file_path: status})
+
+    def set_file_statuses(self, statuses: Dict[str, str]) -> None:
+        """Set status for several files at once.
+
+        Args:
+            statuses: Mapping of file path to status text
+        """
+        for file_path, status in statuses.items():
+            # Files removed while a batch was running keep no status
+            if not self.tree.exists(file_path):
+                continue
+            self._file_status[file_path] = status
+            if self.show_status:
+                # Update only the status cell
+                self.tree.set(file_path, 'status', status)
 
     def update_translations(self) -> None:
         """Update UI text with current language."""
@@ -1,24 +1,67 @@
 """Main window and tab implementations for the Document Processor GUI."""
 
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, messagebox
 import logging
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
+import os
+import queue
+import re
+import threading
+import time
+from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING
 from pathlib import Path
 
 from .components import FileSelector, FileListWidget, OutputSelector, FileButtonBar, HelpIcon
 from .dialogs import ProgressDialog, ResultsDialog, ErrorDialog, SettingsDialog
-from .preview import PreviewPanel
+from .preview import PreviewPanel, get_render_executor
 
 if TYPE_CHECKING:
+    from ..backend.conversion_backend import BackendStatus
     from ..core.application_controller import ApplicationController
     from ..core.language_manager import LanguageManager
     from ..processing.models import ProcessingResults
 
+# Label position choices shown in the labeling tab
+_LABEL_POSITIONS = ('header', 'footer', 'top-left', 'top-right', 'bottom-left', 'bottom-right')
+
+# Worker thread events delivered to processing tabs through their event queue
+_PROGRESS_EVENT = 'progress'
+_COMPLETION_EVENT = 'completion'
+_ERROR_EVENT = 'error'
+
+# Backend probe results delivered to the main window through its event queue
+_GS_PROBE_EVENT = 'gs_probe'
+_BACKEND_PROBE_EVENT = 'backend_probe'
+
+# Interval for draining worker events while processing, in milliseconds
+_EVENT_POLL_MS = 50
+
+# Translation keys used repeatedly by the window title and status indicators
+_KEY_APP_TITLE = 'app_title'
+_KEY_WORD_STATUS_TITLE = 'word.status_title'
+_KEY_WORD_ACTIVE_BACKEND = 'word.active_backend'
+_KEY_WORD_NO_BACKEND = 'word.no_backend'
+_KEY_GS_NOT_FOUND = 'ghostscript.status_not_found'
+
+# Notebook tab title keys, in tab order
+_TAB_TITLE_KEYS = ('tabs.conversion', 'tabs.compression', 'tabs.labeling')
+
+# Seconds a conversion backend status probe is reused before re-probing
+_BACKEND_STATUS_TTL = 5.0
+
+# Tk geometry string "WxH+X+Y"; X/Y may be negative on multi-monitor setups
+_GEOMETRY_RE = re.compile(r'(\d+)x(\d+)\+(-?\d+)\+(-?\d+)')
+
 
 class BaseProcessingTab(ttk.Frame):
     """Base class for processing tabs."""
 
+    # Lowercase extensions picked up by "Add Folder", per file type
+    _EXTENSIONS = {
+        'word': ('.docx', '.doc', '.rtf'),
+        'pdf': ('.pdf',),
+    }
+
     def __init__(self, parent: tk.Widget,
                  app_controller: "ApplicationController",
                  language_manager: Optional["LanguageManager"] = None,
@@ -39,13 +82,24 @@ class BaseProcessingTab(ttk.Frame):
 
         self._progress_dialog: Optional[ProgressDialog] = None
         self._processing_complete = False
+        # Worker callbacks post (kind, payload) here; the UI thread drains it
+        self._event_queue: "queue.Queue[tuple]" = queue.Queue()
+        self._polling_events = False
+        # Resolved translations for the current language, keyed by text key
+        self._text_cache: Dict[str, str] = {}
+        self._error_dialog = ErrorDialog(self.language_manager)
         self._setup_base_ui()
 
     def _get_text(self, key: str, **kwargs) -> str:
-        """Get translated text."""
-        if self.language_manager:
+        """Get translated text, memoizing lookups without format arguments."""
+        if not self.language_manager:
+            return key
+        if kwargs:
             return self.language_manager.get_text(key, **kwargs)
-        return key
+        text = self._text_cache.get(key)
+        if text is None:
+            text = self._text_cache[key] = self.language_manager.get_text(key)
+        return text
 
     def _setup_base_ui(self):
         """Setup base UI elements."""
@@ -101,21 +155,24 @@ class BaseProcessingTab(ttk.Frame):
     def _add_folder(self):
         """Handle add folder button - add all matching files from folder."""
         folder = self.file_selector.select_folder()
-        if folder:
-            extensions = self._get_extensions_for_type()
-            files = []
-            for ext in extensions:
-                files.extend(str(f) for f in Path(folder).glob(f'*{ext}'))
-            if files:
-                self.file_list.add_files(files)
-
-    def _get_extensions_for_type(self) -> List[str]:
+        if not folder:
+            return
+        extensions = self._get_extensions_for_type()
+        match_all = '.*' in extensions
+        # Single directory pass instead of one glob per extension
+        with os.scandir(folder) as entries:
+            files = [
+                entry.path for entry in entries
+                if entry.is_file()
+                and (match_all or os.path.splitext(entry.name)[1].lower() in extensions)
+            ]
+        if not files:
+            return
+        self.file_list.add_files(files)
+
+    def _get_extensions_for_type(self) -> Tuple[str, ...]:
         """Get file extensions for the file type."""
-        if self.file_type == 'word':
-            return ['.docx', '.doc', '.rtf']
-        elif self.file_type == 'pdf':
-            return ['.pdf']
-        return ['.*']
+        return self._EXTENSIONS.get(self.file_type, ('.*',))
 
     def _remove_selected(self):
         """Handle remove selected button."""
@@ -133,6 +190,39 @@ class BaseProcessingTab(ttk.Frame):
         """Start processing - to be implemented by subclasses."""
         raise NotImplementedError
 
+    def _validate_and_prepare(self) -> Optional[Tuple[List[str], str, Dict[str, Any]]]:
+        """Check that files and an output directory are selected.
+
+        Returns:
+            Tuple of (files, output_dir, settings), or None after warning the user
+        """
+        files = self.file_list.get_files()
+        if not files:
+            self._error_dialog.show_warning(
+                self.winfo_toplevel(),
+                self._get_text('messages.no_files_selected')
+            )
+            return None
+
+        output_dir = self.output_selector.get_directory()
+        if not output_dir:
+            self._error_dialog.show_warning(
+                self.winfo_toplevel(),
+                self._get_text('messages.invalid_output_directory')
+            )
+            return None
+
+        return files, output_dir, self.app_controller.get_settings()
+
+    def _begin_processing(self, title: str):
+        """Register worker callbacks and show the progress dialog."""
+        self.app_controller.set_callbacks(
+            progress_callback=self._on_progress,
+            completion_callback=self._on_completion,
+            error_callback=self._on_error
+        )
+        self._show_progress_dialog(title)
+
     def _show_progress_dialog(self, title: str):
         """Show progress dialog."""
         self._processing_complete = False
@@ -143,6 +233,46 @@ class BaseProcessingTab(ttk.Frame):
             title=title,
             on_cancel=self._cancel_processing
         )
+        if not self._polling_events:
+            self._polling_events = True
+            self.after(_EVENT_POLL_MS, self._drain_events)
+
+    def _drain_events(self):
+        """Apply queued worker events - must be called from main thread.
+
+        Progress events are coalesced so only the latest one is shown per
+        poll; completion or error ends polling.
+        """
+        latest_progress = None
+        try:
+            while True:
+                kind, payload = self._event_queue.get_nowait()
+                if kind == _PROGRESS_EVENT:
+                    latest_progress = payload
+                    continue
+                self._polling_events = False
+                if kind == _COMPLETION_EVENT:
+                    self._show_completion_ui(payload)
+                else:
+                    self._show_error_ui(payload)
+                return
+        except queue.Empty:
+            pass
+
+        if latest_progress is not None:
+            self._update_progress_ui(*latest_progress)
+
+        if self._progress_dialog is not None:
+            self.after(_EVENT_POLL_MS, self._drain_events)
+        else:
+            self._polling_events = False
+
+    def _post_event(self, kind: str, payload: Any):
+        """Queue a worker event for the main thread."""
+        self._event_queue.put_nowait((kind, payload))
+        if kind != _PROGRESS_EVENT and not self._polling_events:
+            # Not processing (e.g. a preview error); drain once right away
+            self.after(0, self._drain_events)
 
     def _cancel_processing(self):
         """Cancel current processing."""
@@ -150,8 +280,7 @@ class BaseProcessingTab(ttk.Frame):
 
     def _on_progress(self, current: int, total: int, filename: str):
         """Handle progress update - called from background thread."""
-        # Schedule GUI update on main thread
-        self.after(0, lambda: self._update_progress_ui(current, total, filename))
+        self._post_event(_PROGRESS_EVENT, (current, total, filename))
 
     def _update_progress_ui(self, current: int, total: int, filename: str):
         """Update progress UI - must be called from main thread."""
@@ -171,15 +300,11 @@ class BaseProcessingTab(ttk.Frame):
 
     def _get_file_by_name(self, filename: str) -> Optional[str]:
         """Find full path by filename."""
-        for f in self.file_list.get_files():
-            if Path(f).name == filename:
-                return f
-        return None
+        return self.file_list.get_file_by_name(filename)
 
     def _on_completion(self, results: "ProcessingResults"):
         """Handle processing completion - called from background thread."""
-        # Schedule GUI update on main thread
-        self.after(0, lambda: self._show_completion_ui(results))
+        self._post_event(_COMPLETION_EVENT, results)
 
     def _show_completion_ui(self, results: "ProcessingResults"):
         """Show completion UI - must be called from main thread."""
@@ -189,19 +314,22 @@ class BaseProcessingTab(ttk.Frame):
             self._progress_dialog = None
 
         # Update file statuses for processed files
-        processed_files = set()
-        for result in results.results:
-            status = self._get_text('messages.status_messages.done') if result.success else self._get_text('messages.status_messages.failed')
-            self.file_list.set_file_status(result.input_file, status)
-            processed_files.add(result.input_file)
+        done_text = self._get_text('messages.status_messages.done')
+        failed_text = self._get_text('messages.status_messages.failed')
+        statuses = {
+            result.input_file: done_text if result.success else failed_text
+            for result in results.results
+        }
 
         # Reset unprocessed files that are still showing "Processing..." back to "Pending"
         processing_text = self._get_text('messages.status_messages.processing')
         pending_text = self._get_text('messages.status_messages.pending')
         for file_path in self.file_list.get_files():
-            if file_path not in processed_files:
+            if file_path not in statuses:
                 if self.file_list.get_file_status(file_path) == processing_text:
-                    self.file_list.set_file_status(file_path, pending_text)
+                    statuses[file_path] = pending_text
+
+        self.file_list.set_file_statuses(statuses)
 
         # Show results dialog
         root = self.winfo_toplevel()
@@ -214,8 +342,7 @@ class BaseProcessingTab(ttk.Frame):
 
     def _on_error(self, error_msg: str):
         """Handle processing error - called from background thread."""
-        # Schedule GUI update on main thread
-        self.after(0, lambda: self._show_error_ui(error_msg))
+        self._post_event(_ERROR_EVENT, error_msg)
 
     def _show_error_ui(self, error_msg: str):
         """Show error UI - must be called from main thread."""
@@ -231,13 +358,14 @@ class BaseProcessingTab(ttk.Frame):
             if self.file_list.get_file_status(file_path) == processing_text:
                 self.file_list.set_file_status(file_path, pending_text)
 
-        ErrorDialog(self.language_manager).show_error(
+        self._error_dialog.show_error(
             self.winfo_toplevel(),
             error_msg
         )
 
     def update_translations(self):
         """Update all UI text with current language."""
+        self._text_cache.clear()
         self.button_bar.update_translations()
         self.file_list.update_translations()
         self.output_selector.update_translations()
@@ -260,36 +388,12 @@ class ConversionTab(BaseProcessingTab):
 
     def _start_processing(self):
         """Start Word to PDF conversion."""
-        files = self.file_list.get_files()
-        if not files:
-            ErrorDialog(self.language_manager).show_warning(
-                self.winfo_toplevel(),
-                self._get_text('messages.no_files_selected')
-            )
-            return
-
-        output_dir = self.output_selector.get_directory()
-        if not output_dir:
-            ErrorDialog(self.language_manager).show_warning(
-                self.winfo_toplevel(),
-                self._get_text('messages.invalid_output_directory')
-            )
+        prepared = self._validate_and_prepare()
+        if not prepared:
             return
+        files, output_dir, settings = prepared
 
-        # Get settings
-        settings = self.app_controller.get_settings()
-
-        # Set callbacks
-        self.app_controller.set_callbacks(
-            progress_callback=self._on_progress,
-            completion_callback=self._on_completion,
-            error_callback=self._on_error
-        )
-
-        # Show progress dialog
-        self._show_progress_dialog(self._get_text('tabs.conversion'))
-
-        # Start conversion
+        self._begin_processing(self._get_text('tabs.conversion'))
         self.app_controller.start_conversion(files, output_dir, settings)
 
     def update_translations(self):
@@ -300,6 +404,14 @@ class ConversionTab(BaseProcessingTab):
 class CompressionTab(BaseProcessingTab):
     """Tab for PDF compression."""
 
+    # (attribute, label key, setting key, default, from, to, increment, tooltip key)
+    _SPIN_OPTIONS = (
+        ('dpi_spin', 'options.dpi', 'target_dpi', 144, 72, 600, 1, 'tooltips.target_dpi'),
+        ('threshold_spin', 'options.downsample_threshold', 'downsample_threshold', 1.1, 1.0, 3.0, 0.1,
+         'tooltips.downsample_threshold'),
+        ('image_quality_spin', 'options.image_quality', 'image_quality', 75, 1, 100, 1, 'tooltips.image_quality'),
+    )
+
     def __init__(self, parent: tk.Widget,
                  app_controller: "ApplicationController",
                  language_manager: Optional["LanguageManager"] = None):
@@ -312,68 +424,37 @@ class CompressionTab(BaseProcessingTab):
         self.options_frame = ttk.LabelFrame(self, text=self._get_text('groups.compression_options'), padding=10)
         self.options_frame.grid(row=4, column=0, sticky='ew', padx=10, pady=5)
 
+        settings = self.app_controller.get_settings()
+
         # Compression level preset
         self.level_preset_label = ttk.Label(self.options_frame, text=self._get_text('labels.compression_level'))
         self.level_preset_label.pack(side='left', padx=5)
-        self.quality_var = tk.StringVar(
-            value=self.app_controller.get_settings().get('compression_level', 'screen')
-        )
-        quality_combo = ttk.Combobox(
+        self.quality_combo = ttk.Combobox(
             self.options_frame,
-            textvariable=self.quality_var,
             values=['screen', 'ebook', 'printer', 'prepress'],
             state='readonly',
             width=15
         )
-        quality_combo.pack(side='left', padx=5)
+        self.quality_combo.set(settings.get('compression_level', 'screen'))
+        self.quality_combo.pack(side='left', padx=5)
         self.level_help = HelpIcon(self.options_frame, self._get_text('tooltips.compression_level'))
         self.level_help.pack(side='left', padx=(0, 10))
 
-        # DPI
-        self.dpi_label = ttk.Label(self.options_frame, text=self._get_text('options.dpi'))
-        self.dpi_label.pack(side='left', padx=(20, 5))
-        self.dpi_var = tk.IntVar(
-            value=self.app_controller.get_settings().get('target_dpi', 144)
-        )
-        ttk.Spinbox(
-            self.options_frame,
-            from_=72, to=600,
-            textvariable=self.dpi_var,
-            width=5
-        ).pack(side='left')
-        self.dpi_help = HelpIcon(self.options_frame, self._get_text('tooltips.target_dpi'))
-        self.dpi_help.pack(side='left', padx=(0, 10))
-
-        # Downsample threshold
-        self.threshold_label = ttk.Label(self.options_frame, text=self._get_text('options.downsample_threshold'))
-        self.threshold_label.pack(side='left', padx=(20, 5))
-        self.threshold_var = tk.DoubleVar(
-            value=self.app_controller.get_settings().get('downsample_threshold', 1.1)
-        )
-        ttk.Spinbox(
-            self.options_frame,
-            from_=1.0, to=3.0,
-            increment=0.1,
-            textvariable=self.threshold_var,
-            width=5
-        ).pack(side='left')
-        self.threshold_help = HelpIcon(self.options_frame, self._get_text('tooltips.downsample_threshold'))
-        self.threshold_help.pack(side='left', padx=(0, 10))
-
-        # Image quality
-        self.image_quality_label = ttk.Label(self.options_frame, text=self._get_text('options.image_quality'))
-        self.image_quality_label.pack(side='left', padx=(20, 5))
-        self.image_quality_var = tk.IntVar(
-            value=self.app_controller.get_settings().get('image_quality', 75)
-        )
-        ttk.Spinbox(
-            self.options_frame,
-            from_=1, to=100,
-            textvariable=self.image_quality_var,
-            width=5
-        ).pack(side='left')
-        self.image_quality_help = HelpIcon(self.options_frame, self._get_text('tooltips.image_quality'))
-        self.image_quality_help.pack(side='left', padx=(0, 10))
+        self._translatable_rows = [
+            (self.level_preset_label, self.level_help, 'labels.compression_level', 'tooltips.compression_level')
+        ]
+
+        # Numeric options: one label/spinbox/help triple per row
+        for attr, label_key, setting_key, default, from_, to, increment, tooltip_key in self._SPIN_OPTIONS:
+            label = ttk.Label(self.options_frame, text=self._get_text(label_key))
+            label.pack(side='left', padx=(20, 5))
+            spin = ttk.Spinbox(self.options_frame, from_=from_, to=to, increment=increment, width=5)
+            spin.set(settings.get(setting_key, default))
+            spin.pack(side='left')
+            help_icon = HelpIcon(self.options_frame, self._get_text(tooltip_key))
+            help_icon.pack(side='left', padx=(0, 10))
+            setattr(self, attr, spin)
+            self._translatable_rows.append((label, help_icon, label_key, tooltip_key))
 
     def _start_processing(self):
         """Start PDF compression."""
@@ -390,55 +471,27 @@ class CompressionTab(BaseProcessingTab):
             if not self.app_controller.check_and_setup_ghostscript():
                 return  # User skipped, abort compression
 
-        files = self.file_list.get_files()
-        if not files:
-            ErrorDialog(self.language_manager).show_warning(
-                self.winfo_toplevel(),
-                self._get_text('messages.no_files_selected')
-            )
+        prepared = self._validate_and_prepare()
+        if not prepared:
             return
+        files, output_dir, settings = prepared
 
-        output_dir = self.output_selector.get_directory()
-        if not output_dir:
-            ErrorDialog(self.language_manager).show_warning(
-                self.winfo_toplevel(),
-                self._get_text('messages.invalid_output_directory')
-            )
-            return
+        # Apply UI overrides
+        settings['compression_level'] = self.quality_combo.get()
+        settings['target_dpi'] = int(self.dpi_spin.get())
+        settings['downsample_threshold'] = float(self.threshold_spin.get())
+        settings['image_quality'] = int(self.image_quality_spin.get())
 
-        # Get settings with UI overrides
-        settings = self.app_controller.get_settings()
-        settings['compression_level'] = self.quality_var.get()
-        settings['target_dpi'] = self.dpi_var.get()
-        settings['downsample_threshold'] = self.threshold_var.get()
-        settings['image_quality'] = self.image_quality_var.get()
-
-        # Set callbacks
-        self.app_controller.set_callbacks(
-            progress_callback=self._on_progress,
-            completion_callback=self._on_completion,
-            error_callback=self._on_error
-        )
-
-        # Show progress dialog
-        self._show_progress_dialog(self._get_text('tabs.compression'))
-
-        # Start compression
+        self._begin_processing(self._get_text('tabs.compression'))
         self.app_controller.start_compression(files, output_dir, settings)
 
     def update_translations(self):
         """Update all UI text with current language."""
         super().update_translations()
         self.options_frame.configure(text=self._get_text('groups.compression_options'))
-        self.level_preset_label.configure(text=self._get_text('labels.compression_level'))
-        self.dpi_label.configure(text=self._get_text('options.dpi'))
-        self.threshold_label.configure(text=self._get_text('options.downsample_threshold'))
-        self.image_quality_label.configure(text=self._get_text('options.image_quality'))
-        # Update help tooltips
-        self.level_help.update_tooltip(self._get_text('tooltips.compression_level'))
-        self.dpi_help.update_tooltip(self._get_text('tooltips.target_dpi'))
-        self.threshold_help.update_tooltip(self._get_text('tooltips.downsample_threshold'))
-        self.image_quality_help.update_tooltip(self._get_text('tooltips.image_quality'))
+        for label, help_icon, label_key, tooltip_key in self._translatable_rows:
+            label.configure(text=self._get_text(label_key))
+            help_icon.update_tooltip(self._get_text(tooltip_key))
 
 
 class LabelingTab(BaseProcessingTab):
@@ -448,6 +501,8 @@ class LabelingTab(BaseProcessingTab):
                  app_controller: "ApplicationController",
                  language_manager: Optional["LanguageManager"] = None):
         super().__init__(parent, app_controller, language_manager, file_type='pdf')
+        # Incremented per preview request; stale background results are dropped
+        self._preview_generation = 0
         self._setup_labeling_options()
 
     def _setup_labeling_options(self):
@@ -465,37 +520,38 @@ class LabelingTab(BaseProcessingTab):
         ttk.Label(self.options_frame, text=self._get_text('labels.label_position')).grid(
             row=0, column=0, sticky='w', padx=5, pady=2
         )
-        self.position_var = tk.StringVar(value=settings.get('label_position', 'header'))
-        positions = ['header', 'footer', 'top-left', 'top-right', 'bottom-left', 'bottom-right']
-        ttk.Combobox(
+        self.position_combo = ttk.Combobox(
             self.options_frame,
-            textvariable=self.position_var,
-            values=positions,
+            values=_LABEL_POSITIONS,
             state='readonly',
             width=15
-        ).grid(row=0, column=1, sticky='w', padx=5, pady=2)
+        )
+        self.position_combo.set(settings.get('label_position', 'header'))
+        self.position_combo.grid(row=0, column=1, sticky='w', padx=5, pady=2)
 
         # Font size
         ttk.Label(self.options_frame, text=self._get_text('labels.font_size')).grid(
             row=1, column=0, sticky='w', padx=5, pady=2
         )
-        self.font_size_var = tk.IntVar(value=settings.get('label_font_size', 10))
-        ttk.Spinbox(
+        self.font_size_spin = ttk.Spinbox(
             self.options_frame,
             from_=6, to=72,
-            textvariable=self.font_size_var,
             width=5
-        ).grid(row=1, column=1, sticky='w', padx=5, pady=2)
+        )
+        self.font_size_spin.set(settings.get('label_font_size', 10))
+        self.font_size_spin.grid(row=1, column=1, sticky='w', padx=5, pady=2)
 
         # Font color
         ttk.Label(self.options_frame, text=self._get_text('labels.font_color')).grid(
             row=2, column=0, sticky='w', padx=5, pady=2
         )
-        self.color_var = tk.StringVar(value=settings.get('label_font_color', '#FF0000'))
+        font_color = settings.get('label_font_color', '#FF0000')
         color_frame = ttk.Frame(self.options_frame)
         color_frame.grid(row=2, column=1, sticky='w', padx=5, pady=2)
-        ttk.Entry(color_frame, textvariable=self.color_var, width=10).pack(side='left')
-        self.color_preview = tk.Label(color_frame, width=3, bg=self.color_var.get())
+        self.color_entry = ttk.Entry(color_frame, width=10)
+        self.color_entry.insert(0, font_color)
+        self.color_entry.pack(side='left')
+        self.color_preview = tk.Label(color_frame, width=3, bg=font_color)
         self.color_preview.pack(side='left', padx=5)
 
         # Preview button
@@ -513,10 +569,10 @@ class LabelingTab(BaseProcessingTab):
         self.preview_panel.pack(fill='both', expand=True)
 
     def _show_preview(self):
-        """Generate and show preview."""
+        """Generate preview on the shared PyMuPDF render thread."""
         files = self.file_list.get_files()
         if not files:
-            ErrorDialog(self.language_manager).show_warning(
+            self._error_dialog.show_warning(
                 self.winfo_toplevel(),
                 self._get_text('messages.no_files_selected')
             )
@@ -531,63 +587,66 @@ class LabelingTab(BaseProcessingTab):
 
         # Generate preview settings
         settings = {
-            'label_position': self.position_var.get(),
-            'label_font_size': self.font_size_var.get(),
-            'label_font_color': self.color_var.get(),
+            'label_position': self.position_combo.get(),
+            'label_font_size': int(self.font_size_spin.get()),
+            'label_font_color': self.color_entry.get(),
             'label_transparency': self.app_controller.get_settings().get('label_transparency', 1.0)
         }
 
+        self._preview_generation += 1
+        self.preview_panel.show_message(self._get_text('messages.generating_preview'))
+        # PyMuPDF is not thread-safe; run after any page the preview panel
+        # is still rendering instead of alongside it
+        get_render_executor().submit(
+            self._generate_preview_in_background,
+            file_path, settings, self._preview_generation
+        )
+
+    def _generate_preview_in_background(self, file_path: str, settings: Dict[str, Any],
+                                        generation: int):
+        """Render the first preview page - called from render thread."""
         # Get total pages
         total_pages = self.app_controller.get_pdf_page_count(file_path)
-        if total_pages == 0:
+        preview_bytes = None
+        if total_pages:
+            # Generate first page preview
+            preview_bytes = self.app_controller.generate_label_preview(file_path, settings, page_num=0)
+
+        # Schedule GUI update on main thread
+        self.after(0, self._show_preview_result,
+                   file_path, settings, total_pages, preview_bytes, generation)
+
+    def _show_preview_result(self, file_path: str, settings: Dict[str, Any],
+                             total_pages: int, preview_bytes: Optional[bytes],
+                             generation: int):
+        """Display a generated preview - must be called from main thread."""
+        if generation != self._preview_generation:
+            return  # A newer preview request superseded this one
+        if not preview_bytes:
+            self.preview_panel.clear()
             return
 
-        # Generate first page preview
-        preview_bytes = self.app_controller.generate_label_preview(file_path, settings, page_num=0)
-        if preview_bytes:
-            # Set callback for page rendering (closure captures file_path and settings)
-            def render_page(page_num: int):
-                return self.app_controller.generate_label_preview(file_path, settings, page_num=page_num)
+        # Set callback for page rendering (closure captures file_path and settings)
+        def render_page(page_num: int):
+            return self.app_controller.generate_label_preview(file_path, settings, page_num=page_num)
 
-            # Order matters: load_from_bytes() clears callback, so set callback after
-            self.preview_panel.load_from_bytes(preview_bytes, 'png', total_pages=total_pages)
-            self.preview_panel.set_page_render_callback(render_page)
+        # Order matters: load_from_bytes() clears callback, so set callback after
+        self.preview_panel.load_from_bytes(preview_bytes, 'png', total_pages=total_pages)
+        self.preview_panel.set_page_render_callback(render_page)
 
     def _start_processing(self):
         """Start PDF labeling."""
-        files = self.file_list.get_files()
-        if not files:
-            ErrorDialog(self.language_manager).show_warning(
-                self.winfo_toplevel(),
-                self._get_text('messages.no_files_selected')
-            )
+        prepared = self._validate_and_prepare()
+        if not prepared:
             return
+        files, output_dir, settings = prepared
 
-        output_dir = self.output_selector.get_directory()
-        if not output_dir:
-            ErrorDialog(self.language_manager).show_warning(
-                self.winfo_toplevel(),
-                self._get_text('messages.invalid_output_directory')
-            )
-            return
-
-        # Get settings with UI overrides
-        settings = self.app_controller.get_settings()
-        settings['label_position'] = self.position_var.get()
-        settings['label_font_size'] = self.font_size_var.get()
-        settings['label_font_color'] = self.color_var.get()
-
-        # Set callbacks
-        self.app_controller.set_callbacks(
-            progress_callback=self._on_progress,
-            completion_callback=self._on_completion,
-            error_callback=self._on_error
-        )
+        # Apply UI overrides
+        settings['label_position'] = self.position_combo.get()
+        settings['label_font_size'] = int(self.font_size_spin.get())
+        settings['label_font_color'] = self.color_entry.get()
 
-        # Show progress dialog
-        self._show_progress_dialog(self._get_text('tabs.labeling'))
-
-        # Start labeling
+        self._begin_processing(self._get_text('tabs.labeling'))
         self.app_controller.start_labeling(files, output_dir, settings)
 
     def update_translations(self):
@@ -600,6 +659,9 @@ class LabelingTab(BaseProcessingTab):
 class MainWindow:
     """Main application window."""
 
+    # ttk styles are process-wide, so configure them only once
+    _style_configured = False
+
     def __init__(self, root: tk.Tk,
                  app_controller: "ApplicationController",
                  language_manager: Optional["LanguageManager"] = None):
@@ -615,7 +677,22 @@ class MainWindow:
         self.app_controller = app_controller
         self.language_manager = language_manager
 
+        # Resolved translations for the current language, keyed by text key
+        self._text_cache: Dict[str, str] = {}
+        # Last known Ghostscript availability; None forces a re-probe
+        self._gs_available_cache: Optional[bool] = None
+        self._gs_path_cache: Optional[str] = None
+        # Last conversion backend status and when it was probed
+        self._backend_status: Optional["BackendStatus"] = None
+        self._backend_status_time = 0.0
+        self._indicator_refresh_pending = False
+        # Probe threads post (kind, result) here; the UI thread drains it
+        self._event_queue: "queue.Queue[tuple]" = queue.Queue()
+        self._probes_running: set = set()
+        self._polling_events = False
+
         self._setup_window()
+        self._setup_tooltip()
         self._setup_menu()
         self._setup_status_bar()
         self._setup_tabs()
@@ -634,8 +711,11 @@ class MainWindow:
         settings = self.app_controller.get_settings()
         if settings.get('skip_ghostscript_check', False):
             return
-        if not self.app_controller.check_and_setup_ghostscript():
+        self._gs_available_cache, self._gs_path_cache = self.app_controller.get_ghostscript_status()
+        if not self._gs_available_cache:
             self._show_ghostscript_setup_dialog()
+            self._gs_available_cache = None
+            self._schedule_indicator_refresh()
 
     def _show_ghostscript_setup_dialog(self):
         """Show Ghostscript setup dialog."""
@@ -648,22 +728,33 @@ class MainWindow:
         self.root.wait_window(dialog)
 
     def _get_text(self, key: str, **kwargs) -> str:
-        """Get translated text."""
-        if self.language_manager:
+        """Get translated text, memoizing lookups without format arguments."""
+        if not self.language_manager:
+            return key
+        if kwargs:
             return self.language_manager.get_text(key, **kwargs)
-        return key
+        text = self._text_cache.get(key)
+        if text is None:
+            text = self._text_cache[key] = self.language_manager.get_text(key)
+        return text
 
     def _setup_window(self):
         """Setup main window properties."""
-        self.root.title(self._get_text('app_title'))
+        self.root.title(self._get_text(_KEY_APP_TITLE))
         self.root.minsize(800, 600)
 
-        # Set window icon
+        # Load window icon once the event loop is idle so disk I/O
+        # does not delay the first paint
+        self.root.after_idle(self._load_app_icon)
+
+    def _load_app_icon(self):
+        """Load and set the window icon."""
         try:
             icon_path = Path(__file__).parent.parent / 'resources' / 'app_icon.png'
             if icon_path.exists():
-                icon = tk.PhotoImage(file=str(icon_path))
-                self.root.iconphoto(True, icon)
+                # Keep a reference so the image is not garbage collected
+                self._app_icon = tk.PhotoImage(file=str(icon_path))
+                self.root.iconphoto(True, self._app_icon)
         except Exception as e:
             self.logger.warning(f"Failed to load app icon: {e}")
 
@@ -671,36 +762,53 @@ class MainWindow:
         """Setup menu bar."""
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
+        # (menu, entry index, text key) for translatable entries
+        self._menu_items = []
 
         # File menu
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label=self._get_text('menu.file'), menu=file_menu)
+        self._track_menu_label(menubar, 'menu.file')
         file_menu.add_command(
             label=self._get_text('menu.settings'),
             command=self._show_settings
         )
+        self._track_menu_label(file_menu, 'menu.settings')
         file_menu.add_separator()
         file_menu.add_command(
             label=self._get_text('menu.exit'),
             command=self.on_closing
         )
+        self._track_menu_label(file_menu, 'menu.exit')
 
         # Language menu
         lang_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label=self._get_text('menu.language'), menu=lang_menu)
+        self._track_menu_label(menubar, 'menu.language')
         lang_menu.add_command(label="中文", command=lambda: self._change_language('zh'))
         lang_menu.add_command(label="English", command=lambda: self._change_language('en'))
 
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label=self._get_text('menu.help'), menu=help_menu)
+        self._track_menu_label(menubar, 'menu.help')
         help_menu.add_command(
             label=self._get_text('menu.about'),
             command=self._show_about
         )
+        self._track_menu_label(help_menu, 'menu.about')
 
         self.menubar = menubar
 
+    def _track_menu_label(self, menu: tk.Menu, key: str):
+        """Remember the last added menu entry so it can be retranslated."""
+        self._menu_items.append((menu, menu.index('end'), key))
+
+    def _retranslate_menu(self):
+        """Update menu labels in place for the current language."""
+        for menu, index, key in self._menu_items:
+            menu.entryconfigure(index, label=self._get_text(key))
+
     def _setup_status_bar(self):
         """Setup top status bar with Word and Ghostscript indicators."""
         status_frame = ttk.Frame(self.root)
@@ -752,18 +860,13 @@ class MainWindow:
         self._word_indicator.bind("<Button-1>", lambda e: self._on_word_indicator_click())
         self._word_label.bind("<Button-1>", lambda e: self._on_word_indicator_click())
 
-        # Update indicator states
-        self._update_word_indicator()
-        self._update_gs_indicator()
+        # Update indicator states once the event loop is running
+        self._schedule_indicator_refresh()
 
     def _on_gs_indicator_click(self):
         """Handle click on Ghostscript indicator."""
         # Get current state to pass to dialog
-        gs_available = self.app_controller.check_and_setup_ghostscript()
-        gs_path = None
-        if gs_available:
-            self.app_controller._ensure_backends_initialized()
-            gs_path = self.app_controller._gs_wrapper.gs_path
+        gs_available, gs_path = self.app_controller.get_ghostscript_status()
 
         from .dialogs import GhostscriptSetupDialog
         dialog = GhostscriptSetupDialog(
@@ -774,101 +877,196 @@ class MainWindow:
             gs_path=gs_path
         )
         self.root.wait_window(dialog)
+        # Dialog may have installed or located Ghostscript; re-probe once
+        self._gs_available_cache = None
+        self._schedule_indicator_refresh()
+
+    def _schedule_indicator_refresh(self):
+        """Coalesce indicator refresh requests into one idle callback."""
+        if self._indicator_refresh_pending:
+            return
+        self._indicator_refresh_pending = True
+        self.root.after_idle(self._refresh_indicators)
+
+    def _refresh_indicators(self):
+        """Update both status indicators."""
+        self._indicator_refresh_pending = False
+        self._update_word_indicator()
+        self._update_gs_indicator()
+
+    def _start_probe(self, kind: str, probe):
+        """Run a backend probe off the UI thread.
+
+        Backend initialization may hit disk or spawn processes; the result
+        is posted to the event queue and applied by _drain_events.
+        """
+        if kind in self._probes_running:
+            return
+        self._probes_running.add(kind)
+        threading.Thread(target=self._run_probe, args=(kind, probe), daemon=True).start()
+        if not self._polling_events:
+            self._polling_events = True
+            self.root.after(_EVENT_POLL_MS, self._drain_events)
+
+    def _run_probe(self, kind: str, probe):
+        """Run a backend probe - called from background thread."""
+        try:
+            result = probe()
+        except Exception as e:
+            self.logger.warning(f"Backend probe '{kind}' failed: {e}")
+            result = None
+        self._event_queue.put_nowait((kind, result))
+
+    def _drain_events(self):
+        """Apply queued probe results - must be called from main thread."""
+        try:
+            while True:
+                kind, result = self._event_queue.get_nowait()
+                self._probes_running.discard(kind)
+                if kind == _GS_PROBE_EVENT:
+                    self._apply_gs_probe_result(result)
+                else:
+                    self._apply_backend_probe_result(result)
+        except queue.Empty:
+            pass
+
+        if self._probes_running:
+            self.root.after(_EVENT_POLL_MS, self._drain_events)
+        else:
+            self._polling_events = False
+
+    def _apply_gs_probe_result(self, result: Optional[Tuple[bool, Optional[str]]]):
+        """Store Ghostscript probe result - must be called from main thread."""
+        self._gs_available_cache, self._gs_path_cache = result or (False, None)
         self._update_gs_indicator()
 
+    def _apply_backend_probe_result(self, backend_status: Optional["BackendStatus"]):
+        """Store conversion backend probe result - must be called from main thread."""
+        if backend_status is None:
+            self._show_word_indicator('None')
+            return
+        self._backend_status = backend_status
+        self._backend_status_time = time.monotonic()
+        self._update_word_indicator()
+
     def _update_gs_indicator(self):
         """Update Ghostscript status indicator."""
-        gs_available = self.app_controller.check_and_setup_ghostscript()
-
-        if gs_available:
-            self._gs_indicator.configure(foreground='green')
-            # Get path from wrapper
-            self.app_controller._ensure_backends_initialized()
-            gs_path = self.app_controller._gs_wrapper.gs_path
-            tooltip_text = gs_path
+        if self._gs_available_cache is None:
+            self._start_probe(_GS_PROBE_EVENT, self.app_controller.get_ghostscript_status)
+            return
+
+        if self._gs_available_cache:
+            self._set_indicator_color(self._gs_indicator, 'green')
+            tooltip_text = self._gs_path_cache
         else:
-            self._gs_indicator.configure(foreground='red')
-            tooltip_text = self._get_text('ghostscript.status_not_found')
+            self._set_indicator_color(self._gs_indicator, 'red')
+            tooltip_text = self._get_text(_KEY_GS_NOT_FOUND)
 
         # Set tooltip
         self._set_tooltip(self._gs_status_frame, tooltip_text)
 
+    def _get_backend_status(self) -> "BackendStatus":
+        """Get conversion backend status, reusing a recent probe."""
+        now = time.monotonic()
+        if (self._backend_status is None
+                or now - self._backend_status_time >= _BACKEND_STATUS_TTL):
+            self._backend_status = self.app_controller.get_conversion_backend_status()
+            self._backend_status_time = now
+        return self._backend_status
+
+    def _invalidate_backend_status(self):
+        """Force the next backend status lookup to re-probe."""
+        self._backend_status = None
+
     def _on_word_indicator_click(self):
         """Handle click on Word backend indicator."""
-        backend_status = self.app_controller.get_conversion_backend_status()
-        active_backend = backend_status.get('active_backend', 'None')
-        word_available = backend_status.get('word', {}).get('available', False)
-        lo_available = backend_status.get('libreoffice', {}).get('available', False)
+        backend_status = self._get_backend_status()
+        active_backend = backend_status.active_backend
+        word_available = backend_status.word_available
+        lo_available = backend_status.libreoffice_available
 
         # Build status message
-        lines = [self._get_text('word.status_title')]
-        lines.append("")
-        lines.append(f"{self._get_text('word.active_backend')}: {active_backend}")
-        lines.append("")
-        lines.append(f"Microsoft Word: {'✓' if word_available else '✗'}")
-        lines.append(f"LibreOffice: {'✓' if lo_available else '✗'}")
-
-        from tkinter import messagebox
-        messagebox.showinfo(
-            self._get_text('word.status_title'),
-            "\n".join(lines),
-            parent=self.root
+        title = self._get_text(_KEY_WORD_STATUS_TITLE)
+        message = (
+            f"{title}\n\n"
+            f"{self._get_text(_KEY_WORD_ACTIVE_BACKEND)}: {active_backend}\n\n"
+            f"Microsoft Word: {'✓' if word_available else '✗'}\n"
+            f"LibreOffice: {'✓' if lo_available else '✗'}"
         )
 
+        messagebox.showinfo(title, message, parent=self.root)
+
     def _update_word_indicator(self):
         """Update Word backend status indicator."""
-        backend_status = self.app_controller.get_conversion_backend_status()
-        active_backend = backend_status.get('active_backend', 'None')
+        if (self._backend_status is None
+                or time.monotonic() - self._backend_status_time >= _BACKEND_STATUS_TTL):
+            self._start_probe(_BACKEND_PROBE_EVENT, self.app_controller.get_conversion_backend_status)
+            return
+        self._show_word_indicator(self._backend_status.active_backend)
 
+    def _show_word_indicator(self, active_backend: str):
+        """Show the Word indicator for the active conversion backend."""
         if active_backend != 'None':
-            self._word_indicator.configure(foreground='green')
-            tooltip_text = f"{self._get_text('word.active_backend')}: {active_backend}"
+            self._set_indicator_color(self._word_indicator, 'green')
+            tooltip_text = f"{self._get_text(_KEY_WORD_ACTIVE_BACKEND)}: {active_backend}"
         else:
-            self._word_indicator.configure(foreground='red')
-            tooltip_text = self._get_text('word.no_backend')
+            self._set_indicator_color(self._word_indicator, 'red')
+            tooltip_text = self._get_text(_KEY_WORD_NO_BACKEND)
 
         # Set tooltip
         self._set_tooltip(self._word_status_frame, tooltip_text)
 
+    def _set_indicator_color(self, indicator: tk.Label, color: str):
+        """Set indicator color, skipping the Tk call when it is unchanged."""
+        if getattr(indicator, '_fg', None) != color:
+            indicator.configure(foreground=color)
+            indicator._fg = color
+
+    def _setup_tooltip(self):
+        """Create the hidden tooltip window shared by all status indicators."""
+        self._tip_win = tk.Toplevel(self.root)
+        self._tip_win.wm_overrideredirect(True)
+        self._tip_win.withdraw()
+        ttk.Style().configure(
+            'Tooltip.TLabel',
+            background="#ffffe0",
+            relief='solid',
+            borderwidth=1,
+            padding=5
+        )
+        self._tip_label = ttk.Label(self._tip_win, style='Tooltip.TLabel')
+        self._tip_label.pack()
+
     def _set_tooltip(self, widget, text):
         """Set tooltip for widget."""
-        # Remove existing bindings
-        widget.unbind("<Enter>")
-        widget.unbind("<Leave>")
-
-        def show_tooltip(event):
-            if hasattr(widget, '_tooltip') and widget._tooltip:
-                return
-            tooltip = tk.Toplevel(widget)
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            label = ttk.Label(
-                tooltip,
-                text=text,
-                background="#ffffe0",
-                relief='solid',
-                borderwidth=1,
-                padding=5
-            )
-            label.pack()
-            widget._tooltip = tooltip
+        widget._tip_text = text
+        # Handlers read _tip_text at show time, so bind only once
+        if getattr(widget, '_tip_bound', False):
+            return
+        widget._tip_bound = True
+        widget.bind("<Enter>", self._show_tooltip)
+        widget.bind("<Leave>", self._hide_tooltip)
 
-        def hide_tooltip(event):
-            if hasattr(widget, '_tooltip') and widget._tooltip:
-                widget._tooltip.destroy()
-                widget._tooltip = None
+    def _show_tooltip(self, event):
+        """Show the shared tooltip with the hovered widget's text."""
+        self._tip_label.configure(text=getattr(event.widget, '_tip_text', ''))
+        self._tip_win.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+        self._tip_win.deiconify()
 
-        widget.bind("<Enter>", show_tooltip)
-        widget.bind("<Leave>", hide_tooltip)
+    def _hide_tooltip(self, event):
+        """Hide the shared tooltip."""
+        self._tip_win.withdraw()
 
     def _setup_tabs(self):
         """Setup tabbed interface."""
-        # Configure notebook style to add padding inside tab content area
-        style = ttk.Style()
-        style.configure('TNotebook.Tab', padding=[10, 5])
-        # Add tabmargins to prevent tab labels from being covered by content area shadow on macOS
-        # Format: [left, top, right, bottom] - increase bottom margin to create space between tabs and content
-        style.configure('TNotebook', tabmargins=[2, 5, 2, 20])
+        if not MainWindow._style_configured:
+            # Configure notebook style to add padding inside tab content area
+            style = ttk.Style()
+            style.configure('TNotebook.Tab', padding=[10, 5])
+            # Add tabmargins to prevent tab labels from being covered by content area shadow on macOS
+            # Format: [left, top, right, bottom] - increase bottom margin to create space between tabs and content
+            style.configure('TNotebook', tabmargins=[2, 5, 2, 20])
+            MainWindow._style_configured = True
 
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill='both', expand=True, padx=5, pady=5)
@@ -885,29 +1083,35 @@ class MainWindow:
             padding=(0, 10, 0, 0)
         )
 
-        # Compression tab
-        self.compression_tab = CompressionTab(
-            self.notebook,
-            self.app_controller,
-            self.language_manager
-        )
-        self.notebook.add(
-            self.compression_tab,
-            text=self._get_text('tabs.compression'),
-            padding=(0, 10, 0, 0)
-        )
+        # Compression and labeling tabs are built on first visit; until then
+        # the notebook holds an empty frame in their place
+        self.compression_tab: Optional[CompressionTab] = None
+        self.labeling_tab: Optional[LabelingTab] = None
+        self._lazy_tabs: Dict[ttk.Frame, Tuple[str, type]] = {}
+        for attr, tab_class, title_key in (('compression_tab', CompressionTab, 'tabs.compression'),
+                                           ('labeling_tab', LabelingTab, 'tabs.labeling')):
+            placeholder = ttk.Frame(self.notebook)
+            self.notebook.add(
+                placeholder,
+                text=self._get_text(title_key),
+                padding=(0, 10, 0, 0)
+            )
+            self._lazy_tabs[placeholder] = (attr, tab_class)
 
-        # Labeling tab
-        self.labeling_tab = LabelingTab(
-            self.notebook,
-            self.app_controller,
-            self.language_manager
-        )
-        self.notebook.add(
-            self.labeling_tab,
-            text=self._get_text('tabs.labeling'),
-            padding=(0, 10, 0, 0)
-        )
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+
+    def _on_tab_changed(self, event=None):
+        """Build a lazily created tab the first time it is selected."""
+        if not self._lazy_tabs:
+            return
+        placeholder = self.notebook.nametowidget(self.notebook.select())
+        entry = self._lazy_tabs.pop(placeholder, None)
+        if entry is None:
+            return
+        attr, tab_class = entry
+        tab = tab_class(placeholder, self.app_controller, self.language_manager)
+        tab.pack(fill='both', expand=True)
+        setattr(self, attr, tab)
 
     def _restore_window_geometry(self):
         """Restore saved window geometry."""
@@ -926,10 +1130,10 @@ class MainWindow:
         """Save current window geometry."""
         try:
             geometry = self.root.geometry()
-            # Parse geometry string: WxH+X+Y
-            size, pos = geometry.split('+', 1)
-            width, height = map(int, size.split('x'))
-            x, y = map(int, pos.split('+'))
+            match = _GEOMETRY_RE.match(geometry)
+            if not match:
+                raise ValueError(f"Unexpected geometry string: {geometry}")
+            width, height, x, y = map(int, match.groups())
 
             self.app_controller.update_settings(
                 window_width=width,
@@ -945,8 +1149,18 @@ class MainWindow:
         settings = self.app_controller.get_settings()
 
         def on_save(new_settings):
-            for key, value in new_settings.items():
-                self.app_controller.update_settings(**{key: value})
+            self.app_controller.update_settings(**new_settings)
+            # Re-probe Ghostscript if its configured path changed
+            if ('ghostscript_path' in new_settings
+                    and new_settings['ghostscript_path'] != settings.get('ghostscript_path')):
+                self.app_controller.refresh_ghostscript()
+                self._gs_available_cache = None
+            # Re-probe conversion backends if their configuration changed
+            if any(key in new_settings and new_settings[key] != settings.get(key)
+                   for key in ('libreoffice_path', 'preferred_conversion_backend')):
+                self.app_controller.refresh_libreoffice()
+            self._invalidate_backend_status()
+            self._schedule_indicator_refresh()
             # Handle language change
             if new_settings.get('language') != settings.get('language'):
                 self._change_language(new_settings['language'])
@@ -966,29 +1180,31 @@ class MainWindow:
     def _change_language(self, language_code: str):
         """Change application language."""
         self.app_controller.set_language(language_code)
+        self._text_cache.clear()
         self._update_all_translations()
 
     def _update_all_translations(self):
         """Update all UI text after language change."""
         # Update window title
-        self.root.title(self._get_text('app_title'))
+        self.root.title(self._get_text(_KEY_APP_TITLE))
 
         # Update tab titles
-        self.notebook.tab(0, text=self._get_text('tabs.conversion'))
-        self.notebook.tab(1, text=self._get_text('tabs.compression'))
-        self.notebook.tab(2, text=self._get_text('tabs.labeling'))
+        for index, key in enumerate(_TAB_TITLE_KEYS):
+            self.notebook.tab(index, text=self._get_text(key))
 
         # Update tabs
-        self.conversion_tab.update_translations()
-        self.compression_tab.update_translations()
-        self.labeling_tab.update_translations()
+        for tab in (self.conversion_tab, self.compression_tab, self.labeling_tab):
+            if tab is not None:
+                tab.update_translations()
 
-        # Recreate menu (simplest way to update)
-        self._setup_menu()
+        # Update menu labels
+        self._retranslate_menu()
+
+        # Update indicator tooltips
+        self._schedule_indicator_refresh()
 
     def _show_about(self):
         """Show about dialog."""
-        from tkinter import messagebox
         messagebox.showinfo(
             self._get_text('menu.about'),
             "Document Processor GUI\nVersion 1.0\n\nA unified tool for document processing.",
@@ -999,7 +1215,6 @@ class MainWindow:
         """Handle window closing event."""
         # Check if processing is in progress
         if self.app_controller.is_processing:
-            from tkinter import messagebox
             if not messagebox.askyesno(
                 "Confirm Exit",
                 "Processing is in progress. Are you sure you want to exit?",
@@ -3,26 +3,92 @@
 import tkinter as tk
 from tkinter import ttk
 import logging
-from typing import Optional, Callable, TYPE_CHECKING
+from typing import Optional, Callable, List, Tuple, TYPE_CHECKING
+from collections import OrderedDict
 from pathlib import Path
+import bisect
+import concurrent.futures
 import io
 
 if TYPE_CHECKING:
     from ..core.language_manager import LanguageManager
 
-# Try to import PIL for image handling
-try:
-    from PIL import Image, ImageTk
-    HAS_PIL = True
-except ImportError:
-    HAS_PIL = False
+# PIL, PyMuPDF and OpenCV are imported on first preview rather than at
+# module load, keeping them off the GUI startup path. None means "not tried".
+Image = ImageTk = fitz = cv2 = np = None
+_HAS_PIL: Optional[bool] = None
+_HAS_FITZ: Optional[bool] = None
+_HAS_CV2: Optional[bool] = None
 
-# Try to import fitz (PyMuPDF) for PDF rendering
-try:
-    import fitz
-    HAS_FITZ = True
-except ImportError:
-    HAS_FITZ = False
+
+def _ensure_pil() -> bool:
+    """Import PIL for image handling; return True if available."""
+    global Image, ImageTk, _HAS_PIL
+    if _HAS_PIL is None:
+        try:
+            from PIL import Image, ImageTk
+            _HAS_PIL = True
+        except ImportError:
+            _HAS_PIL = False
+    return _HAS_PIL
+
+
+def _ensure_fitz() -> bool:
+    """Import fitz (PyMuPDF) for PDF rendering; return True if available."""
+    global fitz, _HAS_FITZ
+    if _HAS_FITZ is None:
+        try:
+            import fitz
+            _HAS_FITZ = True
+        except ImportError:
+            _HAS_FITZ = False
+    return _HAS_FITZ
+
+
+def _ensure_cv2() -> bool:
+    """Import OpenCV for faster image resizing (optional); return True if available."""
+    global cv2, np, _HAS_CV2
+    if _HAS_CV2 is None:
+        try:
+            import cv2
+            import numpy as np
+            _HAS_CV2 = True
+        except ImportError:
+            _HAS_CV2 = False
+    return _HAS_CV2
+
+# Number of rendered pages kept per document for instant page flips
+_PAGE_CACHE_SIZE = 16
+# Tk keeps 4 bytes per pixel, so this bounds the page cache to ~256 MB
+_PAGE_CACHE_MAX_PIXELS = 64 * 1024 * 1024
+# Unscaled callback-rendered pages kept so zoom changes only rescale them
+_SOURCE_CACHE_SIZE = 8
+
+# Discrete zoom levels; a small key set keeps the page cache hit rate high
+_ZOOM_STEPS = (0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 2.0, 3.0, 4.0)
+
+# Units for BeforeAfterPreview file sizes, in steps of 1024
+_SIZE_UNITS = ("B", "KB", "MB")
+
+# Delay before rendering after page/zoom clicks, so rapid clicks render once
+_RENDER_DEBOUNCE_MS = 80
+
+# PyMuPDF does not support concurrent use, so all of its work (opening,
+# rasterizing, prefetching and closing documents) runs on one thread that
+# every panel shares
+_render_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+
+def get_render_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the shared render thread executor, creating it on first use.
+
+    Must be called from the Tk thread.
+    """
+    global _render_executor
+    if _render_executor is None:
+        _render_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pdf-render")
+    return _render_executor
 
 
 class PreviewPanel(ttk.Frame):
@@ -52,8 +118,22 @@ class PreviewPanel(ttk.Frame):
         self._total_pages = 0
         self._zoom_level = 1.0
         self._image_ref: Optional["ImageTk.PhotoImage"] = None
+        # True while the page image item (not the placeholder) is visible
+        self._showing_image = False
         self._pdf_doc: Optional["fitz.Document"] = None
         self._on_page_render: Optional[Callable[[int], Optional[bytes]]] = None
+        # LRU of displayed images keyed by (page, zoom): (photo, width, height)
+        self._page_cache: "OrderedDict[Tuple[int, float], Tuple[ImageTk.PhotoImage, int, int]]" = OrderedDict()
+        self._page_cache_pixels = 0
+        # Page number -> unzoomed image from the render callback. Only the
+        # render thread touches it; closing a document swaps in a new dict.
+        self._source_cache: "OrderedDict[int, Image.Image]" = OrderedDict()
+        # Pages are rasterized off the Tk thread; the token drops stale results
+        self._render_token = 0
+        self._render_after_id: Optional[str] = None
+        # Speculative renders of neighbouring pages, tagged with the document
+        self._document_token = 0
+        self._prefetch_futures: List[concurrent.futures.Future] = []
 
         self._setup_ui()
 
@@ -87,12 +167,15 @@ class PreviewPanel(ttk.Frame):
         self.preview_frame.grid_rowconfigure(0, weight=1)
         self.preview_frame.grid_columnconfigure(0, weight=1)
 
-        # Placeholder message
+        # Page image and placeholder message; both items live for the widget's
+        # lifetime and are toggled via their state
+        self._canvas_image_id = self.canvas.create_image(0, 0, anchor='nw', state='hidden')
         self._placeholder_id = self.canvas.create_text(
             self.preview_size // 2,
             self.preview_size // 2,
             text="No preview available",
-            fill='gray'
+            fill='gray',
+            font=('TkDefaultFont', 10)
         )
 
         # Control bar
@@ -127,6 +210,9 @@ class PreviewPanel(ttk.Frame):
         self.fit_btn = ttk.Button(control_frame, text="Fit", width=5, command=self._fit_to_window)
         self.fit_btn.pack(side='left', padx=5)
 
+        self._controls = (self.prev_btn, self.next_btn, self.zoom_in_btn, self.zoom_out_btn, self.fit_btn)
+        self._controls_enabled: Optional[bool] = None
+
         # Initially disable controls
         self._update_controls_state(False)
 
@@ -137,12 +223,12 @@ class PreviewPanel(ttk.Frame):
 
     def _update_controls_state(self, enabled: bool):
         """Update control buttons state."""
-        state = 'normal' if enabled else 'disabled'
-        self.prev_btn.configure(state=state)
-        self.next_btn.configure(state=state)
-        self.zoom_in_btn.configure(state=state)
-        self.zoom_out_btn.configure(state=state)
-        self.fit_btn.configure(state=state)
+        if enabled == self._controls_enabled:
+            return
+        self._controls_enabled = enabled
+        state = ['!disabled'] if enabled else ['disabled']
+        for control in self._controls:
+            control.state(state)
 
     def _on_mousewheel(self, event):
         """Handle mouse wheel for scrolling."""
@@ -154,13 +240,16 @@ class PreviewPanel(ttk.Frame):
     def load_file(self, file_path: str) -> bool:
         """Load a file for preview.
 
+        The document is opened on the render thread; open errors are shown
+        in the panel once it finishes.
+
         Args:
             file_path: Path to file to preview
 
         Returns:
-            True if loaded successfully
+            True if the file exists and loading has started
         """
-        if not HAS_FITZ:
+        if not _ensure_fitz():
             self._show_placeholder("PyMuPDF not available")
             return False
 
@@ -169,25 +258,43 @@ class PreviewPanel(ttk.Frame):
             self._show_placeholder("File not found")
             return False
 
+        # Close previous document
+        self._close_document()
+        self._current_file = str(path)
+        self._show_placeholder("Loading...")
+
+        token = self._document_token
+        future = get_render_executor().submit(self._open_document, str(path))
+        future.add_done_callback(lambda f: self._call_on_ui(self._on_document_opened, token, f))
+        return True
+
+    @staticmethod
+    def _open_document(file_path: str) -> Tuple["fitz.Document", int]:
+        """Open a PDF and count its pages - called from render thread."""
+        pdf_doc = fitz.open(file_path)
+        return pdf_doc, len(pdf_doc)
+
+    def _on_document_opened(self, token: int, future: "concurrent.futures.Future"):
+        """Show the first page of an opened document - must be called from main thread."""
         try:
-            # Close previous document
-            self._close_document()
-
-            # Open new document
-            self._pdf_doc = fitz.open(str(path))
-            self._current_file = str(path)
-            self._current_page = 0
-            self._total_pages = len(self._pdf_doc)
+            pdf_doc, total_pages = future.result()
+        except Exception as e:
+            if token == self._document_token:
+                self.logger.error(f"Failed to load preview: {e}")
+                self._show_placeholder(f"Cannot preview: {e}")
+            return
 
-            self._update_controls_state(True)
-            self._render_current_page()
+        if token != self._document_token:
+            # Another file was loaded meanwhile
+            get_render_executor().submit(self._close_pdf, pdf_doc)
+            return
 
-            return True
+        self._pdf_doc = pdf_doc
+        self._current_page = 0
+        self._total_pages = total_pages
 
-        except Exception as e:
-            self.logger.error(f"Failed to load preview: {e}")
-            self._show_placeholder(f"Cannot preview: {e}")
-            return False
+        self._update_controls_state(True)
+        self._render_current_page()
 
     def load_from_bytes(self, data: bytes, file_type: str = "png",
                         total_pages: int = 1) -> bool:
@@ -201,7 +308,7 @@ class PreviewPanel(ttk.Frame):
         Returns:
             True if loaded successfully
         """
-        if not HAS_PIL:
+        if not _ensure_pil():
             self._show_placeholder("PIL not available")
             return False
 
@@ -211,6 +318,8 @@ class PreviewPanel(ttk.Frame):
 
             # Load image from bytes
             image = Image.open(io.BytesIO(data))
+            image.load()
+            self._source_cache[0] = image
             self._display_image(image)
 
             # Set pagination state
@@ -227,84 +336,246 @@ class PreviewPanel(ttk.Frame):
             return False
 
     def _render_current_page(self):
-        """Render the current page of the loaded PDF or via callback."""
-        if not HAS_PIL:
+        """Render the current page of the loaded PDF or via callback.
+
+        Rasterization runs on a background thread; the result is displayed
+        from the Tk thread once it is ready.
+        """
+        if not _ensure_pil():
             return
 
-        # Try callback-based rendering first (for PNG preview mode)
-        if self._on_page_render:
-            try:
-                data = self._on_page_render(self._current_page)
-                if data:
-                    image = Image.open(io.BytesIO(data))
-                    self._display_image(image)
-                    self.page_label.configure(
-                        text=f"{self._current_page + 1} / {self._total_pages}")
-                    return
-            except Exception as e:
-                self.logger.error(f"Failed to render page via callback: {e}")
+        # Invalidate any render still in flight for a previous page or zoom
+        self._render_token += 1
 
-        # Fall back to PDF document rendering
-        if not self._pdf_doc or not HAS_FITZ:
+        cached = self._page_cache.get(self._page_cache_key())
+        if cached is not None:
+            self._page_cache.move_to_end(self._page_cache_key())
+            self._show_photo(*cached)
+            self.page_label.configure(text=f"{self._current_page + 1} / {self._total_pages}")
             return
 
-        try:
-            page = self._pdf_doc[self._current_page]
+        render_callback = self._on_page_render
+        pdf_doc = self._pdf_doc
+        if not render_callback and not pdf_doc:
+            return
 
-            # Calculate zoom matrix
-            zoom = self._zoom_level * 2  # Base zoom for better quality
+        # The page the user asked for goes ahead of queued speculative renders
+        self._cancel_prefetch()
+
+        # Keep the previous image on screen until the new page arrives
+        self.page_label.configure(text=f"{self._current_page + 1} / {self._total_pages}")
+
+        token = self._render_token
+        key = self._page_cache_key()
+        future = get_render_executor().submit(
+            self._rasterize_page, render_callback, pdf_doc, self._current_page, self._zoom_level,
+            self._source_cache
+        )
+        future.add_done_callback(lambda f: self._call_on_ui(self._on_page_rendered, token, key, f))
+
+    def _rasterize_page(self, render_callback: Optional[Callable[[int], Optional[bytes]]],
+                        pdf_doc: Optional["fitz.Document"], page_num: int,
+                        zoom_level: float,
+                        source_cache: "OrderedDict[int, Image.Image]") -> Optional["Image.Image"]:
+        """Render a page to a zoomed PIL Image - called from render thread."""
+        image = None
+
+        # Try callback-based rendering first (for PNG preview mode). Its output
+        # does not depend on zoom, so each page is rendered once and rescaled.
+        if render_callback:
+            image = source_cache.get(page_num)
+            if image is not None:
+                source_cache.move_to_end(page_num)
+            else:
+                try:
+                    data = render_callback(page_num)
+                    if data:
+                        image = Image.open(io.BytesIO(data))
+                        image.load()
+                        source_cache[page_num] = image
+                        if len(source_cache) > _SOURCE_CACHE_SIZE:
+                            source_cache.popitem(last=False)
+                except Exception as e:
+                    self.logger.error(f"Failed to render page via callback: {e}")
+
+        # Fall back to PDF document rendering
+        if image is None:
+            if not pdf_doc:
+                return None
+
+            page = pdf_doc[page_num]
+
+            # Calculate zoom matrix; MuPDF renders straight at display size
+            zoom = zoom_level * 2  # Base zoom for better quality
             mat = fitz.Matrix(zoom, zoom)
 
             # Render page to pixmap
             pix = page.get_pixmap(matrix=mat)
+            # Trim MuPDF's resource store so long sessions stay bounded
+            fitz.TOOLS.store_shrink(50)
 
-            # Convert to PIL Image
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+            # Convert to PIL Image; samples_mv is a view of the pixmap buffer,
+            # avoiding the intermediate bytes copy made by pix.samples
+            return Image.frombytes("RGB", (pix.width, pix.height), pix.samples_mv)
 
-            self._display_image(img)
+        return self._scale_image(image, zoom_level)
 
-            # Update page label
-            self.page_label.configure(text=f"{self._current_page + 1} / {self._total_pages}")
+    def _call_on_ui(self, func: Callable, *args):
+        """Schedule func on the Tk thread - called from render thread."""
+        try:
+            self.after(0, func, *args)
+        except (tk.TclError, RuntimeError):
+            pass  # Widget destroyed while rendering
+
+    def _on_page_rendered(self, token: int, key: Tuple[int, float],
+                          future: "concurrent.futures.Future"):
+        """Display a rendered page - must be called from main thread."""
+        if token != self._render_token:
+            return  # Page, zoom or document changed since this render started
 
+        try:
+            image = future.result()
         except Exception as e:
             self.logger.error(f"Failed to render page: {e}")
             self._show_placeholder(f"Render error: {e}")
+            return
+
+        if image is not None:
+            self._display_image(image, scaled=True, key=key)
+            self._prefetch_neighbours()
 
-    def _display_image(self, image: "Image.Image"):
-        """Display a PIL Image on the canvas."""
-        if not HAS_PIL:
+    def _prefetch_neighbours(self):
+        """Render the pages either side of the current one into the cache."""
+        render_callback = self._on_page_render
+        pdf_doc = self._pdf_doc
+        if not render_callback and not pdf_doc:
             return
+        token = self._document_token
+        for page_num in (self._current_page + 1, self._current_page - 1):
+            if not 0 <= page_num < self._total_pages:
+                continue
+            key = (page_num, round(self._zoom_level, 3))
+            if key in self._page_cache:
+                continue
+            future = get_render_executor().submit(
+                self._rasterize_page, render_callback, pdf_doc, page_num, self._zoom_level,
+                self._source_cache
+            )
+            future.add_done_callback(
+                lambda f, key=key: self._call_on_ui(self._on_page_prefetched, token, key, f))
+            self._prefetch_futures.append(future)
+
+    def _on_page_prefetched(self, token: int, key: Tuple[int, float],
+                            future: "concurrent.futures.Future"):
+        """Cache a prefetched page - must be called from main thread."""
+        if future in self._prefetch_futures:
+            self._prefetch_futures.remove(future)
+        if future.cancelled() or token != self._document_token or key in self._page_cache:
+            return
+        try:
+            image = future.result()
+        except Exception as e:
+            self.logger.debug(f"Failed to prefetch page {key[0]}: {e}")
+            return
+        if image is not None:
+            self._cache_photo(key, ImageTk.PhotoImage(image), image.width, image.height)
+
+    def _cancel_prefetch(self):
+        """Cancel speculative renders that have not started yet."""
+        for future in self._prefetch_futures:
+            future.cancel()
+        self._prefetch_futures.clear()
+
+    @staticmethod
+    def _scale_image(image: "Image.Image", zoom_level: float) -> "Image.Image":
+        """Resize an image by the zoom level."""
+        width = int(image.width * zoom_level)
+        height = int(image.height * zoom_level)
+        if width == image.width and height == image.height:
+            return image
+        if image.mode in ('L', 'RGB', 'RGBA') and _ensure_cv2():
+            # Palette and other modes can't be interpolated channel-wise
+            interpolation = cv2.INTER_AREA if width < image.width else cv2.INTER_LANCZOS4
+            return Image.fromarray(cv2.resize(np.asarray(image), (width, height),
+                                              interpolation=interpolation))
+        return image.resize((width, height), Image.Resampling.LANCZOS)
+
+    def _display_image(self, image: "Image.Image", scaled: bool = False,
+                       key: Optional[Tuple[int, float]] = None):
+        """Display a PIL Image on the canvas.
 
-        # Apply zoom to the image
-        width = int(image.width * self._zoom_level)
-        height = int(image.height * self._zoom_level)
+        Args:
+            image: Image to display
+            scaled: True if the zoom level has already been applied
+            key: Page cache key the image was rendered for (defaults to the current one)
+        """
+        if not _ensure_pil():
+            return
 
-        # Resize if needed
-        if width != image.width or height != image.height:
-            image = image.resize((width, height), Image.Resampling.LANCZOS)
+        # Apply zoom to the image
+        if not scaled:
+            image = self._scale_image(image, self._zoom_level)
+        width, height = image.width, image.height
 
         # Convert to PhotoImage
-        self._image_ref = ImageTk.PhotoImage(image)
+        photo = ImageTk.PhotoImage(image)
+        self._cache_photo(key or self._page_cache_key(), photo, width, height)
 
-        # Clear canvas
-        self.canvas.delete('all')
+        self._show_photo(photo, width, height)
 
-        # Display image
-        self.canvas.create_image(0, 0, anchor='nw', image=self._image_ref)
+    def _cache_photo(self, key: Tuple[int, float], photo: "ImageTk.PhotoImage",
+                     width: int, height: int):
+        """Store a rendered page, evicting least recently used pages.
+
+        PhotoImages are cached rather than PIL images so a hit skips the
+        copy into Tk; eviction drops the last reference and frees it.
+        """
+        self._evict_photo(key)
+        self._page_cache[key] = (photo, width, height)
+        self._page_cache_pixels += width * height
+        while len(self._page_cache) > 1 and (
+                len(self._page_cache) > _PAGE_CACHE_SIZE
+                or self._page_cache_pixels > _PAGE_CACHE_MAX_PIXELS):
+            self._evict_photo(next(iter(self._page_cache)))
+
+    def _evict_photo(self, key: Tuple[int, float]):
+        """Remove a page from the cache."""
+        entry = self._page_cache.pop(key, None)
+        if entry is not None:
+            self._page_cache_pixels -= entry[1] * entry[2]
+
+    def _page_cache_key(self) -> Tuple[int, float]:
+        """Get the page cache key for the current page and zoom."""
+        return (self._current_page, round(self._zoom_level, 3))
+
+    def _show_photo(self, photo: "ImageTk.PhotoImage", width: int, height: int):
+        """Display a prepared PhotoImage on the canvas."""
+        self.canvas.itemconfigure(self._canvas_image_id, image=photo)
+        if not self._showing_image:
+            # Switching from placeholder to image mode
+            self.canvas.itemconfigure(self._placeholder_id, state='hidden')
+            self.canvas.itemconfigure(self._canvas_image_id, state='normal')
+            self._showing_image = True
+        # Drop the previous image only once the item no longer shows it
+        self._image_ref = photo
 
         # Update scroll region
         self.canvas.configure(scrollregion=(0, 0, width, height))
 
+    def show_message(self, message: str):
+        """Replace the preview with a status message.
+
+        Args:
+            message: Message to display
+        """
+        self._close_document()
+        self._show_placeholder(message)
+
     def _show_placeholder(self, message: str = "No preview available"):
         """Show placeholder message."""
-        self.canvas.delete('all')
-        self._placeholder_id = self.canvas.create_text(
-            self.preview_size // 2,
-            self.preview_size // 2,
-            text=message,
-            fill='gray',
-            font=('TkDefaultFont', 10)
-        )
+        self.canvas.itemconfigure(self._canvas_image_id, state='hidden', image='')
+        self.canvas.itemconfigure(self._placeholder_id, text=message, state='normal')
+        self._showing_image = False
         self.canvas.configure(scrollregion=(0, 0, self.preview_size, self.preview_size))
         self._update_controls_state(False)
 
@@ -312,22 +583,43 @@ class PreviewPanel(ttk.Frame):
         """Go to previous page."""
         if self._current_page > 0:
             self._current_page -= 1
-            self._render_current_page()
+            self._schedule_render()
 
     def _next_page(self):
         """Go to next page."""
         if self._current_page < self._total_pages - 1:
             self._current_page += 1
-            self._render_current_page()
+            self._schedule_render()
+
+    def _schedule_render(self):
+        """Render the current page once page/zoom changes settle."""
+        self.page_label.configure(text=f"{self._current_page + 1} / {self._total_pages}")
+        # A render still in flight is for the old page or zoom; drop it on arrival
+        self._render_token += 1
+        self._cancel_scheduled_render()
+        self._render_after_id = self.after(_RENDER_DEBOUNCE_MS, self._run_scheduled_render)
+
+    def _run_scheduled_render(self):
+        """Run a debounced render."""
+        self._render_after_id = None
+        self._render_current_page()
+
+    def _cancel_scheduled_render(self):
+        """Cancel a pending debounced render."""
+        if self._render_after_id is not None:
+            self.after_cancel(self._render_after_id)
+            self._render_after_id = None
 
     def _zoom_in(self):
         """Zoom in."""
-        self._zoom_level = min(self._zoom_level * 1.25, 4.0)
+        index = bisect.bisect_right(_ZOOM_STEPS, self._zoom_level)
+        self._zoom_level = _ZOOM_STEPS[min(index, len(_ZOOM_STEPS) - 1)]
         self._update_zoom()
 
     def _zoom_out(self):
         """Zoom out."""
-        self._zoom_level = max(self._zoom_level / 1.25, 0.25)
+        index = bisect.bisect_left(_ZOOM_STEPS, self._zoom_level) - 1
+        self._zoom_level = _ZOOM_STEPS[max(index, 0)]
         self._update_zoom()
 
     def _fit_to_window(self):
@@ -340,7 +632,7 @@ class PreviewPanel(ttk.Frame):
         self.zoom_label.configure(text=f"{int(self._zoom_level * 100)}%")
 
         if self._pdf_doc or self._on_page_render:
-            self._render_current_page()
+            self._schedule_render()
 
         if self.on_zoom_changed:
             self.on_zoom_changed(self._zoom_level)
@@ -349,9 +641,9 @@ class PreviewPanel(ttk.Frame):
         """Set zoom level.
 
         Args:
-            zoom_level: Zoom level (1.0 = 100%)
+            zoom_level: Zoom level (1.0 = 100%), snapped to the nearest step
         """
-        self._zoom_level = max(0.25, min(4.0, zoom_level))
+        self._zoom_level = min(_ZOOM_STEPS, key=lambda step: abs(step - zoom_level))
         self._update_zoom()
 
     def get_zoom(self) -> float:
@@ -371,6 +663,8 @@ class PreviewPanel(ttk.Frame):
             callback: Function that takes page_num (0-indexed) and returns PNG bytes
         """
         self._on_page_render = callback
+        if callback:
+            self._prefetch_neighbours()
 
     def clear(self):
         """Clear the preview."""
@@ -379,11 +673,13 @@ class PreviewPanel(ttk.Frame):
 
     def _close_document(self):
         """Close the current document."""
+        self._cancel_scheduled_render()
+        self._cancel_prefetch()
+        self._render_token += 1
+        self._document_token += 1
         if self._pdf_doc:
-            try:
-                self._pdf_doc.close()
-            except Exception:
-                pass
+            # Close on the render thread, after any page it is still rendering
+            get_render_executor().submit(self._close_pdf, self._pdf_doc)
             self._pdf_doc = None
 
         self._current_file = None
@@ -391,6 +687,18 @@ class PreviewPanel(ttk.Frame):
         self._total_pages = 0
         self._image_ref = None
         self._on_page_render = None
+        self._page_cache.clear()
+        self._page_cache_pixels = 0
+        self._source_cache = OrderedDict()
+
+    @staticmethod
+    def _close_pdf(pdf_doc: "fitz.Document"):
+        """Close a PDF document and release MuPDF's cached resources."""
+        try:
+            pdf_doc.close()
+            fitz.TOOLS.store_shrink(100)
+        except Exception:
+            pass
 
     def destroy(self):
         """Clean up resources when widget is destroyed."""
@@ -503,12 +811,11 @@ class BeforeAfterPreview(ttk.Frame):
 
     def _format_size(self, size_bytes: int) -> str:
         """Format file size for display."""
-        if size_bytes < 1024:
+        # Each unit is 2**10 of the previous one, so the bit length picks it
+        unit = min(max(size_bytes.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+        if unit == 0:
             return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        else:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
+        return f"{size_bytes / (1 << (unit * 10)):.1f} {_SIZE_UNITS[unit]}"
 
     def clear(self):
         """Clear both previews."""
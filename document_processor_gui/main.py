@@ -8,7 +8,6 @@ from pathlib import Path
 
 from .config import ConfigurationManager
 from .core import ApplicationController, ErrorHandler, LanguageManager
-from .gui import MainWindow
 
 
 def setup_logging():
@@ -23,6 +22,7 @@ def main():
     """Main application entry point."""
     setup_logging()
     logger = logging.getLogger(__name__)
+    root = None
 
     try:
         logger.info("Starting Document Processor GUI")
@@ -38,6 +38,9 @@ def main():
         # Initialize error handler with language manager
         error_handler = ErrorHandler(language_manager=language_manager)
 
+        # Imported here so configuration and translations load before the GUI modules
+        from .gui import MainWindow
+
         # Create main application
         root = tk.Tk()
         root.withdraw()  # Hide root window initially
@@ -70,7 +73,9 @@ def main():
         logger.exception("Application startup failed")
         # Show error dialog if GUI initialization fails
         try:
-            root = tk.Tk()
+            # Reuse the existing Tk interpreter rather than starting a second one
+            if root is None:
+                root = tk.Tk()
             root.withdraw()
             messagebox.showerror(
                 "启动错误 / Startup Error",
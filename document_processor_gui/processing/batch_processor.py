@@ -1,14 +1,24 @@
 """Batch processing coordination module."""
 
-import json
+import io
 import logging
-from dataclasses import dataclass, asdict, field
+import time
+from dataclasses import dataclass, field, fields
 from typing import List, Dict, Any, Optional, Callable
 from pathlib import Path
 from datetime import datetime
 from enum import Enum
 
-from .models import ProcessingResults, ProcessingResult
+from ..core.json_io import read_json, write_json
+from .models import DATACLASS_SLOTS, ProcessingResults, ProcessingResult
+
+# Delay before the first retry pass; doubled on each further pass
+_RETRY_BACKOFF_SECONDS = 0.1
+
+
+def _shallow_dict(obj: Any) -> Dict[str, Any]:
+    """Map a dataclass instance's field names to their values, without copying."""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
 
 
 class BatchMode(Enum):
@@ -17,7 +27,7 @@ class BatchMode(Enum):
     STOP_ON_FAILURE = "stop_on_failure"      # Stop immediately on first failure
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BatchConfiguration:
     """Configuration for a batch processing job."""
 
@@ -43,7 +53,12 @@ class BatchConfiguration:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        # Shallow copies are enough for these JSON-native fields and avoid
+        # the deepcopy that asdict() does on every value
+        data = _shallow_dict(self)
+        data['files'] = list(self.files)
+        data['settings'] = dict(self.settings)
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BatchConfiguration":
@@ -51,7 +66,7 @@ class BatchConfiguration:
         return cls(**data)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BatchSummary:
     """Summary of a batch processing job."""
 
@@ -82,48 +97,51 @@ class BatchSummary:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        data = _shallow_dict(self)
+        data['failed_file_details'] = [dict(d) for d in self.failed_file_details]
+        return data
 
     def to_report(self) -> str:
         """Generate a text report."""
-        lines = [
-            "=" * 60,
-            f"Batch Processing Report: {self.name or 'Unnamed'}",
-            "=" * 60,
-            f"Processing Type: {self.processing_type}",
-            f"Started: {self.started_at}",
-            f"Completed: {self.completed_at}",
-            "",
-            "Statistics:",
-            f"  Total Files: {self.total_files}",
-            f"  Successful: {self.successful_files}",
-            f"  Failed: {self.failed_files}",
-            f"  Skipped: {self.skipped_files}",
-            "",
-            f"Total Time: {self.total_time_seconds:.1f} seconds",
-            f"Average Time per File: {self.average_time_per_file:.2f} seconds",
-        ]
+        rule = "=" * 60
+        buf = io.StringIO()
+        buf.write(
+            f"{rule}\n"
+            f"Batch Processing Report: {self.name or 'Unnamed'}\n"
+            f"{rule}\n"
+            f"Processing Type: {self.processing_type}\n"
+            f"Started: {self.started_at}\n"
+            f"Completed: {self.completed_at}\n"
+            "\n"
+            "Statistics:\n"
+            f"  Total Files: {self.total_files}\n"
+            f"  Successful: {self.successful_files}\n"
+            f"  Failed: {self.failed_files}\n"
+            f"  Skipped: {self.skipped_files}\n"
+            "\n"
+            f"Total Time: {self.total_time_seconds:.1f} seconds\n"
+            f"Average Time per File: {self.average_time_per_file:.2f} seconds\n"
+        )
 
         if self.total_size_before > 0:
-            lines.extend([
-                "",
-                "Size Information:",
-                f"  Total Size Before: {self._format_size(self.total_size_before)}",
-                f"  Total Size After: {self._format_size(self.total_size_after)}",
-                f"  Total Reduction: {self._format_size(self.total_reduction_bytes)}",
-                f"  Average Reduction: {self.average_reduction_percent:.1f}%",
-            ])
+            buf.write(
+                "\n"
+                "Size Information:\n"
+                f"  Total Size Before: {self._format_size(self.total_size_before)}\n"
+                f"  Total Size After: {self._format_size(self.total_size_after)}\n"
+                f"  Total Reduction: {self._format_size(self.total_reduction_bytes)}\n"
+                f"  Average Reduction: {self.average_reduction_percent:.1f}%\n"
+            )
 
         if self.failed_file_details:
-            lines.extend([
-                "",
-                "Failed Files:",
-            ])
-            for detail in self.failed_file_details:
-                lines.append(f"  - {detail.get('file', 'Unknown')}: {detail.get('error', 'Unknown error')}")
+            buf.write("\nFailed Files:\n")
+            buf.writelines(
+                f"  - {detail.get('file', 'Unknown')}: {detail.get('error', 'Unknown error')}\n"
+                for detail in self.failed_file_details
+            )
 
-        lines.append("=" * 60)
-        return "\n".join(lines)
+        buf.write(rule)
+        return buf.getvalue()
 
     def _format_size(self, size_bytes: int) -> str:
         """Format file size for display."""
@@ -182,46 +200,52 @@ class BatchProcessor:
         )
 
         try:
-            mode = BatchMode(config.mode)
-            files_to_process = config.files.copy()
-            all_results: List[ProcessingResult] = []
+            # The mode is fixed for the whole batch; resolve it once
+            stop_on_failure = BatchMode(config.mode) is BatchMode.STOP_ON_FAILURE
+            # Insertion-ordered dict: O(1) removal while keeping file order
+            files_to_process = dict.fromkeys(config.files)
+            all_results = ProcessingResults()
 
-            # Process files
+            # Process files; only failures stay pending for the next pass
             retry_count = 0
             while files_to_process and not self._should_stop:
                 # Call the processing function
                 results = process_func(
-                    files_to_process,
+                    list(files_to_process),
                     config.output_dir,
                     config.settings,
                     progress_callback
                 )
 
                 # Collect results
+                failed_this_pass: List[ProcessingResult] = []
                 for result in results.results:
                     if result.success:
-                        all_results.append(result)
-                        if result.input_file in files_to_process:
-                            files_to_process.remove(result.input_file)
+                        all_results.add_result(result)
+                        files_to_process.pop(result.input_file, None)
+                    elif stop_on_failure:
+                        # Add the failed result and stop
+                        all_results.add_result(result)
+                        files_to_process.pop(result.input_file, None)
+                        self._should_stop = True
+                        break
                     else:
-                        # Handle failure
-                        if mode == BatchMode.STOP_ON_FAILURE:
-                            # Add the failed result and stop
-                            all_results.append(result)
-                            self._should_stop = True
-                            break
-                        else:
-                            # Continue on error
-                            all_results.append(result)
-                            if result.input_file in files_to_process:
-                                files_to_process.remove(result.input_file)
+                        failed_this_pass.append(result)
 
                 # Check for retries
-                if files_to_process and retry_count < config.max_retries:
+                if (failed_this_pass and not self._should_stop
+                        and retry_count < config.max_retries):
                     retry_count += 1
                     self.logger.info(f"Retrying {len(files_to_process)} failed files (attempt {retry_count})")
-                else:
-                    break
+                    # Back off briefly in case the failure was transient
+                    time.sleep(_RETRY_BACKOFF_SECONDS * 2 ** (retry_count - 1))
+                    continue
+
+                # Out of retries: the last failures are final
+                for result in failed_this_pass:
+                    all_results.add_result(result)
+                    files_to_process.pop(result.input_file, None)
+                break
 
             # Build summary
             summary.completed_at = datetime.now().isoformat()
@@ -241,45 +265,23 @@ class BatchProcessor:
         return summary
 
     def _build_summary(self, summary: BatchSummary,
-                       results: List[ProcessingResult]) -> BatchSummary:
-        """Build summary from results."""
-        total_time = 0.0
-        total_before = 0
-        total_after = 0
-        reduction_percents = []
-
-        for result in results:
-            total_time += result.processing_time
-
-            if result.success:
-                summary.successful_files += 1
-
-                if result.file_size_before:
-                    total_before += result.file_size_before
-                if result.file_size_after:
-                    total_after += result.file_size_after
-
-                if result.file_size_before and result.file_size_after:
-                    reduction = ((result.file_size_before - result.file_size_after)
-                                / result.file_size_before * 100)
-                    reduction_percents.append(reduction)
-            else:
-                summary.failed_files += 1
-                summary.failed_file_details.append({
-                    'file': Path(result.input_file).name,
-                    'error': result.error_message or "Unknown error"
-                })
+                       results: ProcessingResults) -> BatchSummary:
+        """Build summary from the running totals of the results."""
+        summary.successful_files = results.successful_files
+        summary.failed_files = results.failed_files
+        summary.failed_file_details = list(results.failed_file_details)
 
-        summary.total_time_seconds = total_time
-        if len(results) > 0:
-            summary.average_time_per_file = total_time / len(results)
+        summary.total_time_seconds = results.total_processing_time
+        if results.total_files > 0:
+            summary.average_time_per_file = results.total_processing_time / results.total_files
 
-        summary.total_size_before = total_before
-        summary.total_size_after = total_after
-        summary.total_reduction_bytes = total_before - total_after
+        summary.total_size_before = results.total_size_before
+        summary.total_size_after = results.total_size_after
+        summary.total_reduction_bytes = results.total_size_before - results.total_size_after
 
-        if reduction_percents:
-            summary.average_reduction_percent = sum(reduction_percents) / len(reduction_percents)
+        if results.reduction_percent_count:
+            summary.average_reduction_percent = (results.reduction_percent_sum
+                                                 / results.reduction_percent_count)
 
         return summary
 
@@ -295,8 +297,7 @@ class BatchProcessor:
         """
         try:
             config.created_at = datetime.now().isoformat()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(config.to_dict(), f, indent=2, ensure_ascii=False)
+            write_json(config.to_dict(), file_path)
             self.logger.info(f"Saved batch configuration to {file_path}")
             return True
         except Exception as e:
@@ -313,8 +314,7 @@ class BatchProcessor:
             BatchConfiguration or None if failed
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = read_json(file_path)
             config = BatchConfiguration.from_dict(data)
             self.logger.info(f"Loaded batch configuration from {file_path}")
             return config
@@ -336,8 +336,7 @@ class BatchProcessor:
             path = Path(file_path)
 
             if path.suffix.lower() == '.json':
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(summary.to_dict(), f, indent=2, ensure_ascii=False)
+                write_json(summary.to_dict(), file_path)
             else:
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(summary.to_report())
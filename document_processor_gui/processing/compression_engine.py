@@ -38,10 +38,16 @@ class CompressionEngine:
         except Exception:
             pass
 
+        # Settings are the same for every file, so resolve them once
+        gs_options = {
+            'quality_preset': settings.get('compression_level', 'screen'),
+            'target_dpi': settings.get('target_dpi', 144),
+            'image_quality': settings.get('image_quality', 75),
+            'downsample_threshold': settings.get('downsample_threshold', 1.1),
+        }
+
         # Prepare tasks
-        tasks = []
-        for file_path in files:
-            tasks.append((file_path, output_dir, settings))
+        tasks = [(file_path, output_dir, gs_options) for file_path in files]
 
         # Use ThreadPoolExecutor since GS runs as subprocess
         max_workers = settings.get('max_concurrent_operations', os.cpu_count() or 2)
@@ -59,7 +65,7 @@ class CompressionEngine:
                 completed_count += 1
                 
                 if progress_callback:
-                    progress_callback(completed_count, total, Path(file_path).name)
+                    progress_callback(completed_count, total, os.path.basename(file_path))
                 
                 try:
                     result = future.result()
@@ -76,35 +82,40 @@ class CompressionEngine:
         return results
 
     def _process_single_file(self, args) -> ProcessingResult:
-        file_path, output_dir, settings = args
+        file_path, output_dir, gs_options = args
         start_time = time.time()
-        input_path = Path(file_path)
-        output_path = Path(output_dir) / input_path.name
+        # Plain os.path calls: this runs once per file
+        output_file = os.path.join(output_dir, os.path.basename(file_path))
         
+        # One stat both checks existence and gives the size
+        try:
+            size_before = os.stat(file_path).st_size
+        except OSError:
+            size_before = None
+
         result = ProcessingResult(
             success=False,
             input_file=file_path,
-            file_size_before=input_path.stat().st_size if input_path.exists() else 0
+            file_size_before=size_before or 0
         )
         
         try:
-            if not input_path.exists():
+            if size_before is None:
                 result.error_message = "File not found"
             else:
                 success = self.gs_wrapper.compress_pdf(
-                    str(input_path),
-                    str(output_path),
-                    quality_preset=settings.get('compression_level', 'screen'),
-                    target_dpi=settings.get('target_dpi', 144),
-                    image_quality=settings.get('image_quality', 75),
-                    downsample_threshold=settings.get('downsample_threshold', 1.1)
+                    file_path,
+                    output_file,
+                    **gs_options
                 )
                 
                 result.success = success
                 if success:
-                    result.output_file = str(output_path)
-                    if output_path.exists():
-                        result.file_size_after = output_path.stat().st_size
+                    result.output_file = output_file
+                    try:
+                        result.file_size_after = os.stat(output_file).st_size
+                    except OSError:
+                        pass
                 else:
                     result.error_message = "Compression failed"
                     
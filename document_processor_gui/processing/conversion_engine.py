@@ -1,6 +1,7 @@
 import time
 import os
 import logging
+import concurrent.futures
 from typing import List, Callable, Optional, Dict, Any
 from pathlib import Path
 from ..backend.word_converter import WordConverter
@@ -43,54 +44,96 @@ class ConversionEngine:
             # Typically engine should not crash.
             pass
         
-        for i, file_path in enumerate(files):
-            # 1-based index for display, but i is 0-based
-            current_idx = i + 1
-            file_name = Path(file_path).name
-            
-            if progress_callback:
-                progress_callback(current_idx, total, file_name)
-            
-            start_time = time.time()
-            input_path = Path(file_path)
-            
-            # Determine output filename (preserve name, change suffix)
-            output_filename = input_path.stem + ".pdf"
-            output_path = Path(output_dir) / output_filename
-            
-            # Handle duplicates if needed? Overwrite for now.
-            
-            result = ProcessingResult(
-                success=False,
-                input_file=file_path,
-                file_size_before=input_path.stat().st_size if input_path.exists() else 0
-            )
-            
-            try:
-                if not input_path.exists():
-                    result.error_message = "File not found"
-                else:
-                    success = self.word_converter.convert_to_pdf(
-                        str(input_path), 
-                        str(output_path),
-                        image_compression_enabled=settings.get('image_compression_enabled', False),
-                        image_quality=settings.get('image_quality', 75),
-                        optimize_png=settings.get('optimize_png', True)
+        # Prepare tasks
+        tasks = []
+        for file_path in files:
+            tasks.append((file_path, output_dir, settings))
+
+        # Threads rather than processes: the converter drives Word/LibreOffice
+        # out of process and holds handles that can't be pickled. Word can
+        # only convert one file at a time.
+        if self.word_converter.supports_concurrent_conversion():
+            max_workers = settings.get('max_concurrent_operations', os.cpu_count() or 2)
+        else:
+            max_workers = 1
+
+        completed_count = 0
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_file = {
+                executor.submit(self._process_single_file, task): task[0]
+                for task in tasks
+            }
+
+            for future in concurrent.futures.as_completed(future_to_file):
+                file_path = future_to_file[future]
+                completed_count += 1
+
+                if progress_callback:
+                    progress_callback(completed_count, total, os.path.basename(file_path))
+
+                try:
+                    result = future.result()
+                    results.add_result(result)
+                except Exception as e:
+                    self.logger.error(f"Error getting result for {file_path}: {e}")
+                    result = ProcessingResult(
+                        success=False,
+                        input_file=file_path,
+                        error_message=str(e)
                     )
-                    
-                    result.success = success
-                    if success:
-                        result.output_file = str(output_path)
-                        if output_path.exists():
-                            result.file_size_after = output_path.stat().st_size
-                    else:
-                        result.error_message = "Conversion returned False (unknown error)"
-                    
-            except Exception as e:
-                self.logger.error(f"Error converting {file_path}: {e}")
-                result.error_message = str(e)
-            
-            result.processing_time = time.time() - start_time
-            results.add_result(result)
-            
+                    results.add_result(result)
+
         return results
+
+    def _process_single_file(self, args) -> ProcessingResult:
+        file_path, output_dir, settings = args
+        start_time = time.time()
+
+        # Determine output filename (preserve name, change suffix).
+        # Plain os.path calls: this runs once per file
+        output_filename = os.path.splitext(os.path.basename(file_path))[0] + ".pdf"
+        output_file = os.path.join(output_dir, output_filename)
+
+        # Handle duplicates if needed? Overwrite for now.
+
+        # One stat both checks existence and gives the size
+        try:
+            size_before = os.stat(file_path).st_size
+        except OSError:
+            size_before = None
+
+        result = ProcessingResult(
+            success=False,
+            input_file=file_path,
+            file_size_before=size_before or 0
+        )
+
+        try:
+            if size_before is None:
+                result.error_message = "File not found"
+            else:
+                success = self.word_converter.convert_to_pdf(
+                    file_path,
+                    output_file,
+                    image_compression_enabled=settings.get('image_compression_enabled', False),
+                    image_quality=settings.get('image_quality', 75),
+                    optimize_png=settings.get('optimize_png', True)
+                )
+
+                result.success = success
+                if success:
+                    result.output_file = output_file
+                    try:
+                        result.file_size_after = os.stat(output_file).st_size
+                    except OSError:
+                        pass
+                else:
+                    result.error_message = "Conversion returned False (unknown error)"
+
+        except Exception as e:
+            self.logger.error(f"Error converting {file_path}: {e}")
+            result.error_message = str(e)
+
+        result.processing_time = time.time() - start_time
+        return result
@@ -37,9 +37,22 @@ class LabelingEngine:
         except Exception:
             pass
 
-        tasks = []
-        for file_path in files:
-            tasks.append((file_path, output_dir, settings))
+        # Settings are the same for every file, so resolve them once
+        label_text = settings.get('label_text')
+        include_path = settings.get('include_path_in_label', False)
+        label_options = {
+            'position': settings.get('label_position', 'header'),
+            'font_size': settings.get('label_font_size', 10),
+            'color': settings.get('label_font_color', '#FF0000'),
+            'opacity': settings.get('label_transparency', 1.0),
+            'font_path': settings.get('font_path'),
+        }
+
+        # Parse a custom font once for the whole batch
+        self.pdf_labeler.preload_font(label_options['font_path'])
+
+        tasks = [(file_path, output_dir, label_text, include_path, label_options)
+                 for file_path in files]
 
         max_workers = settings.get('max_concurrent_operations', os.cpu_count() or 2)
         completed_count = 0
@@ -55,7 +68,7 @@ class LabelingEngine:
                 completed_count += 1
                 
                 if progress_callback:
-                    progress_callback(completed_count, total, Path(file_path).name)
+                    progress_callback(completed_count, total, os.path.basename(file_path))
                 
                 try:
                     result = future.result()
@@ -72,47 +85,51 @@ class LabelingEngine:
         return results
 
     def _process_single_file(self, args) -> ProcessingResult:
-        file_path, output_dir, settings = args
+        file_path, output_dir, label_text, include_path, label_options = args
         start_time = time.time()
-        input_path = Path(file_path)
-        output_path = Path(output_dir) / input_path.name
+        # Plain os.path calls: this runs once per file
+        file_name = os.path.basename(file_path)
+        output_file = os.path.join(output_dir, file_name)
         
+        # One stat both checks existence and gives the size
+        try:
+            size_before = os.stat(file_path).st_size
+        except OSError:
+            size_before = None
+
         result = ProcessingResult(
             success=False,
             input_file=file_path,
-            file_size_before=input_path.stat().st_size if input_path.exists() else 0
+            file_size_before=size_before or 0
         )
         
         try:
-            if not input_path.exists():
+            if size_before is None:
                 result.error_message = "File not found"
             else:
                 # Determine label text: use settings 'label_text' if constant, otherwise filename
                 # If include_path is True, use full path?
                 # For now, default to filename as per requirement
-                label_text = settings.get('label_text')
                 if not label_text:
-                    if settings.get('include_path_in_label', False):
-                        label_text = str(input_path)
+                    if include_path:
+                        label_text = file_path
                     else:
-                        label_text = input_path.name
+                        label_text = file_name
                 
                 success = self.pdf_labeler.add_label(
-                    str(input_path),
-                    str(output_path),
+                    file_path,
+                    output_file,
                     text=label_text,
-                    position=settings.get('label_position', 'header'),
-                    font_size=settings.get('label_font_size', 10),
-                    color=settings.get('label_font_color', '#FF0000'),
-                    opacity=settings.get('label_transparency', 1.0),
-                    font_path=settings.get('font_path')
+                    **label_options
                 )
                 
                 result.success = success
                 if success:
-                    result.output_file = str(output_path)
-                    if output_path.exists():
-                        result.file_size_after = output_path.stat().st_size
+                    result.output_file = output_file
+                    try:
+                        result.file_size_after = os.stat(output_file).st_size
+                    except OSError:
+                        pass
                 else:
                     result.error_message = "Labeling failed"
                     
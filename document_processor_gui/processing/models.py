@@ -1,7 +1,13 @@
+import sys
 from dataclasses import dataclass, field
-from typing import Optional, List, Any
+from pathlib import Path
+from typing import Optional, List, Dict, Any
 
-@dataclass
+# One ProcessingResult is kept per file, so drop the per-instance __dict__
+# where dataclasses support it (Python 3.10+)
+DATACLASS_SLOTS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**DATACLASS_SLOTS)
 class ProcessingResult:
     success: bool
     input_file: str
@@ -11,21 +17,40 @@ class ProcessingResult:
     file_size_before: int = 0
     file_size_after: Optional[int] = None
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProcessingResults:
     results: List[ProcessingResult] = field(default_factory=list)
     total_files: int = 0
     successful_files: int = 0
     failed_files: int = 0
     total_processing_time: float = 0.0
+    # Running totals for batch summaries, kept up to date by add_result
+    total_size_before: int = 0
+    total_size_after: int = 0
+    reduction_percent_sum: float = 0.0
+    reduction_percent_count: int = 0
+    failed_file_details: List[Dict[str, str]] = field(default_factory=list)
     
     def add_result(self, result: ProcessingResult):
         self.results.append(result)
         self.total_files += 1
         if result.success:
             self.successful_files += 1
+            size_before = result.file_size_before
+            size_after = result.file_size_after
+            if size_before:
+                self.total_size_before += size_before
+            if size_after:
+                self.total_size_after += size_after
+            if size_before and size_after:
+                self.reduction_percent_sum += (size_before - size_after) / size_before * 100
+                self.reduction_percent_count += 1
         else:
             self.failed_files += 1
+            self.failed_file_details.append({
+                'file': Path(result.input_file).name,
+                'error': result.error_message or "Unknown error"
+            })
         self.total_processing_time += result.processing_time
             
     def get_summary(self) -> str:
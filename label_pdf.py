@@ -1,7 +1,20 @@
+import hashlib
 import io
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path  # 导入 Path
 
 from pypdf import PdfReader, PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    FloatObject,
+    NameObject,
+)
 from reportlab.lib.colors import red
 from reportlab.lib.units import inch
 
@@ -64,38 +77,167 @@ if not font_registered:
 # --- /字体配置 ---
 
 
-def add_filename_to_pdf(input_pdf_path: Path, output_pdf_path: Path):
+# 每个线程复用一个内存缓冲区来接收 reportlab 生成的水印 PDF
+_packet_local = threading.local()
+
+
+def _reset_packet() -> io.BytesIO:
+    """返回当前线程的水印缓冲区，并清空上一次的内容。"""
+    packet = getattr(_packet_local, "packet", None)
+    if packet is None:
+        packet = _packet_local.packet = io.BytesIO()
+    else:
+        packet.seek(0)
+        packet.truncate()
+    return packet
+
+
+# 按文件内容缓存解析后的 PdfReader：同一模板的多个副本只需解析一次
+_READER_CACHE_SIZE = 8
+_READER_CACHE_MAX_FILE_SIZE = 8 * 1024 * 1024  # 只缓存较小的文件，限制内存占用
+_reader_cache = OrderedDict()
+
+
+def _load_reader(input_pdf_path: Path) -> PdfReader:
     """
-    向 PDF 文件的第一页添加其文件名作为文本。
+    读取并解析 PDF，内容相同的文件复用同一个 PdfReader (只读，写入前会被克隆)。
+    """
+    data = input_pdf_path.read_bytes()
+    if len(data) > _READER_CACHE_MAX_FILE_SIZE:
+        return PdfReader(io.BytesIO(data))
 
-    Args:
-        input_pdf_path (Path): 输入 PDF 文件的 Path 对象。
-        output_pdf_path (Path): 输出 PDF 文件的 Path 对象。
+    key = hashlib.sha1(data).digest()
+    reader = _reader_cache.get(key)
+    if reader is not None:
+        _reader_cache.move_to_end(key)
+        return reader
+
+    reader = PdfReader(io.BytesIO(data))
+    _reader_cache[key] = reader
+    if len(_reader_cache) > _READER_CACHE_SIZE:
+        _reader_cache.popitem(last=False)
+    return reader
+
+
+def _stream_ref(writer: PdfWriter, data: bytes, **entries):
+    """在 writer 中新建一个内容流对象，返回它的间接引用。"""
+    stream = DecodedStreamObject()
+    stream.set_data(data)
+    stream.update({NameObject(k): v for k, v in entries.items()})
+    return writer._add_object(stream)
+
+
+# 内置 Helvetica 不需要嵌入字体，可以直接写出内容流而不必启动 reportlab
+_HELVETICA_LABEL_TEMPLATE = "q\nBT\n/F1 {size:g} Tf\n1 0 0 rg\n{x:f} {y:f} Td\n({text}) Tj\nET\nQ\n"
+
+
+# 每个 PdfWriter 中已添加的 Helvetica 字体对象
+_helvetica_fonts = weakref.WeakKeyDictionary()
+
+
+def _helvetica_label(writer: PdfWriter, text: str, x: float, y: float, font_size: float):
     """
-    # 1. 获取纯文件名（不含路径）用于显示
-    display_filename = input_pdf_path.name  # 使用 .name 属性
+    直接生成用 Helvetica 绘制红色文字的内容流和资源字典。
 
+    文字无法用 WinAnsi 编码 (例如中文) 时返回 None，由调用方回退到 reportlab。
+    """
     try:
-        # 2. 读取原始 PDF 获取第一页尺寸
-        reader = PdfReader(input_pdf_path)  # pypdf 可以直接接受 Path 对象
-        if not reader.pages:
-            print(f"警告：文件 '{display_filename}' 没有页面，已跳过。")
-            return False  # 表示处理失败或跳过
+        encoded = text.encode("cp1252")
+    except UnicodeEncodeError:
+        return None
+    # PDF 字面量字符串中需要转义反斜杠和括号
+    escaped = (
+        encoded.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+    ).decode("latin-1")
+    content = _HELVETICA_LABEL_TEMPLATE.format(size=font_size, x=x, y=y, text=escaped)
+
+    # 同一个 writer 中的所有标签共用一个字体对象 (合并输出时尤其有用)
+    font_ref = _helvetica_fonts.get(writer)
+    if font_ref is None:
+        font = DictionaryObject({
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+            NameObject("/Encoding"): NameObject("/WinAnsiEncoding"),
+        })
+        font_ref = _helvetica_fonts[writer] = writer._add_object(font)
+    resources = DictionaryObject({
+        NameObject("/Font"): DictionaryObject({NameObject("/F1"): font_ref})
+    })
+    return content.encode("latin-1"), resources
+
+
+def _overlay_page(writer: PdfWriter, page, content: bytes, form_resources, bbox):
+    """
+    把一段内容流作为 Form XObject 叠加到 page 上。
 
-        first_page = reader.pages[0]
-        page_width = float(first_page.mediabox.width)
-        page_height = float(first_page.mediabox.height)
+    与 merge_page 不同，这里不解码、不重写 page 原有的内容流：
+    只在 /Contents 数组前后各追加一个小流 (q ... Q /FmLabel Do)。
+    """
+    form_ref = _stream_ref(
+        writer,
+        content,
+        **{
+            "/Type": NameObject("/XObject"),
+            "/Subtype": NameObject("/Form"),
+            "/BBox": ArrayObject(FloatObject(v) for v in bbox),
+            "/Resources": form_resources,
+        },
+    )
 
-        # 3. 创建包含文件名的水印 PDF (在内存中)
-        packet = io.BytesIO()
-        can = canvas.Canvas(packet, pagesize=(page_width, page_height))
+    if "/Resources" not in page:
+        page[NameObject("/Resources")] = DictionaryObject()
+    resources = page["/Resources"].get_object()
+    if "/XObject" not in resources:
+        resources[NameObject("/XObject")] = DictionaryObject()
+    xobjects = resources["/XObject"].get_object()
+    name = "/FmLabel"
+    while name in xobjects:
+        name += "_"
+    xobjects[NameObject(name)] = form_ref
+
+    # 原内容流保持不动，用 q/Q 隔离它留下的图形状态
+    contents = page.get("/Contents")
+    if contents is None:
+        original = []
+    elif isinstance(contents.get_object(), ArrayObject):
+        original = list(contents.get_object())
+    else:
+        original = [contents]
+    page[NameObject("/Contents")] = ArrayObject(
+        [_stream_ref(writer, b"q\n"), *original,
+         _stream_ref(writer, f"\nQ\nq {name} Do Q\n".encode("ascii"))]
+    )
+
+
+def _stamp_filename(writer: PdfWriter, page, display_filename: str):
+    """
+    在 writer 中的 page 左上角加上文件名。
+    """
+    page_width = float(page.mediabox.width)
+    page_height = float(page.mediabox.height)
+
+    # --- 自定义文本外观和位置 ---
+    font_size = 10
+    text_color = red
+    margin = 0.5 * inch
+    x_position = margin
+    y_position = page_height - margin * 0.5 - font_size  # 左上角
+
+    # 创建包含文件名的水印内容流
+    label = None
+    if registered_font_name == "Helvetica":
+        label = _helvetica_label(
+            writer, display_filename, x_position, y_position, font_size
+        )
 
-        # --- 自定义文本外观和位置 ---
-        font_size = 10
-        text_color = red
-        margin = 0.5 * inch
-        x_position = margin
-        y_position = page_height - margin * 0.5 - font_size  # 左上角
+    if label is not None:
+        content, form_resources = label
+        bbox = [0, 0, page_width, page_height]
+    else:
+        # 需要嵌入字体时由 reportlab 生成水印 PDF (在内存中)
+        packet = _reset_packet()
+        can = canvas.Canvas(packet, pagesize=(page_width, page_height))
 
         can.setFont(registered_font_name, font_size)
         can.setFillColor(text_color)
@@ -103,26 +245,48 @@ def add_filename_to_pdf(input_pdf_path: Path, output_pdf_path: Path):
 
         can.save()
 
-        # 4. 将水印 PDF 合并到原始 PDF 的第一页
         packet.seek(0)
-        watermark_reader = PdfReader(packet)
-        watermark_page = watermark_reader.pages[0]
+        watermark_page = PdfReader(packet).pages[0]
+        content = watermark_page.get_contents().get_data()
+        form_resources = (
+            watermark_page.get("/Resources", DictionaryObject()).get_object().clone(writer)
+        )
+        bbox = watermark_page.mediabox
 
-        writer = PdfWriter()
-        first_page.merge_page(watermark_page)
-        writer.add_page(first_page)  # 添加修改后的第一页
+    # 将水印叠加到页面上
+    _overlay_page(writer, page, content, form_resources, bbox)
 
-        # 添加原始 PDF 的剩余页面
-        for i in range(1, len(reader.pages)):
-            writer.add_page(reader.pages[i])
+
+def add_filename_to_pdf(input_pdf_path: Path, output_pdf_path: Path):
+    """
+    向 PDF 文件的第一页添加其文件名作为文本。
+
+    Args:
+        input_pdf_path (Path): 输入 PDF 文件的 Path 对象。
+        output_pdf_path (Path): 输出 PDF 文件的 Path 对象。
+    """
+    # 1. 获取纯文件名（不含路径）用于显示
+    display_filename = input_pdf_path.name  # 使用 .name 属性
+
+    try:
+        # 2. 读取原始 PDF 获取第一页尺寸
+        # 直接克隆整个文档：共享的字体/图像对象只复制一次，不再逐页 add_page
+        writer = PdfWriter(clone_from=_load_reader(input_pdf_path))
+        if not writer.pages:
+            print(f"警告：文件 '{display_filename}' 没有页面，已跳过。")
+            return False  # 表示处理失败或跳过
+
+        # 3-4. 创建文件名水印并叠加到第一页
+        _stamp_filename(writer, writer.pages[0], display_filename)
 
         # 5. 保存结果到输出文件
         # 确保输出目录存在 (主函数会创建，这里多一层保险)
         output_pdf_path.parent.mkdir(
             parents=True, exist_ok=True
         )  # 使用 .parent 和 .mkdir()
+        # pypdf 每个对象都会单独调用 write()，使用 1 MB 缓冲区合并为少量系统调用
         with open(
-            output_pdf_path, "wb"
+            output_pdf_path, "wb", buffering=1024 * 1024
         ) as output_file:  # open() 可以直接接受 Path 对象
             writer.write(output_file)
 
@@ -135,13 +299,66 @@ def add_filename_to_pdf(input_pdf_path: Path, output_pdf_path: Path):
         return False  # 表示处理失败
 
 
-def process_pdf_directory(input_dir: Path, output_dir: Path):
+def merge_labeled_pdfs(input_pdf_paths, merged_output_path: Path):
+    """
+    把多个 PDF 依次加上文件名后合并到同一个输出文件中。
+
+    所有文件写入同一个 PdfWriter，Helvetica 标签的字体对象只写一次。
+
+    Args:
+        input_pdf_paths: 输入 PDF 文件路径列表。
+        merged_output_path (Path): 合并后的输出文件路径。
+
+    Returns:
+        tuple: (成功数, 失败数)
+    """
+    writer = PdfWriter()
+    processed_count = 0
+    error_count = 0
+
+    for input_pdf_path in map(Path, input_pdf_paths):
+        display_filename = input_pdf_path.name
+        start = len(writer.pages)
+        try:
+            writer.append(_load_reader(input_pdf_path))
+            if len(writer.pages) == start:
+                print(f"警告：文件 '{display_filename}' 没有页面，已跳过。")
+                error_count += 1
+                continue
+            _stamp_filename(writer, writer.pages[start], display_filename)
+            processed_count += 1
+        except Exception as e:
+            print(f"处理文件 '{display_filename}' 时发生错误: {e}")
+            error_count += 1
+
+    if processed_count:
+        merged_output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(merged_output_path, "wb", buffering=1024 * 1024) as output_file:
+            writer.write(output_file)
+        print(f"  -> 已合并保存到: {merged_output_path}")
+
+    return processed_count, error_count
+
+
+def _label_one(paths):
+    """
+    进程池中的工作函数：只在进程间传递路径字符串。
+
+    子进程导入本模块时会重新执行上面的字体注册 (pdfmetrics 的状态是按进程保存的)。
+    """
+    input_path_str, output_path_str = paths
+    return add_filename_to_pdf(Path(input_path_str), Path(output_path_str))
+
+
+def process_pdf_directory(input_dir: Path, output_dir: Path, merged_output: Path = None):
     """
     处理指定目录下的所有 PDF 文件，并将结果保存到输出目录。
 
     Args:
         input_dir (Path): 包含 PDF 文件的输入目录 Path 对象。
         output_dir (Path): 保存处理后 PDF 文件的输出目录 Path 对象。
+        merged_output (Path): 如果指定，则把所有加了文件名的 PDF 合并保存到这个文件中，
+            不再逐个输出。
     """
     if not input_dir.is_dir():  # 使用 .is_dir() 方法
         print(f"错误：输入目录 '{input_dir}' 不存在或不是一个有效的目录。")
@@ -157,35 +374,47 @@ def process_pdf_directory(input_dir: Path, output_dir: Path):
     skipped_count = 0
     error_count = 0
 
-    # 遍历输入目录中的所有文件和子目录
-    for item in input_dir.iterdir():  # 使用 .iterdir() 获取 Path 对象迭代器
-        # 检查是否是 PDF 文件 (忽略大小写)
-        if item.name.lower().endswith(".pdf"):  # 使用 .name 获取文件名字符串
-            input_file_path = item  # item 本身就是 Path 对象
-
-            # 只处理文件，不处理子目录
-            if input_file_path.is_file():  # 使用 .is_file()
-                print(f"正在处理: {input_file_path.name} ...")
-
-                # 构建输出文件路径 (使用 / 操作符)
-                output_file_path = output_dir / input_file_path.name
-
-                # 调用处理函数
-                success = add_filename_to_pdf(input_file_path, output_file_path)
-
+    # 遍历输入目录中的所有文件和子目录，先收集需要处理的 PDF
+    tasks = []
+    # os.scandir 的 DirEntry 自带文件类型信息，判断 is_file() 通常不需要额外的 stat 调用
+    with os.scandir(input_dir) as entries:
+        for entry in entries:
+            # 检查是否是 PDF 文件 (忽略大小写)
+            if entry.name.lower().endswith(".pdf"):
+                # 只处理文件，不处理子目录
+                if entry.is_file():
+                    # 构建输出文件路径
+                    output_file_path = os.path.join(output_dir, entry.name)
+                    tasks.append((entry.path, output_file_path))
+                else:
+                    print(f"跳过: {entry.name} (不是文件)")
+                    skipped_count += 1
+            else:
+                # 可选：打印跳过的非 PDF 文件信息
+                # print(f"跳过: {entry.name} (非 PDF 文件)")
+                skipped_count += 1  # 可以选择是否统计非PDF文件的跳过
+
+    if merged_output is not None:
+        # 合并输出需要写入同一个 PdfWriter，只能顺序处理
+        if tasks:
+            print(f"正在处理 {len(tasks)} 个 PDF 文件 (合并输出) ...")
+            processed_count, error_count = merge_labeled_pdfs(
+                [input_path_str for input_path_str, _ in tasks], merged_output
+            )
+    # 每个文件的处理互不依赖且是 CPU 密集型 (解析 + 绘制 + 压缩)，用多进程并行
+    elif tasks:
+        print(f"正在处理 {len(tasks)} 个 PDF 文件 ...")
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(_label_one, tasks, chunksize=4)
+            # map 按提交顺序返回结果
+            for (_, output_path_str), success in zip(tasks, results):
+                output_file_path = Path(output_path_str)
                 if success:
                     processed_count += 1
                     # 使用 .name 获取目录和文件名，更清晰地显示相对路径
                     print(f"  -> 已保存到: {output_dir.name}/{output_file_path.name}")
                 else:
                     error_count += 1
-            else:
-                print(f"跳过: {item.name} (不是文件)")
-                skipped_count += 1
-        else:
-            # 可选：打印跳过的非 PDF 文件信息
-            # print(f"跳过: {item.name} (非 PDF 文件)")
-            skipped_count += 1  # 可以选择是否统计非PDF文件的跳过
 
     print("-" * 30)
     print("处理完成。")
@@ -1,6 +1,7 @@
 import os
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image
 
@@ -25,8 +26,11 @@ def generate_icns():
     
     print(f"Created iconset directory: {iconset_dir}")
 
-    # Open source image
+    # Open source image; for JPEG sources, let the decoder scale down
+    # towards the largest size we need (a no-op for PNG)
     img = Image.open(source_icon)
+    img.draft(None, (1024, 1024))
+    img.load()
     
     # Sizes required for macOS iconset
     sizes = [
@@ -42,12 +46,24 @@ def generate_icns():
         (512, 2, 'icon_512x512@2x.png'),
     ]
     
-    # Generate resized images
-    for size, scale, filename in sizes:
+    # Resize each distinct pixel size once, largest first, downsampling
+    # from the previous (next larger) bitmap instead of the full source
+    bitmaps = {}
+    current = img
+    for pixel_size in sorted({size * scale for size, scale, _ in sizes}, reverse=True):
+        current = current.resize((pixel_size, pixel_size), Image.Resampling.LANCZOS)
+        bitmaps[pixel_size] = current
+
+    # Save the iconset files (e.g. 32x32 and 16x16@2x share a bitmap).
+    # PNG encoding releases the GIL, so the saves run on a thread pool
+    def save_icon(spec):
+        size, scale, filename = spec
         pixel_size = size * scale
         print(f"Generating {filename} ({pixel_size}x{pixel_size})...")
-        resized_img = img.resize((pixel_size, pixel_size), Image.Resampling.LANCZOS)
-        resized_img.save(iconset_dir / filename)
+        bitmaps[pixel_size].save(iconset_dir / filename)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(save_icon, sizes))
 
     # Run iconutil
     print("Running iconutil...")
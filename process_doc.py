@@ -1,6 +1,11 @@
+import hashlib
+import io
+import json
 import os
+import shutil
 import tempfile
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 from PIL import Image
@@ -13,6 +18,7 @@ from docx2pdf import convert  # Primary conversion method
 INPUT_DIR = Path("./主体结构")  # 包含 Word 文件的输入目录
 OUTPUT_DIR = Path("./output_pdfs")  # 保存 PDF 文件的输出目录
 TEMP_DIR_BASE = Path("./temp_processing")  # 临时文件处理的根目录
+CACHE_FILE = Path("./.process_doc_cache.json")  # 记录已转换文件，重复运行时跳过未修改的文件
 
 # 图片压缩设置 ("最高级别 web 压缩" 的一种解释)
 ENABLE_IMAGE_COMPRESSION = False  # 是否启用图片压缩开关，关闭让图片只在 pdf 处理阶段被压缩，避免多次压缩导致失真
@@ -20,6 +26,27 @@ IMAGE_QUALITY = 75  # JPEG 压缩质量 (0-100, 较低=更高压缩/更低质量
 OPTIMIZE_PNG = True  # 是否优化 PNG 文件 (无损压缩)
 # --- End Configuration ---
 
+# 这些格式本身已经压缩过，重新打包时直接存储，不再 deflate
+STORED_SUFFIXES = {".jpg", ".jpeg", ".png", ".gif"}
+
+# 小于这个大小的 XML 等部件用较低的 deflate 级别，几乎不影响体积但更快
+SMALL_PART_SIZE = 64 * 1024
+
+
+# 已处理过的图片：(原图 SHA-1, 压缩设置) -> 压缩后的数据 (None 表示压缩后没有变小)
+# 同一张图片 (如 logo) 出现在多个文档中时只需压缩一次
+_compressed_images = {}
+
+
+def _encode_if_smaller(img, original_size, image_format, **save_options):
+    """
+    把图片编码到内存中，只有比原文件小时才返回编码结果，否则返回 None。
+    """
+    buffer = io.BytesIO()
+    img.save(buffer, image_format, **save_options)
+    data = buffer.getvalue()
+    return data if len(data) < original_size else None
+
 
 def compress_image_file(image_path, quality=75, optimize_png=True):
     """
@@ -28,7 +55,18 @@ def compress_image_file(image_path, quality=75, optimize_png=True):
     返回 True 表示成功压缩或优化, False 表示失败或跳过。
     """
     try:
-        img = Image.open(image_path)
+        original_data = image_path.read_bytes()
+        cache_key = (hashlib.sha1(original_data).digest(), quality, optimize_png)
+        if cache_key in _compressed_images:
+            compressed = _compressed_images[cache_key]
+            if compressed is None:
+                print(f"   Keeping original (already processed, no gain): {image_path.name}")
+                return False
+            image_path.write_bytes(compressed)
+            print(f"   Reused compressed image: {image_path.name}")
+            return True
+
+        img = Image.open(io.BytesIO(original_data))
         original_format = img.format.upper() if img.format else None
 
         # Pillow 需要知道原始格式才能正确处理
@@ -52,22 +90,20 @@ def compress_image_file(image_path, quality=75, optimize_png=True):
         # 根据格式选择压缩策略
         if original_format in ["JPEG", "JPG"]:
             # 对于 JPEG，使用指定的质量重新保存
+            # 在读取像素前设置 draft 模式，让 libjpeg 直接解码为 RGB
+            img.draft("RGB", img.size)
             # 确保颜色模式兼容 JPEG (e.g., convert RGBA to RGB)
             if img.mode == "RGBA":
                 print(f"   Converting RGBA to RGB for JPEG: {image_path.name}")
                 img = img.convert("RGB")
-            img.save(
-                image_path, "JPEG", quality=quality, optimize=True
+            compressed = _encode_if_smaller(
+                img, len(original_data), "JPEG", quality=quality, optimize=True
             )  # optimize=True doesn't hurt JPEGs either
-            print(f"   Compressed JPEG: {image_path.name} (Quality: {quality})")
             img.close()
-            return True
         elif original_format == "PNG" and optimize_png:
             # 对于 PNG，如果启用，则进行优化
-            img.save(image_path, "PNG", optimize=True)
-            print(f"   Optimized PNG: {image_path.name}")
+            compressed = _encode_if_smaller(img, len(original_data), "PNG", optimize=True)
             img.close()
-            return True
         # 可以添加对其他格式的处理，例如将 GIF/BMP/TIFF 转换为 JPEG 或 PNG
         # elif original_format in ["GIF", "BMP", "TIFF"]:
         #     target_format = "PNG" # or "JPEG"
@@ -88,6 +124,18 @@ def compress_image_file(image_path, quality=75, optimize_png=True):
             img.close()
             return False  # No action taken
 
+        # 只有压缩后确实变小才覆盖原文件
+        _compressed_images[cache_key] = compressed
+        if compressed is None:
+            print(f"   Keeping original (recompressed file is not smaller): {image_path.name}")
+            return False
+        image_path.write_bytes(compressed)
+        if original_format == "PNG":
+            print(f"   Optimized PNG: {image_path.name}")
+        else:
+            print(f"   Compressed JPEG: {image_path.name} (Quality: {quality})")
+        return True
+
     except FileNotFoundError:
         print(f"   Error: Image file not found: {image_path}")
         return False
@@ -101,119 +149,91 @@ def compress_image_file(image_path, quality=75, optimize_png=True):
         return False
 
 
-def process_word_document(docx_path, output_pdf_path, temp_dir_base):
+def compress_word_document(
+    docx_path, staged_docx_path, temp_dir_base, quality=75, optimize_png=True
+):
     """
-    处理单个 Word 文档：解压、压缩图片、重新打包、转换为 PDF。
+    压缩阶段：只解压 `word/media/` 中的图片并压缩，再重新打包，结果写到 staged_docx_path。
+    如果没有图片被压缩，直接复制原文件。
+    返回 True 表示 staged_docx_path 已生成。
     """
-    print(f"\nProcessing: {docx_path.absolute()}")
-
-    # 如果禁用了图片压缩，直接进行 PDF 转换
-    if not ENABLE_IMAGE_COMPRESSION:
-        print("  Image compression is disabled. Converting original file directly...")
-        try:
-            output_pdf_path.parent.mkdir(parents=True, exist_ok=True)
-            convert(str(docx_path), str(output_pdf_path))
-            print(f"  Successfully created PDF: {output_pdf_path.absolute()}")
-        except Exception as pdf_error:
-            print(f"  ERROR converting {docx_path.name} to PDF: {pdf_error}")
-        return
+    print(f"\nCompressing: {docx_path.absolute()}")
+    staged_docx_path.parent.mkdir(parents=True, exist_ok=True)
 
     # 使用唯一的临时目录，并在完成后自动清理
     with tempfile.TemporaryDirectory(
         prefix=f"docx_{docx_path.stem}_", dir=temp_dir_base
     ) as temp_dir_str:
-        temp_dir = Path(temp_dir_str)
-        extracted_path = temp_dir / "extracted"
-        modified_docx_path = temp_dir / f"compressed_{docx_path.name}"
+        media_path = Path(temp_dir_str) / "media"
 
         try:
-            # 1. 解压 .docx 文件
-            print("  Extracting Word file...")
-            with zipfile.ZipFile(docx_path, "r") as zip_ref:
-                zip_ref.extractall(extracted_path)
-
-            # 2. 查找并压缩 `word/media/` 中的图片
-            media_path = extracted_path / "word" / "media"
-            images_processed_count = 0
-            if media_path.is_dir():
-                print("  Compressing images in media folder...")
-                for item in media_path.iterdir():
-                    # 检查是否是支持压缩的文件类型
-                    if item.is_file() and item.suffix.lower() in [
-                        ".jpg",
-                        ".jpeg",
-                        ".png",
-                    ]:  # Add other formats if handled by compress_image_file
-                        if compress_image_file(
-                            item, quality=IMAGE_QUALITY, optimize_png=OPTIMIZE_PNG
-                        ):
-                            images_processed_count += 1
-            else:
-                print("  No 'word/media' folder found.")
-
-            if images_processed_count > 0:
-                print(f"  Successfully processed {images_processed_count} images.")
-                # 3. 如果有图片被修改，重新打包成新的 .docx 文件
-                print("  Re-zipping processed Word file...")
-                with zipfile.ZipFile(
-                    modified_docx_path, "w", zipfile.ZIP_DEFLATED
-                ) as zipf:
-                    for root, _, files in os.walk(extracted_path):
-                        arc_dir = Path(root).relative_to(extracted_path)
-                        for file in files:
-                            full_path = Path(root) / file
-                            # 使用 as_posix() 确保 zip 文件内部路径使用 '/'
-                            arc_name = (arc_dir / file).as_posix()
-                            zipf.write(full_path, arcname=arc_name)
-                source_docx_for_pdf = modified_docx_path
-            else:
-                print(
-                    "  No images were compressed. Using original file for PDF conversion."
-                )
-                # 如果没有图片被处理，直接使用原始文件进行 PDF 转换
-                source_docx_for_pdf = docx_path  # Use original docx path
-
-            # 4. 将处理后（或原始）的 .docx 文件转换为 PDF
-            print(
-                f"  Converting '{source_docx_for_pdf.name}' to PDF -> '{output_pdf_path.name}'..."
-            )
-            try:
-                # 确保输出 PDF 的目录存在
-                output_pdf_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # 使用 docx2pdf 进行转换
-                convert(str(source_docx_for_pdf), str(output_pdf_path))
-
-                # --- 可选：使用 LibreOffice 命令行 ---
-                # soffice_path = "soffice" # 或提供完整路径 "C:\Program Files\LibreOffice\program\soffice.exe"
-                # cmd = [
-                #     soffice_path,
-                #     "--headless",         # 无头模式运行
-                #     "--convert-to", "pdf",# 转换目标格式为 pdf
-                #     "--outdir", str(output_pdf_path.parent), # 指定输出目录
-                #     str(source_docx_for_pdf) # 输入文件
-                # ]
-                # print(f"  Running command: {' '.join(cmd)}")
-                # result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-                # if result.returncode == 0 and output_pdf_path.exists():
-                #      print(f"  Successfully created PDF via LibreOffice: {output_pdf_path.name}")
-                # else:
-                #     print(f"  LibreOffice conversion failed for {source_docx_for_pdf.name}:")
-                #     print(f"  Return Code: {result.returncode}")
-                #     print(f"  Stderr: {result.stderr}")
-                #     print(f"  Stdout: {result.stdout}")
-                #     # 可以考虑在此处引发异常或返回错误状态
-
-                print(f"  Successfully created PDF: {output_pdf_path.absolute()}")
-
-            except Exception as pdf_error:
-                print(
-                    f"  ERROR converting {source_docx_for_pdf.name} to PDF: {pdf_error}"
-                )
-                # 打印更详细的错误信息，尤其是 docx2pdf 可能的底层错误
-                import traceback
-
-                traceback.print_exc()
+            with zipfile.ZipFile(docx_path, "r") as zip_in:
+                # 1. 只解压 `word/media/` 中支持压缩的图片，其他部件不落盘
+                media_members = {}
+                for info in zip_in.infolist():
+                    name = info.filename
+                    if (
+                        name.startswith("word/media/")
+                        and not info.is_dir()
+                        and Path(name).suffix.lower() in [".jpg", ".jpeg", ".png"]
+                    ):  # Add other formats if handled by compress_image_file
+                        media_members[name] = media_path / Path(name).name
+
+                # 2. 压缩图片
+                modified_members = set()
+                if media_members:
+                    print("  Extracting and compressing images in media folder...")
+                    media_path.mkdir()
+                    for name, image_path in media_members.items():
+                        image_path.write_bytes(zip_in.read(name))
+                    # Pillow 编码/解码时会释放 GIL，用线程池并行压缩各个图片
+                    with ThreadPoolExecutor(
+                        max_workers=min(8, os.cpu_count() or 1)
+                    ) as executor:
+                        results = executor.map(
+                            lambda image_path: compress_image_file(
+                                image_path, quality=quality, optimize_png=optimize_png
+                            ),
+                            media_members.values(),
+                        )
+                        modified_members = {
+                            name for name, ok in zip(media_members, results) if ok
+                        }
+                else:
+                    print("  No images found in 'word/media' folder.")
+
+                if modified_members:
+                    print(f"  Successfully processed {len(modified_members)} images.")
+                    # 3. 重新打包：图片直接存储 (不再 deflate)，
+                    #    其他部件按原来的压缩方式写回
+                    print("  Re-zipping processed Word file...")
+                    with zipfile.ZipFile(staged_docx_path, "w") as zip_out:
+                        for info in zip_in.infolist():
+                            if info.filename in modified_members:
+                                data = media_members[info.filename].read_bytes()
+                            else:
+                                data = zip_in.read(info)
+                            if Path(info.filename).suffix.lower() in STORED_SUFFIXES:
+                                compress_type = zipfile.ZIP_STORED
+                            else:
+                                compress_type = info.compress_type
+                            compresslevel = (
+                                (3 if len(data) < SMALL_PART_SIZE else 6)
+                                if compress_type == zipfile.ZIP_DEFLATED
+                                else None
+                            )
+                            zip_out.writestr(
+                                info,
+                                data,
+                                compress_type=compress_type,
+                                compresslevel=compresslevel,
+                            )
+                    return True
+
+            print("  No images were compressed. Using original file for PDF conversion.")
+            # 如果没有图片被处理，直接使用原始文件进行 PDF 转换
+            shutil.copyfile(docx_path, staged_docx_path)
+            return True
 
         except zipfile.BadZipFile:
             print(
@@ -226,6 +246,110 @@ def process_word_document(docx_path, output_pdf_path, temp_dir_base):
             traceback.print_exc()
         # finally:
         # tempfile.TemporaryDirectory 会自动清理，无需手动删除
+    return False
+
+
+def _compress_one(args):
+    """
+    进程池中的工作函数：参数只包含路径字符串和压缩设置，便于在进程间传递。
+    """
+    docx_path, staged_docx_path, temp_dir_base, quality, optimize_png = args
+    return compress_word_document(
+        Path(docx_path), Path(staged_docx_path), Path(temp_dir_base), quality, optimize_png
+    )
+
+
+def convert_word_document(source_docx_path, output_pdf_path):
+    """
+    转换阶段：把单个 .docx 文件转换为 PDF。
+    """
+    print(
+        f"  Converting '{source_docx_path.name}' to PDF -> '{output_pdf_path.name}'..."
+    )
+    try:
+        # 确保输出 PDF 的目录存在
+        output_pdf_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 使用 docx2pdf 进行转换
+        convert(str(source_docx_path), str(output_pdf_path))
+
+        # --- 可选：使用 LibreOffice 命令行 ---
+        # soffice_path = "soffice" # 或提供完整路径 "C:\Program Files\LibreOffice\program\soffice.exe"
+        # cmd = [
+        #     soffice_path,
+        #     "--headless",         # 无头模式运行
+        #     "--convert-to", "pdf",# 转换目标格式为 pdf
+        #     "--outdir", str(output_pdf_path.parent), # 指定输出目录
+        #     str(source_docx_path) # 输入文件
+        # ]
+        # print(f"  Running command: {' '.join(cmd)}")
+        # result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        # if result.returncode == 0 and output_pdf_path.exists():
+        #      print(f"  Successfully created PDF via LibreOffice: {output_pdf_path.name}")
+        # else:
+        #     print(f"  LibreOffice conversion failed for {source_docx_path.name}:")
+        #     print(f"  Return Code: {result.returncode}")
+        #     print(f"  Stderr: {result.stderr}")
+        #     print(f"  Stdout: {result.stdout}")
+        #     # 可以考虑在此处引发异常或返回错误状态
+
+        print(f"  Successfully created PDF: {output_pdf_path.absolute()}")
+
+    except Exception as pdf_error:
+        print(f"  ERROR converting {source_docx_path.name} to PDF: {pdf_error}")
+        # 打印更详细的错误信息，尤其是 docx2pdf 可能的底层错误
+        import traceback
+
+        traceback.print_exc()
+
+
+def process_word_document(docx_path, output_pdf_path, temp_dir_base):
+    """
+    处理单个 Word 文档：解压、压缩图片、重新打包、转换为 PDF。
+    """
+    print(f"\nProcessing: {docx_path.absolute()}")
+
+    # 如果禁用了图片压缩，直接进行 PDF 转换
+    if not ENABLE_IMAGE_COMPRESSION:
+        print("  Image compression is disabled. Converting original file directly...")
+        convert_word_document(docx_path, output_pdf_path)
+        return
+
+    with tempfile.TemporaryDirectory(
+        prefix=f"staged_{docx_path.stem}_", dir=temp_dir_base
+    ) as staging_dir_str:
+        staged_docx_path = Path(staging_dir_str) / docx_path.name
+        if compress_word_document(
+            docx_path, staged_docx_path, temp_dir_base, IMAGE_QUALITY, OPTIMIZE_PNG
+        ):
+            convert_word_document(staged_docx_path, output_pdf_path)
+
+
+def _file_signature(docx_path):
+    """
+    文件内容和压缩设置的签名：任何一项变化都需要重新转换。
+    """
+    stat = docx_path.stat()
+    return (
+        f"{stat.st_mtime_ns}:{stat.st_size}:"
+        f"{ENABLE_IMAGE_COMPRESSION}:{IMAGE_QUALITY}:{OPTIMIZE_PNG}"
+    )
+
+
+def _load_cache():
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache):
+    try:
+        with open(CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        print(f"WARNING: Could not save cache file '{CACHE_FILE}': {e}")
 
 
 def main():
@@ -250,9 +374,13 @@ def main():
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     TEMP_DIR_BASE.mkdir(parents=True, exist_ok=True)
 
-    # 查找所有 .docx 文件，排除临时文件
-    docx_files = list(INPUT_DIR.rglob("*.docx"))
-    valid_docx_files = [f for f in docx_files if not f.name.startswith("~$")]
+    # 查找所有 .docx 文件，排除临时文件；只为匹配的文件创建 Path 对象
+    valid_docx_files = [
+        Path(root, name)
+        for root, _, files in os.walk(INPUT_DIR)
+        for name in files
+        if name.lower().endswith(".docx") and not name.startswith("~$")
+    ]
 
     if not valid_docx_files:
         print("No valid .docx files found in the input directory.")
@@ -263,28 +391,93 @@ def main():
     success_count = 0
     fail_count = 0
 
+    # 跳过自上次成功转换后没有变化、且 PDF 仍然存在的文件
+    cache = _load_cache()
+    signatures = {}
+    changed_docx_files = []
     for docx_path in valid_docx_files:
-        try:
-            # 计算输出 PDF 文件的路径，保留相对结构
-            relative_path = docx_path.relative_to(INPUT_DIR)
-            output_pdf_path = OUTPUT_DIR / relative_path.with_suffix(".pdf")
-
-            # 处理单个文件
-            process_word_document(docx_path, output_pdf_path, TEMP_DIR_BASE)
-            # 假设如果 process_word_document 没有抛出严重错误并且 PDF 文件存在就是成功
-            if output_pdf_path.exists():
-                success_count += 1
-            else:
-                # 可能转换步骤失败但未抛出异常
-                print(f"  WARNING: PDF file was not created for {docx_path.name}")
+        signature = signatures[docx_path] = _file_signature(docx_path)
+        output_pdf_path = OUTPUT_DIR / docx_path.relative_to(INPUT_DIR).with_suffix(".pdf")
+        if cache.get(str(docx_path)) == [signature, str(output_pdf_path)] and output_pdf_path.exists():
+            success_count += 1
+        else:
+            # 先删除上次运行留下的 PDF，否则本次转换失败时旧文件会被当作成功结果
+            try:
+                output_pdf_path.unlink(missing_ok=True)
+            except OSError as e:
+                print(f"  ERROR: Could not remove old PDF for {docx_path.name}: {e}")
                 fail_count += 1
-
-        except Exception as e:
-            print(f"FATAL ERROR processing file {docx_path.name}. Skipping. Error: {e}")
+                continue
+            changed_docx_files.append(docx_path)
+    if success_count:
+        print(f"Skipping {success_count} unchanged files (PDF already up to date).")
+    valid_docx_files = changed_docx_files
+
+    # 计算每个文件相对输入目录的路径，输出时保留相对结构
+    relative_paths = [f.relative_to(INPUT_DIR) for f in valid_docx_files]
+
+    # 待转换的文件先放到暂存目录 (与输入目录结构相同)，
+    # 这样每个目录只需调用一次 docx2pdf，Word 只启动一次
+    with tempfile.TemporaryDirectory(prefix="staging_", dir=TEMP_DIR_BASE) as staging_str:
+        staging_dir = Path(staging_str)
+
+        # 1. 压缩阶段：各文件互不依赖，用多进程并行
+        if ENABLE_IMAGE_COMPRESSION:
+            tasks = [
+                (str(docx_path), str(staging_dir / relative_path), str(TEMP_DIR_BASE),
+                 IMAGE_QUALITY, OPTIMIZE_PNG)
+                for docx_path, relative_path in zip(valid_docx_files, relative_paths)
+            ]
+            with ProcessPoolExecutor() as executor:
+                staged = list(executor.map(_compress_one, tasks))
+        else:
+            print("  Image compression is disabled. Converting original files directly...")
+            staged = []
+            for docx_path, relative_path in zip(valid_docx_files, relative_paths):
+                staged_docx_path = staging_dir / relative_path
+                try:
+                    staged_docx_path.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(docx_path, staged_docx_path)
+                    staged.append(True)
+                except OSError as e:
+                    print(f"  ERROR staging {docx_path.name}: {e}")
+                    staged.append(False)
+
+        # 2. 转换阶段：按目录批量转换
+        staged_by_dir = {}
+        for relative_path, ok in zip(relative_paths, staged):
+            if ok:
+                staged_by_dir.setdefault(relative_path.parent, []).append(relative_path)
+        for relative_dir in sorted(staged_by_dir):
+            output_dir = OUTPUT_DIR / relative_dir
+            print(f"\nConverting folder '{relative_dir}' -> '{output_dir}'...")
+            try:
+                output_dir.mkdir(parents=True, exist_ok=True)
+                convert(str(staging_dir / relative_dir), str(output_dir))
+            except Exception as pdf_error:
+                print(f"  ERROR converting folder '{relative_dir}' to PDF: {pdf_error}")
+                print("  Converting the remaining files one by one...")
+
+            # docx2pdf 的目录模式遇到坏文件会中断整个目录，且只转换匹配 [!~]*.doc*
+            # 的文件 (POSIX 上区分大小写，会漏掉 .DOCX 和以 ~ 开头的文件)，
+            # 没有生成 PDF 的文件逐个重新转换，单个文件失败不影响其他文件
+            for relative_path in staged_by_dir[relative_dir]:
+                output_pdf_path = OUTPUT_DIR / relative_path.with_suffix(".pdf")
+                if not output_pdf_path.exists():
+                    convert_word_document(staging_dir / relative_path, output_pdf_path)
+
+    # 3. 统计结果：PDF 文件存在即视为成功
+    for docx_path, relative_path, ok in zip(valid_docx_files, relative_paths, staged):
+        output_pdf_path = OUTPUT_DIR / relative_path.with_suffix(".pdf")
+        if ok and output_pdf_path.exists():
+            success_count += 1
+            cache[str(docx_path)] = [signatures[docx_path], str(output_pdf_path)]
+        else:
+            # 可能转换步骤失败但未抛出异常
+            print(f"  WARNING: PDF file was not created for {docx_path.name}")
             fail_count += 1
-            import traceback
 
-            traceback.print_exc()
+    _save_cache(cache)
 
     print("-" * 30)
     print("Processing finished.")
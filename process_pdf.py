@@ -1,10 +1,22 @@
+import functools
+import hashlib
+import math
 import os
 import platform
+import re
 import shutil
 import subprocess
-from concurrent.futures import ProcessPoolExecutor
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+try:
+    import fitz  # PyMuPDF，仅用于判断文件是否需要压缩 (可选)
+
+    HAS_FITZ = True
+except ImportError:
+    HAS_FITZ = False
+
 # --- 配置 ---
 INPUT_DIR = Path("./output_pdfs")  # 包含 PDF 文件的输入目录
 OUTPUT_DIR = Path("./compressed_pdfs")  # 保存压缩后 PDF 的输出目录
@@ -20,6 +32,9 @@ COMPRESSION_LEVEL = "/screen"
 TARGET_DPI = 144  # 设置目标图像分辨率 (例如 96, 130, 144, 150, 300)
 DOWNSAMPLE_THRESHOLD = 1.1  # 设置下采样阈值 (1.0 表示只要图像分辨率 > TARGET_DPI 就进行下采样, 1.5 较宽松)
 IMAGE_QUALITY = 75  # Add this: 1-100, lower means higher compression
+# 小于该大小且图像分辨率都不超过下采样阈值的 PDF 直接复制，不调用 Ghostscript (需要 PyMuPDF)
+SKIP_SIZE_BYTES = 200 * 1024
+GS_BATCH_SIZE = 8  # 每个工作进程任务最多包含的文件数 (减少进程间通信)
 
 # 如果遇到转换极慢 添加 -dHaveTransparency=false 或者在 Word 导出前就把复杂矢量图转为位图
 
@@ -27,6 +42,9 @@ IMAGE_QUALITY = 75  # Add this: 1-100, lower means higher compression
 # 留空 '' 会尝试自动在 PATH 中查找
 # 或者指定完整路径, 例如: r"C:\Program Files\gs\gs10.01.1\bin\gswin64c.exe"
 
+# 压缩引擎: "ghostscript" (默认) 或 "pymupdf" (进程内处理，无需启动 gs，需要 PyMuPDF)
+COMPRESS_ENGINE = "ghostscript"
+
 GS_PATH = r"C:\Program Files\gs\gs10.05.0\bin\gswin64c.exe"
 # --- End Configuration ---
 
@@ -62,14 +80,13 @@ def find_ghostscript():
         return None
 
 
-def compress_pdf(input_pdf_path, output_pdf_path, gs_executable, level, target_dpi, threshold, image_quality=100):
-    """使用 Ghostscript 压缩单个 PDF 文件。"""
-    print(f"  正在压缩: {input_pdf_path.name} -> {output_pdf_path.name} (使用 {level})")
-
-    # 确保输出目录存在
-    output_pdf_path.parent.mkdir(parents=True, exist_ok=True)
+@functools.lru_cache(maxsize=None)
+def _gs_options(target_dpi, threshold, image_quality, rendering_threads, convert_colors):
+    """构建与具体文件无关的 Ghostscript 参数。
 
-    # 构建 Ghostscript 命令
+    同一次运行中这些参数基本不变，缓存后每次只需拼接输入/输出文件名。
+    """
+    # Ghostscript 参数
     # 重要选项解释:
     # -sDEVICE=pdfwrite      : 指定输出设备为 PDF 写入器
     # -dCompatibilityLevel=1.4 : 设置 PDF 兼容性级别 (1.4 是个安全的选择)
@@ -79,8 +96,7 @@ def compress_pdf(input_pdf_path, output_pdf_path, gs_executable, level, target_d
     # -dQUIET                : 减少 Ghostscript 的输出信息 (可选, 便于查看脚本输出)
     # -sOutputFile=...       : 指定输出文件路径
     # input_pdf_path         : 输入文件路径
-    cmd = [
-        gs_executable,
+    options = [
         "-sDEVICE=pdfwrite",
         "-dCompatibilityLevel=1.5",
         # f"-dPDFSETTINGS={level}",
@@ -93,7 +109,10 @@ def compress_pdf(input_pdf_path, output_pdf_path, gs_executable, level, target_d
         "-dAutoFilterColorImages=false",
         "-dColorImageFilter=/DCTEncode",
         "-dEncodeColorImages=true",
-        "-dPassThroughJPEGImages=false",
+        # 未超过下采样阈值的 JPEG/JPX 图像直接原样拷贝，避免解码再重新量化
+        # (既省 CPU，也避免二次压缩的画质损失)；需要下采样的图像仍会重新编码
+        "-dPassThroughJPEGImages=true",
+        "-dPassThroughJPXImages=true",
         # === 灰度图片 ===
         "-dDownsampleGrayImages=true",
         "-dGrayImageDownsampleType=/Bicubic",
@@ -112,13 +131,10 @@ def compress_pdf(input_pdf_path, output_pdf_path, gs_executable, level, target_d
         # 不要对 Mono 用 DCTEncode！用默认的 CCITTFax 或 Flate
         "-dMonoImageFilter=/CCITTFaxEncode",
         "-dEncodeMonoImages=true",
+        # 关闭图像插值：重采样时不做昂贵的插值卷积，也避免把插值后的位图写进输出
+        "-dNOINTERPOLATE",
         # === JPEG 质量 ===
         f"-dJPEGQ={image_quality}",
-        # === 颜色优化 ===
-        "-sColorConversionStrategy=RGB",
-        "-dConvertCMYKImagesToRGB=true",
-        "-sProcessColorModel=DeviceRGB",
-        "-dOverrideICC=true",
         # === 字体处理（补充）===
         "-dEmbedAllFonts=true",
         "-dSubsetFonts=true",  # 只嵌入用到的字符
@@ -135,58 +151,401 @@ def compress_pdf(input_pdf_path, output_pdf_path, gs_executable, level, target_d
         "-dNOPAUSE",
         "-dBATCH",
         "-dQUIET",  # 可以取消注释以查看更少的 GS 输出
+        # === 渲染线程 ===
+        # 透明度合成、图案平铺等需要光栅化的页面可以多线程分带渲染
+        f"-dNumRenderingThreads={rendering_threads}",
+        "-dBufferSpace=100000000",
+    ]
+    # === 颜色优化 ===
+    if convert_colors:
+        options.extend(
+            [
+                "-sColorConversionStrategy=RGB",
+                "-dConvertCMYKImagesToRGB=true",
+                "-sProcessColorModel=DeviceRGB",
+                "-dOverrideICC=true",
+            ]
+        )
+    else:
+        # 纯 RGB/灰度文档无需逐像素做色彩空间转换
+        options.append("-sColorConversionStrategy=LeaveColorUnchanged")
+    return tuple(options)
+
+
+def build_gs_command(
+    input_pdf_path,
+    output_pdf_path,
+    gs_executable,
+    target_dpi,
+    threshold,
+    image_quality,
+    rendering_threads=1,
+    convert_colors=True,
+):
+    """为单个 PDF 构建 Ghostscript 命令。
+
+    每个文件使用独立的 gs 进程：-dSAFER (gs 9.50 起默认开启) 会锁定设备的
+    OutputFile 参数，无法在同一进程中用 setpagedevice 切换输出文件，
+    而关闭 SAFER 会让不受信任的 PDF 在没有文件访问限制的情况下运行。
+    """
+    return [
+        gs_executable,
+        *_gs_options(target_dpi, threshold, image_quality, rendering_threads, convert_colors),
         f"-sOutputFile={str(output_pdf_path)}",
         str(input_pdf_path),
     ]
 
+
+def report_result(input_pdf_path, output_pdf_path, original_size, compressed_size, error, copied=False):
+    """在主进程中打印单个文件的压缩结果 (每个文件只写一次标准输出)。"""
+    if copied and error is None:
+        sys.stdout.write(f"  ⏭️ 无需压缩，已直接复制: {input_pdf_path.name}\n")
+        return
+    if error is not None:
+        sys.stdout.write(f"  ❌ 压缩失败: {input_pdf_path.name}\n     {error}\n")
+        return
+    # 比较文件大小
+    reduction = (original_size - compressed_size) / original_size * 100 if original_size > 0 else 0
+    sys.stdout.write(
+        f"  ✅ 成功压缩: {output_pdf_path.name}\n"
+        f"     原始大小: {original_size / 1024:.1f} KB, 压缩后: {compressed_size / 1024:.1f} KB ({reduction:.1f}% 减小)\n"
+    )
+
+
+def _run_gs(cmd, gs_executable):
+    """执行 Ghostscript 命令，返回 (返回代码, stderr 文本)；无法启动时返回 (None, 错误信息)。"""
     try:
         # 执行命令
-        # capture_output=True 捕获 stdout 和 stderr
-        # text=True 将捕获的输出解码为文本
+        # stdout 丢弃 (-dQUIET 下几乎没有输出)，只用管道捕获 stderr 的原始字节
         # check=False 不会在 GS 返回非零退出码时自动抛出异常，我们手动检查
         result = subprocess.run(
             cmd,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             check=False,
-            encoding="utf-8",
-            errors="ignore",
         )
-
-        # 检查 Ghostscript 是否成功执行 (返回码 0 表示成功)
-        if result.returncode == 0:
-            print(f"  ✅ 成功压缩: {output_pdf_path.name}")
-            # 可以比较文件大小 (可选)
-            original_size = input_pdf_path.stat().st_size
-            compressed_size = output_pdf_path.stat().st_size
-            reduction = (original_size - compressed_size) / original_size * 100 if original_size > 0 else 0
-            print(
-                f"     原始大小: {original_size / 1024:.1f} KB, 压缩后: {compressed_size / 1024:.1f} KB ({reduction:.1f}% 减小)"
-            )
-            return True
-        else:
-            print(f"  ❌ 压缩失败: {input_pdf_path.name}")
-            print(f"     Ghostscript 返回代码: {result.returncode}")
-            print(f"     错误信息 (stderr):\n{result.stderr}")
-            # 如果压缩失败，删除可能产生的无效输出文件
-            if output_pdf_path.exists():
-                try:
-                    output_pdf_path.unlink()
-                except OSError as e:
-                    print(f"     警告: 无法删除失败的输出文件 {output_pdf_path}: {e}")
-            return False
-
     except FileNotFoundError:
-        print(f"错误：无法执行 Ghostscript 命令。确认 '{gs_executable}' 路径正确且可用。")
-        return False
+        return None, f"无法执行 Ghostscript 命令。确认 '{gs_executable}' 路径正确且可用。"
     except Exception as e:
-        print(f"执行 Ghostscript 时发生意外错误: {e}")
-        return False
+        return None, f"执行 Ghostscript 时发生意外错误: {e}"
+    if result.returncode == 0:
+        return 0, ""
+    # 只有失败时才需要解码错误信息
+    return result.returncode, result.stderr.decode("utf-8", errors="ignore")
+
+
+def compress_pdf(
+    input_pdf_path,
+    output_pdf_path,
+    gs_executable,
+    level,
+    target_dpi,
+    threshold,
+    image_quality=100,
+    rendering_threads=1,
+    convert_colors=True,
+):
+    """使用 Ghostscript 压缩单个 PDF 文件。
+
+    返回 (压缩后大小, 错误信息)；成功时错误信息为 None。
+    打印留给主进程完成，避免多个工作进程争用控制台。
+    """
+    # 确保输出目录存在
+    output_pdf_path.parent.mkdir(parents=True, exist_ok=True)
+
+    cmd = build_gs_command(
+        input_pdf_path,
+        output_pdf_path,
+        gs_executable,
+        target_dpi,
+        threshold,
+        image_quality,
+        rendering_threads,
+        convert_colors,
+    )
+    returncode, stderr = _run_gs(cmd, gs_executable)
+
+    # 检查 Ghostscript 是否成功执行 (返回码 0 表示成功)
+    if returncode == 0:
+        return output_pdf_path.stat().st_size, None
+    if returncode is None:
+        return None, stderr
+
+    error = f"Ghostscript 返回代码: {returncode}\n     错误信息 (stderr):\n{stderr}"
+    # 如果压缩失败，删除可能产生的无效输出文件
+    try:
+        output_pdf_path.unlink(missing_ok=True)
+    except OSError as e:
+        error += f"\n     警告: 无法删除失败的输出文件 {output_pdf_path}: {e}"
+    return None, error
+
+
+def needs_color_conversion(pdf_path):
+    """判断 PDF 中是否有需要转换到 RGB 的颜色 (CMYK、专色、Lab 等)。
+
+    Word 导出的 PDF 通常只使用 RGB/灰度 (包括 sRGB ICC)，此时可以跳过颜色转换。
+    除图像外，矢量图形和文字也可能使用 CMYK 或专色，因此同时检查所有对象定义
+    (色彩空间资源、渐变等) 以及页面和表单的内容流。
+    无法判断时 (没有 PyMuPDF、文件无法打开等) 一律返回 True。
+    """
+    if not HAS_FITZ:
+        return True
+    try:
+        with fitz.open(pdf_path) as doc:
+            for xref in range(1, doc.xref_length()):
+                if _NON_RGB_OBJECT.search(doc.xref_object(xref, compressed=True)):
+                    return True
+            for page in doc:
+                if _NON_RGB_CONTENT.search(page.read_contents()):
+                    return True
+                # 页面引用的表单 XObject (包括嵌套的) 有各自的内容流
+                for xref, *_ in page.get_xobjects():
+                    if _NON_RGB_CONTENT.search(doc.xref_stream(xref) or b""):
+                        return True
+    except Exception:
+        return True
+    return False
+
+
+def compress_pdf_batch(jobs, gs_executable, level, target_dpi, threshold, image_quality=100, rendering_threads=1):
+    """用 Ghostscript 依次压缩多个 PDF 文件。
+
+    jobs 为 (输入路径, 输出路径) 列表，每个文件由独立的 Ghostscript 进程处理，
+    并根据文件内容决定是否需要颜色转换。返回与 jobs 一一对应的
+    (压缩后大小, 错误信息) 列表。
+    """
+    return [
+        compress_pdf(
+            input_pdf_path,
+            output_pdf_path,
+            gs_executable,
+            level,
+            target_dpi,
+            threshold,
+            image_quality,
+            rendering_threads,
+            needs_color_conversion(input_pdf_path),
+        )
+        for input_pdf_path, output_pdf_path in jobs
+    ]
 
 
-def _compress_pdf_worker(args):
-    """多进程工作辅助函数。"""
-    return compress_pdf(*args)
+def iter_pdf_files(root):
+    """递归遍历目录，产出 (PDF 路径字符串, 文件大小)。
+
+    基于 os.scandir：目录项类型来自目录读取本身，不必为每个条目单独 stat，
+    也不会为每一级目录都构造 Path 对象。
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_pdf_files(entry.path)
+            elif entry.name.lower().endswith(".pdf") and entry.is_file():
+                yield entry.path, entry.stat().st_size
+
+
+def _file_digest(path):
+    """计算文件内容的 SHA-1。"""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def find_duplicate_pdfs(input_sizes):
+    """找出内容完全相同的 PDF (例如同一模板多次导出)。
+
+    只对大小相同的文件计算哈希，大小唯一的文件不需要读取。
+    返回 {代表文件: [与其内容相同的其他文件]}，只有代表文件需要实际压缩。
+    """
+    by_size = {}
+    for pdf_path, size in input_sizes.items():
+        by_size.setdefault(size, []).append(pdf_path)
+
+    duplicates = {}
+    for same_size in by_size.values():
+        if len(same_size) < 2:
+            continue
+        by_digest = {}
+        for pdf_path in same_size:
+            try:
+                by_digest.setdefault(_file_digest(pdf_path), []).append(pdf_path)
+            except OSError:
+                continue
+        for representative, *others in by_digest.values():
+            if others:
+                duplicates[representative] = others
+    return duplicates
+
+
+def _reuse_output(source_output, output_pdf_path, result):
+    """把代表文件的处理结果复制给内容相同的文件，返回该文件的 (输出大小, 错误信息, 是否直接复制)。"""
+    output_size, error, copied = result
+    if error is not None:
+        return None, f"与 {source_output.name} 内容相同，其处理失败: {error}", copied
+    try:
+        output_pdf_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source_output, output_pdf_path)
+    except OSError as e:
+        return None, f"复制重复文件的处理结果失败: {e}", copied
+    return output_size, None, copied
+
+
+def needs_compression(pdf_path, target_dpi, threshold):
+    """判断 PDF 是否值得交给 Ghostscript 处理。
+
+    小文件中如果没有任何图像的有效分辨率超过 target_dpi * threshold，
+    Ghostscript 也不会对图像做下采样，压缩结果与原文件相差无几，可以直接复制。
+    无法判断时 (没有 PyMuPDF、文件无法打开等) 一律返回 True。
+    """
+    if not HAS_FITZ:
+        return True
+    limit = target_dpi * threshold
+    try:
+        # 文件在扫描之后被删除或无法读取时 (OSError) 同样交给后续步骤报告错误
+        if os.path.getsize(pdf_path) >= SKIP_SIZE_BYTES:
+            return True
+        with fitz.open(pdf_path) as doc:
+            for page in doc:
+                for info in page.get_image_info():
+                    x0, y0, x1, y1 = info["bbox"]
+                    # bbox 以点 (1/72 英寸) 为单位，换算出图像在页面上的实际 DPI
+                    if x1 - x0 > 0 and info["width"] * 72 / (x1 - x0) > limit:
+                        return True
+                    if y1 - y0 > 0 and info["height"] * 72 / (y1 - y0) > limit:
+                        return True
+    except Exception:
+        return True
+    return False
+
+
+def _downsample_images(doc, target_dpi, limit, image_quality):
+    """逐个图像下采样 (用于没有 Document.rewrite_images 的旧版 PyMuPDF)。"""
+    done = set()
+    for page in doc:
+        for img in page.get_images(full=True):
+            xref, smask = img[0], img[1]
+            # 带软蒙版 (透明) 的图像改成 JPEG 会丢失透明度，跳过
+            if xref in done or smask:
+                continue
+            done.add(xref)
+            rects = [r for r in page.get_image_rects(xref) if r.width > 0]
+            if not rects:
+                continue
+            dpi = img[2] * 72 / min(r.width for r in rects)
+            if dpi <= limit:
+                continue
+            pix = fitz.Pixmap(doc, xref)
+            if pix.n - pix.alpha >= 4:  # CMYK 转为 RGB 再编码 JPEG
+                pix = fitz.Pixmap(fitz.csRGB, pix)
+            # shrink(n) 把宽高各缩小 2**n 倍，选不低于目标 DPI 的最大缩小倍数
+            factor = int(math.log2(dpi / target_dpi))
+            if factor > 0:
+                pix.shrink(factor)
+            page.replace_image(xref, stream=pix.tobytes("jpeg", jpg_quality=image_quality))
+
+
+def compress_pdf_pymupdf(input_pdf_path, output_pdf_path, target_dpi, threshold, image_quality=100):
+    """使用 PyMuPDF 在进程内压缩单个 PDF 文件。
+
+    对有效分辨率超过 target_dpi * threshold 的图像重采样并重新编码为 JPEG，
+    然后清理未使用对象、压缩所有流后保存。返回值与 compress_pdf 相同。
+    """
+    output_pdf_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with fitz.open(input_pdf_path) as doc:
+            if hasattr(doc, "rewrite_images"):
+                doc.rewrite_images(
+                    dpi_threshold=int(target_dpi * threshold),
+                    dpi_target=target_dpi,
+                    quality=image_quality,
+                )
+            else:
+                _downsample_images(doc, target_dpi, target_dpi * threshold, image_quality)
+            doc.subset_fonts()
+            doc.save(
+                output_pdf_path,
+                garbage=4,
+                clean=True,
+                deflate=True,
+                deflate_images=True,
+                deflate_fonts=True,
+            )
+    except Exception as e:
+        output_pdf_path.unlink(missing_ok=True)
+        return None, f"PyMuPDF 处理失败: {e}"
+    return output_pdf_path.stat().st_size, None
+
+
+def _run_batch(jobs, target_dpi, threshold, compress):
+    """处理一批文件：无需压缩的直接复制，其余交给 compress(jobs)。
+
+    判断是否需要压缩要打开 PDF，放在工作进程里做，可与其他进程的压缩并行，
+    不会拖延第一批任务开始的时间。
+    返回与 jobs 一一对应的 (输出大小, 错误信息, 是否直接复制) 列表。
+    """
+    results = [None] * len(jobs)
+    pending = []
+    for index, (input_pdf_path, output_pdf_path) in enumerate(jobs):
+        if needs_compression(input_pdf_path, target_dpi, threshold):
+            pending.append(index)
+            continue
+        try:
+            output_pdf_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(input_pdf_path, output_pdf_path)
+            results[index] = (output_pdf_path.stat().st_size, None, True)
+        except OSError as e:
+            results[index] = (None, f"复制文件失败: {e}", True)
+    if pending:
+        for index, (compressed_size, error) in zip(pending, compress([jobs[i] for i in pending])):
+            results[index] = (compressed_size, error, False)
+    return results
+
+
+# 对象定义中出现即需要转换的内容：CMYK、专色、Lab 色彩空间以及 4 分量的 ICC 配置。
+# 平铺图案和 Type3 字体有各自的内容流，不逐个检查，保守地视为需要转换
+_NON_RGB_OBJECT = re.compile(
+    r"/(?:DeviceCMYK|Separation|DeviceN|Lab|Subtype\s*/Type3)(?![\w.-])"
+    r"|/PatternType\s*1(?!\d)"
+    r"|/N\s*4(?![\d.]|\s+\d+\s+R)"
+)
+# 内容流中的 CMYK 颜色操作符 (k/K) 以及内联图像的 CMYK 色彩空间
+_NON_RGB_CONTENT = re.compile(rb"(?<!\S)[kK](?!\S)|/(?:CMYK|DeviceCMYK)(?![\w.-])")
+
+# 工作进程中的压缩参数，由 _init_worker 在进程启动时设置一次
+_WORKER_OPTIONS = ()
+
+
+def _init_worker(*options):
+    """工作进程初始化：保存压缩参数，任务本身只需携带文件路径。"""
+    global _WORKER_OPTIONS
+    _WORKER_OPTIONS = options
+
+
+def _compress_pdf_pymupdf_worker(pairs):
+    """多进程工作辅助函数：用 PyMuPDF 处理一批 (输入, 输出) 路径字符串。"""
+    target_dpi, threshold, image_quality = _WORKER_OPTIONS
+    return _run_batch(
+        [(Path(i), Path(o)) for i, o in pairs],
+        target_dpi,
+        threshold,
+        lambda pending: [
+            compress_pdf_pymupdf(input_pdf_path, output_pdf_path, target_dpi, threshold, image_quality)
+            for input_pdf_path, output_pdf_path in pending
+        ],
+    )
+
+
+def _compress_pdf_worker(pairs):
+    """多进程工作辅助函数：用 Ghostscript 处理一批 (输入, 输出) 路径字符串。"""
+    gs_executable, level, target_dpi, threshold, *options = _WORKER_OPTIONS
+    return _run_batch(
+        [(Path(i), Path(o)) for i, o in pairs],
+        target_dpi,
+        threshold,
+        lambda pending: compress_pdf_batch(pending, gs_executable, level, target_dpi, threshold, *options),
+    )
 
 
 def main():
@@ -201,16 +560,25 @@ def main():
         print(f"错误: 输入目录 '{INPUT_DIR}' 不存在或不是一个目录。")
         return
 
-    # 查找 Ghostscript
-    gs_exe = find_ghostscript()
-    if not gs_exe:
-        return
+    use_pymupdf = COMPRESS_ENGINE == "pymupdf"
+    if use_pymupdf:
+        if not HAS_FITZ:
+            print("错误：COMPRESS_ENGINE 设置为 pymupdf，但未安装 PyMuPDF。")
+            return
+        print("压缩引擎: PyMuPDF (进程内处理)")
+        gs_exe = None
+    else:
+        # 查找 Ghostscript
+        gs_exe = find_ghostscript()
+        if not gs_exe:
+            return
 
     # 创建输出目录（如果不存在）
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    # 查找所有 PDF 文件 (递归)
-    pdf_files = list(INPUT_DIR.rglob("*.pdf"))
+    # 查找所有 PDF 文件 (递归)，顺便记录文件大小
+    input_sizes = {Path(path): size for path, size in iter_pdf_files(INPUT_DIR)}
+    pdf_files = list(input_sizes)
 
     if not pdf_files:
         print("在输入目录中未找到 PDF 文件。")
@@ -219,6 +587,13 @@ def main():
     print(f"找到 {len(pdf_files)} 个 PDF 文件，开始处理...")
     print("-" * 30)
 
+    # 内容完全相同的文件只压缩一份，其余直接复用结果
+    duplicates = find_duplicate_pdfs(input_sizes)
+    if duplicates:
+        duplicate_files = {dup for dups in duplicates.values() for dup in dups}
+        pdf_files = [pdf_path for pdf_path in pdf_files if pdf_path not in duplicate_files]
+        print(f"发现 {len(duplicate_files)} 个重复文件，将直接复用相同文件的压缩结果。")
+
     # success_count = 0
     # fail_count = 0
 
@@ -242,37 +617,70 @@ def main():
     #         success_count += 1
     #     else:
     #         fail_count += 1
-    # 准备任务参数
-    tasks = []
-    for pdf_path in pdf_files:
-        relative_path = pdf_path.relative_to(INPUT_DIR)
-        output_pdf = OUTPUT_DIR / relative_path
-        tasks.append(
-            (
-                pdf_path,
-                output_pdf,
-                gs_exe,
-                COMPRESSION_LEVEL,
-                TARGET_DPI,
-                DOWNSAMPLE_THRESHOLD,
-                IMAGE_QUALITY,
-            )
+    # 准备任务参数：每个任务是一批文件，由同一个工作进程依次处理
+    # 按文件大小从大到小排列 (最长处理时间优先)，让大文件最先开始，小文件填补收尾
+    pdf_files.sort(key=input_sizes.__getitem__, reverse=True)
+    jobs = [(pdf_path, OUTPUT_DIR / pdf_path.relative_to(INPUT_DIR)) for pdf_path in pdf_files]
+    cpu_count = os.cpu_count() or 1
+    if use_pymupdf:
+        # 进程内处理没有启动开销需要摊薄，每个任务一个文件，负载最均衡
+        batch_size = 1
+        num_workers = min(cpu_count, len(jobs))
+        worker = _compress_pdf_pymupdf_worker
+        worker_options = (TARGET_DPI, DOWNSAMPLE_THRESHOLD, IMAGE_QUALITY)
+    else:
+        batch_size = max(1, min(GS_BATCH_SIZE, math.ceil(len(jobs) / cpu_count)))
+        num_batches = math.ceil(len(jobs) / batch_size)
+        # 批次少于核心数时，把多余的核心分给每个 gs 作为渲染线程，总线程数约等于核心数
+        num_workers = min(cpu_count, num_batches)
+        rendering_threads = max(1, cpu_count // num_workers)
+        worker = _compress_pdf_worker
+        worker_options = (
+            gs_exe,
+            COMPRESSION_LEVEL,
+            TARGET_DPI,
+            DOWNSAMPLE_THRESHOLD,
+            IMAGE_QUALITY,
+            rendering_threads,
         )
-    num_workers = os.cpu_count()
+    batches = [jobs[i : i + batch_size] for i in range(0, len(jobs), batch_size)]
     print(f"找到 {len(pdf_files)} 个文件，使用 {num_workers}个核心并行处理...")
     print("-" * 30)
 
-    # 执行并行任务
-    with ProcessPoolExecutor(max_workers=num_workers) as executor:
-        results = list(executor.map(_compress_pdf_worker, tasks))
-
-        success_count = results.count(True)
-        fail_count = results.count(False)
+    # 执行并行任务：固定参数通过 initializer 只传一次，每个任务只发送路径字符串
+    with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker, initargs=worker_options) as executor:
+        futures = {executor.submit(worker, [(str(i), str(o)) for i, o in batch]): batch for batch in batches}
+        success_count = 0
+        fail_count = 0
+        skipped_count = 0
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                batch_results = future.result()
+            except Exception as e:
+                # 工作进程异常退出时只把这一批记为失败，其他批次的结果照常汇总
+                batch_results = [(None, f"工作进程处理失败: {e}", False)] * len(batch)
+            for (input_pdf_path, output_pdf_path), result in zip(batch, batch_results):
+                outcomes = [(input_pdf_path, output_pdf_path, result)]
+                for duplicate in duplicates.get(input_pdf_path, ()):
+                    duplicate_output = OUTPUT_DIR / duplicate.relative_to(INPUT_DIR)
+                    outcomes.append(
+                        (duplicate, duplicate_output, _reuse_output(output_pdf_path, duplicate_output, result))
+                    )
+                for pdf_path, output_pdf, (output_size, error, copied) in outcomes:
+                    report_result(pdf_path, output_pdf, input_sizes[pdf_path], output_size, error, copied)
+                    if error is not None:
+                        fail_count += 1
+                    elif copied:
+                        skipped_count += 1
+                    else:
+                        success_count += 1
 
         print("-" * 30)
         print("处理完成。")
         print(f"成功压缩文件数: {success_count}")
         print(f"失败文件数: {fail_count}")
+        print(f"跳过 (直接复制) 文件数: {skipped_count}")
         print("-" * 30)
 
 
@@ -0,0 +1,10 @@
+import os
+
+from hypothesis import settings
+from hypothesis.database import InMemoryExampleDatabase
+
+# One-shot CI runs have no use for the on-disk example database
+settings.register_profile(
+    "ci", database=InMemoryExampleDatabase(), max_examples=50, deadline=None
+)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "default"))
@@ -238,21 +238,21 @@ class TestApplicationController:
         assert mock_engine.called
 
 
+@pytest.fixture(scope="module")
+def shared_config_manager(tmp_path_factory):
+    """Configuration loaded once for tests that never modify it."""
+    manager = ConfigurationManager(config_dir=tmp_path_factory.mktemp("config"))
+    manager.load_config()
+    return manager
+
+
 class TestApplicationControllerOperations:
     """Tests for processing operations."""
 
     @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
-
-    @pytest.fixture
-    def controller_with_mocks(self, temp_dir):
+    def controller_with_mocks(self, shared_config_manager):
         """Create controller with mocked engines."""
-        config_manager = ConfigurationManager(config_dir=temp_dir)
-        config_manager.load_config()
-        controller = ApplicationController(config_manager)
+        controller = ApplicationController(shared_config_manager)
 
         # Create mock engines
         controller._conversion_engine = Mock()
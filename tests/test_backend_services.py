@@ -5,8 +5,8 @@ import tempfile
 from document_processor_gui.backend.word_converter import WordConverter
 from document_processor_gui.backend.ghostscript_wrapper import GhostscriptWrapper
 from document_processor_gui.backend.pdf_labeler import PDFLabeler
+from document_processor_gui.backend.conversion_backend import HybridConversionBackend, BackendStatus, ConversionBackendType
 from document_processor_gui.core.exceptions import ProcessingError, ValidationError, DependencyError
-import fitz
 
 class TestWordConverter:
     @patch('document_processor_gui.backend.conversion_backend.WordBackend.convert')
@@ -34,6 +34,31 @@ class TestWordConverter:
         with pytest.raises(ValidationError):
             converter.convert_to_pdf("test.txt", "test.pdf")
 
+class TestHybridConversionBackend:
+    @patch('document_processor_gui.backend.conversion_backend.LibreOfficeBackend.is_available', return_value=True)
+    @patch('document_processor_gui.backend.conversion_backend.WordBackend.is_available', return_value=False)
+    def test_backend_status(self, mock_word, mock_lo):
+        status = HybridConversionBackend().get_backend_status()
+
+        assert isinstance(status, BackendStatus)
+        assert status.active_backend == status.libreoffice_capabilities.name
+        assert not status.word_available
+        assert status.libreoffice_available
+
+    @patch('document_processor_gui.backend.conversion_backend.platform.system', return_value='Windows')
+    @patch('document_processor_gui.backend.conversion_backend.LibreOfficeBackend.is_available', return_value=True)
+    @patch('document_processor_gui.backend.conversion_backend.WordBackend.is_available')
+    def test_concurrent_conversion_only_without_word(self, mock_word, mock_lo, mock_system):
+        mock_word.return_value = False
+        assert HybridConversionBackend().supports_concurrent_conversion()
+
+        # Word as active or fallback backend forces one conversion at a time
+        mock_word.return_value = True
+        assert not HybridConversionBackend().supports_concurrent_conversion()
+        assert not HybridConversionBackend(
+            preferred_backend=ConversionBackendType.LIBREOFFICE
+        ).supports_concurrent_conversion()
+
 class TestGhostscriptWrapper:
     @patch('document_processor_gui.backend.ghostscript_installer.GhostscriptInstaller.detect_ghostscript')
     def test_init_find_gs(self, mock_detect):
@@ -75,6 +100,8 @@ class TestGhostscriptWrapper:
 
 class TestPDFLabeler:
     def test_add_label(self):
+        import fitz
+
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
             input_file = temp_path / "input.pdf"
@@ -97,3 +124,42 @@ class TestPDFLabeler:
             text = doc[0].get_text()
             assert "Test Label" in text
             doc.close()
+
+    def test_missing_font_is_not_cached(self, tmp_path):
+        import fitz
+
+        font_file = tmp_path / "label.otf"
+        labeler = PDFLabeler()
+        assert labeler.preload_font(str(font_file)) is False
+
+        # A font installed after the first attempt is picked up
+        font_file.write_bytes(fitz.Font("helv").buffer)
+        assert labeler.preload_font(str(font_file)) is True
+
+    def test_concurrent_labels_share_font(self, tmp_path):
+        import concurrent.futures
+        import fitz
+
+        font_file = tmp_path / "label.otf"
+        font_file.write_bytes(fitz.Font("helv").buffer)
+        input_file = tmp_path / "input.pdf"
+        doc = fitz.open()
+        doc.new_page()
+        doc.save(input_file)
+        doc.close()
+
+        labeler = PDFLabeler(font_path=str(font_file))
+        labeler.preload_font()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda i: labeler.add_label(
+                    str(input_file), str(tmp_path / f"output_{i}.pdf"), f"Label {i}",
+                    position="bottom-right"),
+                range(8)
+            ))
+
+        assert results == [True] * 8
+        for i in range(8):
+            doc = fitz.open(tmp_path / f"output_{i}.pdf")
+            assert f"Label {i}" in doc[0].get_text()
+            doc.close()
@@ -0,0 +1,95 @@
+"""Unit tests for BatchProcessor."""
+
+import pytest
+from unittest.mock import Mock
+
+from document_processor_gui.processing import batch_processor
+from document_processor_gui.processing.batch_processor import (
+    BatchConfiguration, BatchMode, BatchProcessor
+)
+from document_processor_gui.processing.models import ProcessingResult, ProcessingResults
+
+
+class FakeProcessFunc:
+    """Process function whose failing files are set per pass."""
+
+    def __init__(self, *failures_per_pass):
+        self.failures_per_pass = list(failures_per_pass)
+        self.calls = []
+
+    def __call__(self, files, output_dir, settings, callback):
+        self.calls.append(list(files))
+        # The last pass's failures repeat once the list runs out
+        failing = self.failures_per_pass[min(len(self.calls), len(self.failures_per_pass)) - 1]
+        results = ProcessingResults()
+        for file in files:
+            results.add_result(ProcessingResult(
+                success=file not in failing,
+                input_file=file,
+                error_message="failed" if file in failing else None
+            ))
+        return results
+
+
+class TestBatchProcessor:
+    """Tests for BatchProcessor.process_batch retry and stop semantics."""
+
+    @pytest.fixture
+    def sleep(self, monkeypatch):
+        """Replace the retry backoff sleep."""
+        sleep = Mock()
+        monkeypatch.setattr(batch_processor.time, "sleep", sleep)
+        return sleep
+
+    def test_retries_only_failed_files(self, sleep):
+        process_func = FakeProcessFunc({"b.pdf"}, set())
+        config = BatchConfiguration(files=["a.pdf", "b.pdf", "c.pdf"], max_retries=2)
+
+        summary = BatchProcessor().process_batch(config, process_func)
+
+        assert process_func.calls == [["a.pdf", "b.pdf", "c.pdf"], ["b.pdf"]]
+        assert summary.successful_files == 3
+        assert summary.failed_files == 0
+        sleep.assert_called_once()
+
+    def test_final_failures_recorded_once(self, sleep):
+        process_func = FakeProcessFunc({"b.pdf"})
+        config = BatchConfiguration(files=["a.pdf", "b.pdf"], max_retries=2)
+
+        summary = BatchProcessor().process_batch(config, process_func)
+
+        assert process_func.calls == [["a.pdf", "b.pdf"], ["b.pdf"], ["b.pdf"]]
+        assert summary.successful_files == 1
+        assert summary.failed_files == 1
+        assert summary.failed_file_details == [{"file": "b.pdf", "error": "failed"}]
+        assert summary.skipped_files == 0
+        assert sleep.call_count == 2
+
+    def test_stop_on_failure_does_not_skip_failed_file(self, sleep):
+        process_func = FakeProcessFunc({"b.pdf"})
+        config = BatchConfiguration(
+            files=["a.pdf", "b.pdf", "c.pdf"],
+            mode=BatchMode.STOP_ON_FAILURE.value,
+            max_retries=2
+        )
+
+        summary = BatchProcessor().process_batch(config, process_func)
+
+        assert len(process_func.calls) == 1
+        assert summary.successful_files == 1
+        assert summary.failed_files == 1
+        # Only c.pdf was never reached
+        assert summary.skipped_files == 1
+        sleep.assert_not_called()
+
+    def test_no_retries(self, sleep):
+        process_func = FakeProcessFunc({"a.pdf"})
+        config = BatchConfiguration(files=["a.pdf", "b.pdf"], max_retries=0)
+
+        summary = BatchProcessor().process_batch(config, process_func)
+
+        assert len(process_func.calls) == 1
+        assert summary.successful_files == 1
+        assert summary.failed_files == 1
+        assert summary.skipped_files == 0
+        sleep.assert_not_called()
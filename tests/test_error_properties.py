@@ -1,35 +1,59 @@
+import os
 import pytest
 from hypothesis import given, strategies as st
-import tempfile
-from pathlib import Path
 from document_processor_gui.core.error_handler import ErrorHandler
 from document_processor_gui.core.exceptions import (
     DocumentProcessorError, ValidationError, FileSystemError
 )
 
-@given(st.text())
-def test_error_handling_robustness(msg):
+@pytest.fixture(scope="module")
+def robust_handler(tmp_path_factory):
+    """One ErrorHandler, with its real logger, for every generated example.
+    
+    Logging errors are normally printed and swallowed; raise them instead
+    so a message the log handlers cannot write fails the property.
+    """
+    handler = ErrorHandler(log_dir=tmp_path_factory.mktemp("logs"))
+    
+    def raise_error(record):
+        raise  # Re-raise the error being handled inside emit()
+    
+    with pytest.MonkeyPatch.context() as mp:
+        for log_handler in handler.logger.handlers:
+            mp.setattr(log_handler, "handleError", raise_error)
+        yield handler
+
+
+# Unlike plain st.text(), also draw lone surrogates
+@pytest.mark.slow
+@given(msg=st.text(st.characters(exclude_categories=())))
+def test_error_handling_robustness(robust_handler, msg):
     """
     Property 11: Error Handling and Recovery
     Validates: Requirements 11.1, 11.2, 11.3
     
     Any error should be handled gracefully returning a message string.
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        handler = ErrorHandler(log_dir=Path(temp_dir))
-        
-        # Test with standard exception
-        error_msg = handler.handle_error(Exception(msg))
-        assert isinstance(error_msg, str)
-        assert len(error_msg) > 0
-        
-        # Test with custom exception
-        custom_error = DocumentProcessorError(msg)
-        error_msg = handler.handle_error(custom_error)
-        assert isinstance(error_msg, str)
-        assert len(error_msg) > 0
-        
-        # Verify log file exists and is not empty
-        log_files = list(Path(temp_dir).glob("*.log"))
-        assert len(log_files) == 1
-        assert log_files[0].stat().st_size > 0
+    handler = robust_handler
+    
+    # Test with standard exception
+    error_msg = handler.handle_error(Exception(msg))
+    assert isinstance(error_msg, str)
+    assert len(error_msg) > 0
+    
+    # Test with custom exception
+    custom_error = DocumentProcessorError(msg)
+    error_msg = handler.handle_error(custom_error)
+    assert isinstance(error_msg, str)
+    assert len(error_msg) > 0
+
+
+def test_error_log_written(tmp_path):
+    """Handled errors are written to a single non-empty log file."""
+    handler = ErrorHandler(log_dir=tmp_path)
+    handler.handle_error(Exception("x"))
+    handler.handle_error(DocumentProcessorError("y"))
+    
+    log_files = [e for e in os.scandir(tmp_path) if e.name.endswith(".log")]
+    assert len(log_files) == 1
+    assert log_files[0].stat().st_size > 0
@@ -0,0 +1,44 @@
+"""Unit tests for the JSON file helpers."""
+
+import json
+import pytest
+
+from document_processor_gui.core import json_io
+
+DATA = {"language": "zh", "name": "批处理", "files": ["a.pdf", "b.pdf"], "max_retries": 2}
+
+
+class TestJsonIO:
+    """Round-trip tests for both the orjson and the standard library paths."""
+
+    @pytest.fixture(params=[False, True], ids=["json", "orjson"])
+    def use_orjson(self, request, monkeypatch):
+        """Run each test with and without orjson."""
+        if request.param:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(json_io, "HAS_ORJSON", request.param)
+        return request.param
+
+    def test_round_trip(self, use_orjson, tmp_path):
+        file_path = tmp_path / "data.json"
+        json_io.write_json(DATA, file_path)
+
+        assert json_io.read_json(file_path) == DATA
+        # Either way the file is indented UTF-8 that the standard library reads
+        text = file_path.read_text(encoding="utf-8")
+        assert "批处理" in text
+        assert "\n  " in text
+        assert json.loads(text) == DATA
+
+    def test_accepts_str_path(self, use_orjson, tmp_path):
+        file_path = str(tmp_path / "data.json")
+        json_io.write_json(DATA, file_path)
+
+        assert json_io.read_json(file_path) == DATA
+
+    def test_malformed_raises_json_decode_error(self, use_orjson, tmp_path):
+        file_path = tmp_path / "bad.json"
+        file_path.write_text("{not json", encoding="utf-8")
+
+        with pytest.raises(json.JSONDecodeError):
+            json_io.read_json(file_path)
@@ -0,0 +1,105 @@
+import shutil
+import pytest
+import process_pdf
+
+GS_EXECUTABLE = next(
+    (path for path in map(shutil.which, ("gs", "gswin64c", "gswin32c")) if path), None
+)
+
+
+def _make_pdf(path, text):
+    import fitz
+
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), text)
+    doc.save(path)
+    doc.close()
+
+
+def _make_rgb_page(doc):
+    """Add a page with RGB text, vector fill and image."""
+    import io
+    import fitz
+    from PIL import Image
+
+    page = doc.new_page()
+    page.insert_text((72, 72), "rgb", color=(0, 0, 1))
+    page.draw_rect(fitz.Rect(72, 100, 144, 172), fill=(1, 0, 0))
+    buffer = io.BytesIO()
+    Image.new("RGB", (16, 16), (0, 128, 0)).save(buffer, "PNG")
+    page.insert_image(fitz.Rect(200, 100, 272, 172), stream=buffer.getvalue())
+    return page
+
+
+class TestCompressPdfBatch:
+    @pytest.mark.skipif(GS_EXECUTABLE is None, reason="Ghostscript not installed")
+    def test_two_file_batch(self, tmp_path):
+        fitz = pytest.importorskip("fitz")
+
+        jobs = []
+        for name in ("first", "second"):
+            input_file = tmp_path / f"{name}.pdf"
+            _make_pdf(input_file, name)
+            jobs.append((input_file, tmp_path / "out" / f"{name}.pdf"))
+
+        results = process_pdf.compress_pdf_batch(
+            jobs, GS_EXECUTABLE, process_pdf.COMPRESSION_LEVEL, 144, 1.1, 75
+        )
+
+        assert [error for _, error in results] == [None, None]
+        for (_, output_file), (size, _) in zip(jobs, results):
+            assert output_file.stat().st_size == size
+            # Each output holds its own input, not a neighbour's pages
+            doc = fitz.open(output_file)
+            assert output_file.stem in doc[0].get_text()
+            doc.close()
+
+
+class TestNeedsColorConversion:
+    def test_rgb_only(self, tmp_path):
+        fitz = pytest.importorskip("fitz")
+        doc = fitz.open()
+        _make_rgb_page(doc)
+        doc.save(tmp_path / "rgb.pdf")
+        doc.close()
+
+        assert process_pdf.needs_color_conversion(tmp_path / "rgb.pdf") is False
+
+    def test_cmyk_vector_fill(self, tmp_path):
+        fitz = pytest.importorskip("fitz")
+        doc = fitz.open()
+        page = _make_rgb_page(doc)
+        page.draw_rect(fitz.Rect(300, 100, 372, 172), fill=(0, 0, 0, 1))
+        doc.save(tmp_path / "fill.pdf")
+        doc.close()
+
+        assert process_pdf.needs_color_conversion(tmp_path / "fill.pdf") is True
+
+    def test_cmyk_text(self, tmp_path):
+        fitz = pytest.importorskip("fitz")
+        doc = fitz.open()
+        page = _make_rgb_page(doc)
+        page.insert_text((72, 300), "cmyk", color=(1, 0, 0, 0))
+        doc.save(tmp_path / "text.pdf")
+        doc.close()
+
+        assert process_pdf.needs_color_conversion(tmp_path / "text.pdf") is True
+
+    def test_cmyk_inside_form_xobject(self, tmp_path):
+        fitz = pytest.importorskip("fitz")
+        source = fitz.open()
+        source.new_page().draw_rect(fitz.Rect(10, 10, 50, 50), fill=(0, 1, 0, 0))
+        doc = fitz.open()
+        page = _make_rgb_page(doc)
+        page.show_pdf_page(fitz.Rect(300, 300, 400, 400), source, 0)
+        doc.save(tmp_path / "form.pdf")
+        doc.close()
+        source.close()
+
+        assert process_pdf.needs_color_conversion(tmp_path / "form.pdf") is True
+
+
+class TestNeedsCompression:
+    def test_missing_file(self, tmp_path):
+        pytest.importorskip("fitz")
+        assert process_pdf.needs_compression(tmp_path / "gone.pdf", 144, 1.1) is True
@@ -1,26 +1,48 @@
+import os
+import string
 import pytest
 from hypothesis import given, strategies as st
-from unittest.mock import MagicMock, call, ANY
+from unittest.mock import MagicMock, call
 from pathlib import Path
 import tempfile
 from document_processor_gui.processing.conversion_engine import ConversionEngine
 from document_processor_gui.processing.compression_engine import CompressionEngine
-from document_processor_gui.processing.models import ProcessingResult
+from document_processor_gui.processing.models import ProcessingResult, ProcessingResults
 from document_processor_gui.backend.word_converter import WordConverter
 from document_processor_gui.backend.ghostscript_wrapper import GhostscriptWrapper
 
 # Strategy for list of filenames
 # Use simple alphanumeric names to avoid OS filesystem issues during testing
-files_strategy = st.lists(st.from_regex(r"^[a-zA-Z0-9_-]+$", fullmatch=True).map(lambda x: f"{x}.docx"), min_size=1, max_size=10)
+name_strategy = st.text(alphabet=string.ascii_letters + string.digits + "_-", min_size=1, max_size=16)
+files_strategy = st.lists(name_strategy.map(lambda x: f"{x}.docx"), min_size=1, max_size=5)
 
+def _touch(path):
+    """Create an empty file without pathlib's extra utime call."""
+    os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o666))
+
+# Spec'd mocks are built once per module and reset between examples
+@pytest.fixture(scope="module")
+def word_converter_mock():
+    mock = MagicMock(spec=WordConverter)
+    mock.convert_to_pdf.return_value = True
+    return mock
+
+@pytest.fixture(scope="module")
+def gs_engine():
+    mock = MagicMock(spec=GhostscriptWrapper)
+    mock.compress_pdf.return_value = True
+    return CompressionEngine(mock), mock
+
+@pytest.mark.slow
 @given(files=files_strategy)
-def test_batch_processing_progress(files):
+def test_batch_processing_progress(word_converter_mock, files):
     """
     Property 3: Batch Processing with Progress
     Validates: Requirements 3.1, 3.2, 3.3, 9.1, 9.3
     """
-    mock_converter = MagicMock(spec=WordConverter)
-    mock_converter.convert_to_pdf.return_value = True
+    mock_converter = word_converter_mock
+    mock_converter.reset_mock()
+    mock_converter.convert_to_pdf.side_effect = None
     
     engine = ConversionEngine(mock_converter)
     progress_callback = MagicMock()
@@ -29,9 +51,9 @@ def test_batch_processing_progress(files):
         # Create dummy files
         input_files = []
         for f in files:
-            p = Path(temp_dir) / f
-            p.touch()
-            input_files.append(str(p))
+            p = os.path.join(temp_dir, f)
+            _touch(p)
+            input_files.append(p)
             
         results = engine.convert_files(
             input_files, 
@@ -46,16 +68,18 @@ def test_batch_processing_progress(files):
         
         # Check callback args
         # Last call should have current=len(files), total=len(files)
-        progress_callback.assert_called_with(len(files), len(files), ANY)
+        assert progress_callback.call_args.args[:2] == (len(files), len(files))
 
+@pytest.mark.slow
 @given(files=files_strategy)
-def test_batch_error_handling_independence(files):
+def test_batch_error_handling_independence(word_converter_mock, files):
     """
     Property 4: Batch Error Handling Independence
     Validates: Requirements 5.3, 5.5, 9.2
     """
     # Make every second file fail
-    mock_converter = MagicMock(spec=WordConverter)
+    mock_converter = word_converter_mock
+    mock_converter.reset_mock()
     
     def side_effect(inp, out, **kwargs):
         if "fail" in inp:
@@ -71,9 +95,9 @@ def test_batch_error_handling_independence(files):
         for i, f in enumerate(files):
             # Create distinct names for fail/ok
             name = f"fail_{i}.docx" if i % 2 == 0 else f"ok_{i}.docx"
-            p = Path(temp_dir) / name
-            p.touch()
-            input_files.append(str(p))
+            p = os.path.join(temp_dir, name)
+            _touch(p)
+            input_files.append(p)
             
         results = engine.convert_files(input_files, temp_dir, {})
         
@@ -83,21 +107,20 @@ def test_batch_error_handling_independence(files):
         assert results.successful_files == len(files) - expected_failures
 
 # Property 7: File Preservation and Naming
-@given(st.from_regex(r"^[a-zA-Z0-9_-]+$", fullmatch=True))
-def test_file_preservation_and_naming(filename):
+@pytest.mark.slow
+@given(filename=name_strategy)
+def test_file_preservation_and_naming(gs_engine, filename):
     """
     Property 7: File Preservation and Naming
     Validates: Requirements 6.4, 7.5
     """
-    mock_gs = MagicMock(spec=GhostscriptWrapper)
-    mock_gs.compress_pdf.return_value = True
-    
-    engine = CompressionEngine(mock_gs)
+    engine, mock_gs = gs_engine
+    mock_gs.reset_mock()
     
     with tempfile.TemporaryDirectory() as temp_dir:
         input_name = f"{filename}.pdf"
         p = Path(temp_dir) / input_name
-        p.touch()
+        _touch(p)
         
         output_dir = Path(temp_dir) / "output"
         
@@ -110,9 +133,41 @@ def test_file_preservation_and_naming(filename):
         assert p.exists()
         
         # Verify call arguments
-        mock_gs.compress_pdf.assert_called()
+        assert mock_gs.compress_pdf.call_count >= 1
         args = mock_gs.compress_pdf.call_args[0]
         # args[0] is input, args[1] is output
         assert args[0] == str(p)
         assert Path(args[1]).name == input_name
-        assert Path(args[1]).parent == output_dir
\ No newline at end of file
+        assert Path(args[1]).parent == output_dir
+
+
+# Property: running totals match the individual results
+result_strategy = st.builds(
+    ProcessingResult,
+    success=st.booleans(),
+    input_file=name_strategy.map(lambda x: f"{x}.pdf"),
+    processing_time=st.floats(min_value=0, max_value=100),
+    file_size_before=st.integers(min_value=0, max_value=10**9),
+    file_size_after=st.one_of(st.none(), st.integers(min_value=0, max_value=10**9)),
+)
+
+@given(st.lists(result_strategy, max_size=20))
+def test_processing_results_running_totals(result_list):
+    """
+    Property: ProcessingResults running totals equal a full recount
+    """
+    results = ProcessingResults()
+    for r in result_list:
+        results.add_result(r)
+    
+    succeeded = [r for r in result_list if r.success]
+    failed = [r for r in result_list if not r.success]
+    
+    assert results.successful_files == len(succeeded)
+    assert results.failed_files == len(failed)
+    assert results.total_size_before == sum(r.file_size_before for r in succeeded)
+    assert results.total_size_after == sum(r.file_size_after or 0 for r in succeeded)
+    assert results.reduction_percent_count == len(
+        [r for r in succeeded if r.file_size_before and r.file_size_after]
+    )
+    assert [d['file'] for d in results.failed_file_details] == [r.input_file for r in failed]